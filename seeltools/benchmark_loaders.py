@@ -0,0 +1,119 @@
+import argparse
+import sys
+
+from lxml import etree
+
+from server import server_init
+from server.affix import AffixManager
+from server.application import Application
+from server.relationship import Relationship
+from server.resource_manager import ResourceManager
+from server.wnd_station import WndStation
+from utilities.engine_config import theEngineConfig
+from utilities.global_properties import GlobalProperties
+from utilities.log import logger
+from utilities.parse import theXmlTreeCache, set_xml_backend, xml_to_etree, loaded_source_files, ENCODING
+from utilities.parse import _parse_etree
+from utilities.constants import XML_BACKEND
+
+from gameobjects.prototype_manager import PrototypeManager
+
+from benchmark_prototypes import benchmark
+
+
+def get_subsystem_loaders(server):
+    '''Loaders of every subsystem reading game xml, as called by Server.InitOnce and Server.Load'''
+    def load_global_properties():
+        file_name = server.engine_config.global_properties
+        GlobalProperties().LoadFromXML(file_name, xml_to_etree(file_name))
+
+    def load_strings():
+        wnd_station = WndStation()
+        wnd_station.LoadStrings(theEngineConfig.ui_edit_strings)
+        wnd_station.LoadStrings(theEngineConfig.affixes_strings)
+
+    def load_prototypes():
+        prototype_manager = PrototypeManager(server, lazy=True)
+        prototype_manager.LoadFromXMLFile(server.theGlobalProperties.pathToGameObjects, parallel=False,
+                                          prescan_models=False, streaming=False)
+
+    return {"GlobalProperties": load_global_properties,
+            "ResourceManager": lambda: ResourceManager(server, 0, 0),
+            "AffixManager": lambda: AffixManager(server.theResourceManager).LoadFromXML(
+                server.theGlobalProperties.pathToAffixes),
+            "Application": lambda: Application().LoadServers("data/models/commonservers.xml"),
+            "Relationship": lambda: Relationship().LoadFromXML(server.theGlobalProperties.pathToRelationship),
+            "WndStation strings": load_strings,
+            "PrototypeManager": load_prototypes}
+
+
+def benchmark_backend(loader, backend, repeat):
+    def load(_):
+        # trees parsed before would be taken from cache instead of being parsed again
+        theXmlTreeCache.clear()
+        loader()
+
+    set_xml_backend(backend)
+    return benchmark(load, [None], repeat)
+
+
+def parse_text_mode(full_path: str):
+    '''Reference parse of xml file decoded by Python first, as files were read before binary mode ingestion'''
+    with open(full_path, 'r', encoding=ENCODING) as f:
+        parser_recovery = etree.XMLParser(recover=True, encoding=ENCODING, remove_blank_text=True, collect_ids=False)
+        return etree.parse(f, parser_recovery).getroot()
+
+
+def benchmark_binary_parsing(repeat):
+    '''Trees parsed from raw bytes should be the same as parsed from decoded text, malformed files included'''
+    file_names = sorted(path for path in loaded_source_files if path.lower().endswith(".xml"))
+    mismatches = []
+    for file_name in file_names:
+        try:
+            expected = parse_text_mode(file_name)
+        except (UnicodeDecodeError, etree.XMLSyntaxError):
+            # files text mode can't read at all are not compared
+            continue
+        result = _parse_etree(file_name)
+        if etree.tostring(expected.getroottree()) != etree.tostring(result.getroottree()) \
+                or expected.base != result.base:
+            mismatches.append(file_name)
+    if mismatches:
+        logger.error(f"Binary mode parsing differs for {len(mismatches)} files: {mismatches[:10]}")
+
+    text_time = benchmark(parse_text_mode, file_names, repeat)
+    binary_time = benchmark(_parse_etree, file_names, repeat)
+    logger.info(f"Parsing of {len(file_names)} files, best of {repeat}: text mode {text_time:.3f}s, "
+                f"binary mode {binary_time:.3f}s, speedup x{text_time / binary_time:.2f}")
+    return not mismatches
+
+
+def main(options):
+    server = server_init.theServer
+    total_times = {"objectify": 0, "etree": 0}
+    try:
+        for name, loader in get_subsystem_loaders(server).items():
+            objectify_time = benchmark_backend(loader, "objectify", options.repeat)
+            etree_time = benchmark_backend(loader, "etree", options.repeat)
+            total_times["objectify"] += objectify_time
+            total_times["etree"] += etree_time
+            logger.info(f"{name}, best of {options.repeat}: objectify {objectify_time:.3f}s, "
+                        f"etree {etree_time:.3f}s, speedup x{objectify_time / etree_time:.2f}")
+    finally:
+        set_xml_backend(XML_BACKEND)
+    logger.info(f"All loaders: objectify {total_times['objectify']:.3f}s, etree {total_times['etree']:.3f}s, "
+                f"speedup x{total_times['objectify'] / total_times['etree']:.2f}")
+    if not benchmark_binary_parsing(options.repeat):
+        return 1
+    return 0
+
+
+def _init_input_parser():
+    parser = argparse.ArgumentParser(description=u'benchmark xml loaders of subsystems')
+    parser.add_argument('-repeat', help=u'times to repeat every measurement', type=int, default=5)
+
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(main(_init_input_parser().parse_args()))
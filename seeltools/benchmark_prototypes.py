@@ -0,0 +1,119 @@
+import argparse
+import sys
+from math import ceil, log10
+from timeit import default_timer as timer
+
+from lxml import etree
+
+from server import server_init
+from utilities.log import logger
+from utilities.parse import theXmlTreeCache
+from utilities.value_classes import AnnotatedValue, SavingType
+from utilities.helper_functions import add_value_to_node
+
+from gameobjects.prototype_info import PrototypeInfo
+from gameobjects.prototype_manager import PrototypeManager
+
+
+def get_etree_prototype_reflective(prototype_info):
+    '''Reference implementation of PrototypeInfo.get_etree_prototype walking all attributes of prototype'''
+    result = etree.Element("Prototype")
+    for attrib in vars(prototype_info).values():
+        if isinstance(attrib, AnnotatedValue):
+            if attrib.saving_type == SavingType.COMMON or attrib.saving_type == SavingType.REQUIRED:
+                if type(attrib.value) is float and attrib.value < 1:
+                    precision = int(ceil(abs(log10(abs(attrib.value))))) if attrib.value != 0 else 1
+                    add_value_to_node(result, attrib, lambda x: f'{x.value:.{precision}f}')
+                else:
+                    add_value_to_node(result, attrib, lambda x: str(x.value))
+            elif attrib.saving_type == SavingType.RESOURCE:
+                add_value_to_node(result, attrib,
+                                  lambda x: prototype_info.theServer.theResourceManager.GetResourceName(x.value))
+    return result
+
+
+def benchmark(function, prototypes, repeat):
+    best = None
+    for _ in range(repeat):
+        start = timer()
+        for prototype in prototypes:
+            function(prototype)
+        spent_time = timer() - start
+        best = spent_time if best is None else min(best, spent_time)
+    return best
+
+
+def benchmark_serialization(prototypes, repeat):
+    mismatches = [prototype.prototypeName.value for prototype in prototypes
+                  if etree.tostring(get_etree_prototype_reflective(prototype))
+                  != etree.tostring(PrototypeInfo.get_etree_prototype(prototype))]
+    if mismatches:
+        logger.error(f"Serialization plan output differs for {len(mismatches)} prototypes: {mismatches[:10]}")
+
+    reflective_time = benchmark(get_etree_prototype_reflective, prototypes, repeat)
+    plan_time = benchmark(PrototypeInfo.get_etree_prototype, prototypes, repeat)
+    full_time = benchmark(lambda prototype: prototype.get_etree_prototype(), prototypes, repeat)
+    logger.info(f"Common fields of {len(prototypes)} prototypes, best of {repeat}: "
+                f"reflective walk {reflective_time:.3f}s, serialization plan {plan_time:.3f}s, "
+                f"speedup x{reflective_time / plan_time:.2f}")
+    logger.info(f"Full get_etree_prototype of {len(prototypes)} prototypes: {full_time:.3f}s")
+    return not mismatches
+
+
+def benchmark_loading(server, repeat):
+    '''LoadFromXML throughput, prototypes are rebuilt from nodes kept by lazy load of gameobjects'''
+    prototype_manager = PrototypeManager(server, lazy=True)
+    prototype_manager.LoadFromXMLFile(server.theGlobalProperties.pathToGameObjects)
+    # materialized headers drop their nodes, so nodes are collected before anything is built
+    headers = [(header, header.xmlNode) for header in prototype_manager.IterPrototypeHeaders()]
+
+    def build_prototype(header_with_node):
+        header, xml_node = header_with_node
+        prototype_manager.BuildPrototypeInfo(header.directory, xml_node, header.className, header.prototypeId)
+
+    loading_time = benchmark(build_prototype, headers, repeat)
+    logger.info(f"Loading of {len(headers)} prototypes, best of {repeat}: {loading_time:.3f}s, "
+                f"{len(headers) / loading_time:.0f} prototypes/s")
+
+
+def benchmark_parsing(server, repeat):
+    '''Parse throughput of gameobjects, lazy load only reads headers so parsing of files dominates'''
+    def lazy_load(mode):
+        streaming, parallel = mode
+        # trees parsed before would be taken from cache instead of being parsed again
+        theXmlTreeCache.clear()
+        prototype_manager = PrototypeManager(server, lazy=True)
+        prototype_manager.LoadFromXMLFile(server.theGlobalProperties.pathToGameObjects, parallel=parallel,
+                                          prescan_models=False, streaming=streaming)
+        return prototype_manager
+
+    prototype_count = len(lazy_load((True, False)).prototypeHeaders)
+    tree_time = benchmark(lazy_load, [(False, False)], repeat)
+    parallel_tree_time = benchmark(lazy_load, [(False, True)], repeat)
+    streaming_time = benchmark(lazy_load, [(True, False)], repeat)
+    logger.info(f"Parsing of {prototype_count} prototypes, best of {repeat}: "
+                f"whole trees {tree_time:.3f}s, whole trees in parallel {parallel_tree_time:.3f}s, "
+                f"iterparse stream {streaming_time:.3f}s, "
+                f"parallel speedup x{tree_time / parallel_tree_time:.2f}, "
+                f"stream speedup x{tree_time / streaming_time:.2f}")
+
+
+def main(options):
+    server = server_init.theServer
+    prototypes = list(server.thePrototypeManager.prototypes)
+    if not benchmark_serialization(prototypes, options.repeat):
+        return 1
+    benchmark_loading(server, options.repeat)
+    benchmark_parsing(server, options.repeat)
+    return 0
+
+
+def _init_input_parser():
+    parser = argparse.ArgumentParser(description=u'benchmark prototypes')
+    parser.add_argument('-repeat', help=u'times to repeat every measurement', type=int, default=5)
+
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(main(_init_input_parser().parse_args()))
@@ -0,0 +1,128 @@
+import os
+import pickle
+import sys
+import tempfile
+from types import BuiltinFunctionType, FunctionType, ModuleType
+
+from server import server_init
+from server.affix import AffixManager
+from server.wnd_station import theWndStation
+from server.server_snapshot import save_server_snapshot, load_server_snapshot
+from utilities.log import logger
+
+PRIMITIVE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+# classes and functions are pickled by reference, so restored ones are the same objects
+REFERENCE_TYPES = (type, FunctionType, BuiltinFunctionType, ModuleType)
+
+
+def find_differences(original, restored, limit: int = 10):
+    '''Paths of values which differ between object graph and its copy restored by pickle.
+    Objects are compared by the state they are pickled with, shared and cyclic references are walked once'''
+    differences = []
+    visited = {}  # {(id, id): (original, restored)}, pairs are kept alive so their ids can't be reused
+    pending = [("", original, restored)]
+    while pending and len(differences) < limit:
+        path, value, restored_value = pending.pop()
+        if type(value) is not type(restored_value):
+            differences.append(f"{path}: {type(value).__name__} restored as {type(restored_value).__name__}")
+        elif isinstance(value, PRIMITIVE_TYPES):
+            # nan is the only value not equal to itself
+            if value != restored_value and value == value:
+                differences.append(f"{path}: {value!r} restored as {restored_value!r}")
+        elif isinstance(value, REFERENCE_TYPES):
+            if value is not restored_value:
+                differences.append(f"{path}: {value!r} restored as {restored_value!r}")
+        elif (id(value), id(restored_value)) not in visited:
+            visited[(id(value), id(restored_value))] = (value, restored_value)
+            if isinstance(value, (set, frozenset)):
+                if value != restored_value:
+                    differences.append(f"{path}: {len(value ^ restored_value)} items differ")
+            elif isinstance(value, dict):
+                if value.keys() != restored_value.keys():
+                    differences.append(f"{path}: keys {list(value.keys() ^ restored_value.keys())[:5]} differ")
+                else:
+                    pending.extend((f"{path}[{key!r}]", item, restored_value[key]) for key, item in value.items())
+            elif isinstance(value, (list, tuple)):
+                if len(value) != len(restored_value):
+                    differences.append(f"{path}: {len(value)} items restored as {len(restored_value)}")
+                else:
+                    pending.extend((f"{path}[{index}]", item, restored_item)
+                                   for index, (item, restored_item) in enumerate(zip(value, restored_value)))
+            elif isinstance(value, pickle.PickleBuffer):
+                # out-of-band data of numpy arrays
+                if value.raw() != restored_value.raw():
+                    differences.append(f"{path}: buffer data differs")
+            else:
+                reduced = value.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+                restored_reduced = restored_value.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+                if isinstance(reduced, str):
+                    # singletons are pickled as names of globals
+                    if value is not restored_value:
+                        differences.append(f"{path}: global {reduced} restored as another object")
+                    continue
+                function, args, state, *items = reduced + (None,) * (5 - len(reduced))
+                restored_function, restored_args, restored_state, *restored_items = \
+                    restored_reduced + (None,) * (5 - len(restored_reduced))
+                pending.append((f"{path}<{type(value).__name__}>", (function, args),
+                                (restored_function, restored_args)))
+                pending.append((f"{path}<items>", [list(item or ()) for item in items],
+                                [list(item or ()) for item in restored_items]))
+                # objects with __slots__ are pickled with (__dict__, slots) state
+                if isinstance(state, tuple) and len(state) == 2 and isinstance(restored_state, tuple):
+                    state = {**(state[0] or {}), **(state[1] or {})}
+                    restored_state = {**(restored_state[0] or {}), **(restored_state[1] or {})}
+                if isinstance(state, dict) and isinstance(restored_state, dict):
+                    if state.keys() != restored_state.keys():
+                        differing_names = list(state.keys() ^ restored_state.keys())[:5]
+                        differences.append(f"{path}: attributes {differing_names} differ")
+                    else:
+                        pending.extend((f"{path}.{name}", item, restored_state[name]) for name, item in state.items())
+                else:
+                    pending.append((f"{path}<state>", state, restored_state))
+    return differences
+
+
+def report_differences(name: str, differences):
+    for difference in differences:
+        logger.error(f"{name} differs after pickle round-trip at {difference}")
+    if not differences:
+        logger.info(f"{name} is restored from pickle unchanged")
+    return not differences
+
+
+def check_pickle_round_trip(name: str, obj):
+    try:
+        restored = pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        logger.error(f"{name} can't be pickled: {error}")
+        return False
+    return report_differences(name, find_differences(obj, restored))
+
+
+def check_server_snapshot(server):
+    '''Saves Server to snapshot in temporary folder and compares Server loaded back from it with original'''
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "server_snapshot.pickle")
+        if not save_server_snapshot(server, theWndStation.strings, path):
+            logger.error("Server snapshot can't be saved")
+            return False
+        snapshot = load_server_snapshot(path)
+    if snapshot is None:
+        logger.error("Server snapshot which was just saved can't be loaded")
+        return False
+    restored_server, strings = snapshot
+    return (report_differences("Server", find_differences(server, restored_server))
+            and report_differences("Strings", find_differences(theWndStation.strings, strings)))
+
+
+def main():
+    server = server_init.theServer
+    theWndStation.EnsureCreated()
+    checks = [check_pickle_round_trip("Empty AffixManager", AffixManager(None)),
+              check_pickle_round_trip("AffixManager", server.theAffixManager),
+              check_server_snapshot(server)]
+    return 0 if all(checks) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
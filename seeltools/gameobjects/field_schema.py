@@ -0,0 +1,147 @@
+from types import MethodType
+from collections import namedtuple
+
+from utilities.log import logger
+from utilities.parse import parse_str_to_bool, read_from_xml_node
+from utilities.value_classes import get_load_record
+from utilities.constants import STATUS_SUCCESS, COUNT_XML_HELPERS
+
+# what loader does with field which attribute is missing in xml
+MISSING_KEEP = 0  # value is left as is
+MISSING_DEFAULT = 1  # default_value is assigned, as safe_check_and_set and parse_str_to_bool do
+MISSING_NONE = 2  # None is assigned, as plain assignment of read_from_xml_node does
+
+FieldSpec = namedtuple("FieldSpec", ["attribute", "field_type", "warn_if_missing", "missing", "validator", "xml_name"],
+                       defaults=(str, False, MISSING_KEEP, None, None))
+FieldSpec.__doc__ = ''' Declaration of AnnotatedValue field loaded from attribute of Prototype node.
+Field type is str, bool or function converting string of attribute, as float, int or unit conversions do.
+Xml name is taken from AnnotatedValue if not given, validator gets converted value and field is only
+assigned if validator returns True'''
+
+
+def is_positive(value):
+    return value > 0
+
+
+def is_non_negative(value):
+    return value >= 0
+
+
+def warn_missing_attrib(xml_node, attrib_name: str):
+    logger.warning(f"There is no attrib with the name: {attrib_name} "
+                   f"in a tag {xml_node.tag} of {xml_node.base}")
+
+
+class SchemaLoader(object):
+    ''' LoadFromXML for classes declaring FIELDS. LoadFromXML of the closest hand-written base is called first,
+    then before hooks, then schema fields of the class and all its bases up to that one are loaded in a single pass,
+    then after hooks. Hooks are hand-written parts of loaders, hooks of bases are called ahead of ones of the class.
+    Before hook returns STATUS_SUCCESS for loading to go on, after hooks load what schema can't describe:
+    child nodes, fields depending on each other and checks of loaded values.
+    Loaders are compiled per class on first use, as xml names are taken from AnnotatedValues of the instance.
+    '''
+    def __init__(self, before=None, after=None):
+        self.before = before
+        self.after = after
+        self.owner = None
+        self.loaders = {}  # {PrototypeInfo subclass: (hand-written loader, before hooks, fields loader, after hooks)}
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.load_from_xml
+        return MethodType(self.load_from_xml, instance)
+
+    def load_from_xml(self, prototype_info, xmlFile, xmlNode):
+        loader = self.loaders.get(type(prototype_info))
+        if loader is None:
+            loader = self.loaders[type(prototype_info)] = self.compile(prototype_info)
+        base_load_from_xml, before_hooks, load_fields, after_hooks = loader
+        if base_load_from_xml is not None and base_load_from_xml(prototype_info, xmlFile, xmlNode) != STATUS_SUCCESS:
+            return None
+        for hook in before_hooks:
+            if hook(prototype_info, xmlFile, xmlNode) != STATUS_SUCCESS:
+                return None
+        load_fields(prototype_info, xmlNode.attrib, xmlNode)
+        for hook in after_hooks:
+            hook(prototype_info, xmlFile, xmlNode)
+        return STATUS_SUCCESS
+
+    def compile(self, prototype_info):
+        fields = []
+        before_hooks = []
+        after_hooks = []
+        base_load_from_xml = None
+        for mro_class in self.owner.__mro__:
+            class_load_from_xml = mro_class.__dict__.get("LoadFromXML")
+            if class_load_from_xml is not None and not isinstance(class_load_from_xml, SchemaLoader):
+                base_load_from_xml = class_load_from_xml
+                break
+            fields[:0] = mro_class.__dict__.get("FIELDS", ())
+            if class_load_from_xml is not None:
+                if class_load_from_xml.before is not None:
+                    before_hooks.insert(0, class_load_from_xml.before)
+                if class_load_from_xml.after is not None:
+                    after_hooks.insert(0, class_load_from_xml.after)
+        xml_names = [field.xml_name or getattr(prototype_info, field.attribute).name for field in fields]
+        load_fields = compile_field_loader(fields, xml_names, type(prototype_info).__name__, COUNT_XML_HELPERS)
+        return base_load_from_xml, before_hooks, load_fields, after_hooks
+
+
+def compile_field_loader(fields, xml_names, class_name: str = "", counted: bool = False):
+    ''' Generates function loading all fields from attributes of xml node,
+    every field is read with one dict lookup and converted inline. Reads are reported to LoadRecord
+    of prototype being loaded, as xml helpers do.
+    When xml helpers are counted, attributes are read with read_from_xml_node instead, so schema fields
+    are counted as reads of hand-written loaders are, function is named after class for report of callers'''
+    namespace = {"__name__": __name__,
+                 "parse_str_to_bool": parse_str_to_bool,
+                 "read_from_xml_node": read_from_xml_node,
+                 "warn_missing_attrib": warn_missing_attrib,
+                 "get_load_record": get_load_record,
+                 "validators": [field.validator for field in fields]}
+    function_name = f"load_{class_name}_fields" if class_name.isidentifier() else "load_fields"
+    lines = [f"def {function_name}(prototype_info, attribs, xmlNode):",
+             "    load_record = get_load_record()"]
+    for index, (field, xml_name) in enumerate(zip(fields, xml_names)):
+        if not field.attribute.isidentifier():
+            raise ValueError(f"Invalid attribute name in field schema: {field.attribute}")
+        lines.append(f"    field = prototype_info.{field.attribute}")
+        if counted:
+            # helper reports read to LoadRecord itself
+            lines.append(f"    value = read_from_xml_node(xmlNode, {xml_name!r}, True)")
+            lines.append("    if value is not None:")
+        else:
+            lines.append(f"    value = attribs.get({xml_name!r})")
+            lines.append("    if value is not None:")
+            lines.append("        if load_record is not None:")
+            lines.append("            load_record.xml_read(True)")
+        if field.field_type is bool:
+            lines.append("        value = parse_str_to_bool(field.default_value, value)")
+        elif field.field_type is not str:
+            namespace[f"convert_{index}"] = field.field_type
+            lines.append(f"        value = convert_{index}(value)")
+        if field.validator is not None:
+            lines.append(f"        if validators[{index}](value):")
+            lines.append("            field.value = value")
+        else:
+            lines.append("        field.value = value")
+        if field.warn_if_missing or field.missing != MISSING_KEEP or counted:
+            lines.append("    else:")
+            if field.warn_if_missing:
+                lines.append(f"        warn_missing_attrib(xmlNode, {xml_name!r})")
+            if counted and field.missing == MISSING_KEEP:
+                # miss reported by helper isn't followed by assignment, so it must not mark the next one as reset
+                lines.append("        if load_record is not None:")
+                lines.append("            load_record.xml_read(None)")
+            elif field.missing != MISSING_KEEP and not counted:
+                lines.append("        if load_record is not None:")
+                lines.append("            load_record.xml_read(False)")
+            if field.missing == MISSING_DEFAULT:
+                lines.append("        field.value = field.default_value")
+            elif field.missing == MISSING_NONE:
+                lines.append("        field.value = None")
+    exec(compile("\n".join(lines), "<field_schema>", "exec"), namespace)
+    return namespace[function_name]
@@ -6,7 +6,7 @@ from utilities.log import logger
 
 from utilities.id_manager import theIdManager
 
-from utilities.parse import safe_check_and_set, parse_str_to_bool, read_from_xml_node, child_from_xml_node
+from utilities.parse import safe_check_and_set, parse_str_to_bool, read_from_xml_node, children_from_xml_node
 from utilities.constants import (STATUS_SUCCESS, ZERO_VECTOR, INITIAL_OBJECTS_DIRECTION, BuildingType,
                                  IDENTITY_QUATERNION)
 from utilities.global_functions import MassSetBoxTotal
@@ -1387,12 +1387,9 @@ class Article(object):
             logger.error(f"Invalid prototype id: {self.prototypeId}")
 
     def LoadArticlesFromNode(article_list, xmlFile, xmlNode, thePrototypeManager):
-        articles = []
-        articles = child_from_xml_node(xmlNode, "Article", do_not_warn=True)
-        if articles is not None:
-            for article_node in articles:
-                article = Article(xmlFile, article_node, thePrototypeManager)
-                article_list.append(article)
+        for article_node in children_from_xml_node(xmlNode, "Article", do_not_warn=True):
+            article = Article(xmlFile, article_node, thePrototypeManager)
+            article_list.append(article)
 
     def PostLoad(self, prototype_manager):
         if self.prototypeName:
@@ -1,14 +1,13 @@
 from math import pi, sqrt
 from copy import deepcopy
-from lxml import objectify, etree
+from lxml import etree
 from enum import Enum
-from math import ceil, log10
 
 from utilities.log import logger
 
-from utilities.parse import (read_from_xml_node, child_from_xml_node, check_mono_xml_node, safe_check_and_set,
-                             parse_str_to_bool, parse_str_to_quaternion, parse_str_to_vector,
-                             parse_model_group_health)
+from utilities.parse import (read_from_xml_node, child_from_xml_node, children_from_xml_node, check_mono_xml_node,
+                             safe_check_and_set, parse_str_to_bool, parse_str_to_quaternion, parse_str_to_vector)
+from utilities.model_metadata import theModelMetadataStore
 
 from utilities.constants import (STATUS_SUCCESS, DEFAULT_TURNING_SPEED, FiringTypesStruct, DamageTypeStruct,
                                  DESTROY_EFFECT_NAMES, TEAM_DEFAULT_FORMATION_PROTOTYPE, GEOM_TYPE,
@@ -16,15 +15,77 @@ from utilities.constants import (STATUS_SUCCESS, DEFAULT_TURNING_SPEED, FiringTy
 
 from utilities.global_functions import GetActionByName, GetActionByNum  # , AIParam
 
-from utilities.value_classes import AnnotatedValue, DisplayType, GroupType, SavingType
+from utilities.value_classes import AnnotatedValue, DisplayType, GroupType, SavingType, LoadRecord, is_immutable
 from utilities.helper_functions import (vector_short_to_string, vector_to_string, vector_long_to_string,
-                                        add_value_to_node, add_value_to_node_as_child, should_be_saved)
+                                        add_value_to_node, add_value_to_node_as_child, should_be_saved,
+                                        format_common_value)
 
 from gameobjects.object_classes import *
+from gameobjects.field_schema import (FieldSpec, SchemaLoader, MISSING_DEFAULT, MISSING_NONE, is_positive,
+                                      is_non_negative)
+
+# {(PrototypeInfo subclass, attribute names of instance): serialization plan}
+serialization_plans = {}
+
+# fields identifying prototype itself, child never takes them from parent
+NOT_INHERITED_FIELDS = frozenset(("Class", "Name", "ParentPrototype", "Abstract"))
+
+
+def _format_common(prototype_info, value):
+    return format_common_value(value)
+
+
+def _format_resource(prototype_info, value):
+    return prototype_info.theServer.theResourceManager.GetResourceName(value)
+
+
+def _kmh_to_ms(value: str):
+    return float(value) * 0.27777779  # ~5/18 or 50/180
+
+
+def _degrees_to_radians(value: str):
+    return float(value) * pi / 180  # 0.017453292
+
+
+def _grouping_angle_to_radians(value: str):
+    # half of grouping angle is kept
+    return (float(value) * 0.017453292) * 0.5
+
+
+def _turning_speed_to_radians(value: str):
+    # pi / 180 is taken first, as it is when turning speed is saved
+    return float(value) * (pi / 180)
+
+
+def get_serialization_plan(prototype_info):
+    ''' Fields saved by PrototypeInfo.get_etree_prototype as (attribute name, xml name, formatter, is required),
+    compiled once per class and layout of attributes. Instances which set attributes of their own after __init__
+    get a plan of their own layout, so no AnnotatedValue is left out'''
+    prot_attribs = vars(prototype_info)
+    plan_key = (type(prototype_info), tuple(prot_attribs))
+    plan = serialization_plans.get(plan_key)
+    if plan is None:
+        plan = []
+        for attrib_name, attrib in prot_attribs.items():
+            if isinstance(attrib, AnnotatedValue):
+                if attrib.saving_type == SavingType.COMMON or attrib.saving_type == SavingType.REQUIRED:
+                    plan.append((attrib_name, attrib.name, _format_common,
+                                 attrib.saving_type == SavingType.REQUIRED))
+                elif attrib.saving_type == SavingType.RESOURCE:
+                    plan.append((attrib_name, attrib.name, _format_resource, False))
+        plan = serialization_plans[plan_key] = tuple(plan)
+    return plan
 
 
 class PrototypeInfo(object):
     '''Base Prototype information class'''
+    FIELDS = (FieldSpec("isUpdating", bool, missing=MISSING_DEFAULT),
+              FieldSpec("visibleInEncyclopedia", bool, missing=MISSING_DEFAULT),
+              FieldSpec("applyAffixes", bool, missing=MISSING_DEFAULT),
+              FieldSpec("price", int),
+              FieldSpec("isAbstract", bool, missing=MISSING_DEFAULT),
+              FieldSpec("parentPrototypeName", missing=MISSING_NONE))
+
     def __init__(self, server):
         self.theServer = server
         self.className = AnnotatedValue("", "Class", group_type=GroupType.GENERAL,
@@ -41,18 +102,38 @@ class PrototypeInfo(object):
         self.parentPrototypeName = AnnotatedValue("", "ParentPrototype", group_type=GroupType.GENERAL,
                                                   display_type=DisplayType.PROTOTYPE_NAME)
         self.parentPrototypeId = -1
+        self.parent = None
         self.protoClassObject = 0
         # custom logic
         self.lookupModelFile = False
+        self.isDirty = False  # changes not tracked by AnnotatedValues, ex: nested objects edited in place
+
+    def IsDirty(self):
+        ''' Prototype was changed since it was loaded or saved last time. Changes of parents count too,
+        as fields are saved when they differ from parent'''
+        if self.isDirty:
+            return True
+        for attrib in vars(self).values():
+            if isinstance(attrib, AnnotatedValue) and (attrib.is_dirty or attrib.is_base_dirty):
+                return True
+        return False
+
+    def MarkDirty(self):
+        self.isDirty = True
+
+    def MarkClean(self):
+        self.isDirty = False
+        for attrib in vars(self).values():
+            if isinstance(attrib, AnnotatedValue):
+                attrib.mark_clean()
 
-    def LoadFromXML(self, xmlFile, xmlNode):
+    def LoadIdentityFromXML(self, xmlFile, xmlNode):
+        '''Hand-written part of LoadFromXML, the rest of PrototypeInfo fields are loaded by schema'''
         if xmlNode.tag == "Prototype":
             self.prototypeName.value = read_from_xml_node(xmlNode, "Name")
             self.className.value = read_from_xml_node(xmlNode, "Class")
             self.protoClassObject = globals()[self.className.value]  # getting class object by name
             strResType = read_from_xml_node(xmlNode, "ResourceType", do_not_warn=True)
-            self.isUpdating.value = parse_str_to_bool(self.isUpdating.default_value,
-                                                      read_from_xml_node(xmlNode, "IsUpdating", do_not_warn=True))
             if strResType is not None:
                 self.resourceId.value = self.theServer.theResourceManager.GetResourceId(strResType)
             if strResType is not None and self.resourceId.value == -1:
@@ -61,60 +142,84 @@ class PrototypeInfo(object):
                 elif self.parent.resourceId == -1:
                     logger.info(f"Invalid ResourceType: {strResType} for prototype {self.prototypeName.value} "
                                 f" and its parent {self.parent.prototypeName.value}")
-
-            self.visibleInEncyclopedia.value = parse_str_to_bool(self.visibleInEncyclopedia.default_value,
-                                                                 read_from_xml_node(xmlNode,
-                                                                                    "VisibleInEncyclopedia",
-                                                                                    do_not_warn=True))
-            self.applyAffixes.value = parse_str_to_bool(self.applyAffixes.default_value,
-                                                        read_from_xml_node(xmlNode, "ApplyAffixes", do_not_warn=True))
-            price = read_from_xml_node(xmlNode, "Price", do_not_warn=True)
-            if price is not None:
-                self.price.value = int(price)
-            self.isAbstract.value = parse_str_to_bool(self.isAbstract.default_value,
-                                                      read_from_xml_node(xmlNode, "Abstract", do_not_warn=True))
-            self.parentPrototypeName.value = read_from_xml_node(xmlNode, "ParentPrototype", do_not_warn=True)
             return STATUS_SUCCESS
         else:
             logger.warning(f"XML Node with unexpected tag {xmlNode.tag} given for PrototypeInfo loading")
 
+    LoadFromXML = SchemaLoader(before=LoadIdentityFromXML)
+
     def CopyFrom(self, prot_to_copy_from):
         if self.className.value == prot_to_copy_from.className.value:
+            self.InheritFrom(prot_to_copy_from)
             self.InternalCopyFrom(prot_to_copy_from)
         else:
             logger.error(f"Unexpected parent prototype class for {self.prototypeName.value}: "
                          f"expected {self.className.value}, got {prot_to_copy_from.className.value}")
 
     def InternalCopyFrom(self, prot_to_copy_from):
-        logger.error(f"CopyFrom is not implemented for PrototypeInfo {self.prototypeName.value}"
-                     f" of class {self.className.value}")
+        self.parent = prot_to_copy_from
+
+    def InheritFrom(self, prot_to_copy_from):
+        ''' Fields with immutable values are not copied, they are read through the same fields of parent
+        until overridden. Mutable ones are not inherited, as edits in place can't be tracked per field:
+        child keeps its own value loaded from its node, loaders needing values of parent read them from self.parent'''
+        parent_attribs = vars(prot_to_copy_from)
+        for attrib_name, attrib in vars(self).items():
+            if isinstance(attrib, AnnotatedValue) and attrib.name not in NOT_INHERITED_FIELDS:
+                parent_attrib = parent_attribs.get(attrib_name)
+                if isinstance(parent_attrib, AnnotatedValue) and is_immutable(parent_attrib.value):
+                    attrib.inherit_from(parent_attrib)
+
+    def DropDefaultOverrides(self, load_record: LoadRecord):
+        ''' Loaders reset fields missing in xml to defaults, such fields of child are inherited from parent
+        again, as they are in game. Fields reset by loader are taken from record of the load'''
+        for attrib in vars(self).values():
+            if (isinstance(attrib, AnnotatedValue) and attrib.inherited_from is not None
+                    and not attrib.is_inherited and load_record.is_reset(attrib)):
+                value = attrib.value
+                if value is None or value == attrib.default_value or value == attrib.inherited_from.value:
+                    attrib.inherit()
+
+    def GetValueOrigin(self, attrib_name: str):
+        '''Prototype the effective value of field comes from, following chain of parents'''
+        prototype_info = self
+        while getattr(prototype_info, attrib_name).is_inherited:
+            prototype_info = prototype_info.parent
+        return prototype_info
+
+    def GetEffectiveValues(self):
+        '''{xml name: (effective value, name of prototype it comes from)} for all fields'''
+        effective_values = {}
+        for attrib_name, attrib in vars(self).items():
+            if isinstance(attrib, AnnotatedValue):
+                origin = self.GetValueOrigin(attrib_name)
+                effective_values[attrib.name] = (attrib.value, origin.prototypeName.value)
+        return effective_values
 
     def PostLoad(self, prototype_manager):
         if self.parentPrototypeName.value:
-            self.parentPrototypeId.value = prototype_manager.GetPrototypeId(self.parentPrototypeName.value)
-            if self.parentPrototypeId.value == -1:
+            self.parentPrototypeId = prototype_manager.GetPrototypeId(self.parentPrototypeName.value)
+            if self.parentPrototypeId == -1:
                 logger.error(f"Invalid parent prototype: '{self.parentPrototypeName.value}' "
                              f"for prototype: '{self.prototypeName.value}'")
 
     def get_etree_prototype(self):
         result = etree.Element("Prototype")
-
         prot_attribs = vars(self)
-        for attrib in prot_attribs.values():
-            if isinstance(attrib, AnnotatedValue):
-                if attrib.saving_type == SavingType.COMMON or attrib.saving_type == SavingType.REQUIRED:
-                    if type(attrib.value) == float and attrib.value < 1:
-                        precision = int(ceil(abs(log10(abs(attrib.value))))) if attrib.value != 0 else 1
-                        add_value_to_node(result, attrib, lambda x: f'{x.value:.{precision}f}')
-                    else:
-                        add_value_to_node(result, attrib, lambda x: str(x.value))
-                elif attrib.saving_type == SavingType.RESOURCE:
-                    add_value_to_node(result, attrib,
-                                      lambda x: self.theServer.theResourceManager.GetResourceName(x.value))
+        # same rules as should_be_saved, inlined as this runs for every field of every prototype
+        for attrib_name, name, format_value, is_required in get_serialization_plan(self):
+            attrib = prot_attribs[attrib_name]
+            value = attrib.value
+            if is_required or (value != attrib.base_value and value != '' and value is not None):
+                result.set(name, format_value(self, value))
         return result
 
 
 class PhysicBodyPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("engineModelName"),
+              FieldSpec("massValue", float),
+              FieldSpec("collisionTrimeshAllowed", bool, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.engineModelName = AnnotatedValue("", "ModelFile", group_type=GroupType.VISUAL)
@@ -123,22 +228,13 @@ class PhysicBodyPrototypeInfo(PrototypeInfo):
         self.collisionTrimeshAllowed = AnnotatedValue(False, "CollisionTrimeshAllowed",
                                                       group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.engineModelName.value = safe_check_and_set(self.engineModelName.value, xmlNode, "ModelFile")
-            if not self.engineModelName.value and not issubclass(type(self), CompoundVehiclePartPrototypeInfo):
-                logger.error(f"No model file is provided for prototype {self.prototypeName.value}")
-            mass = read_from_xml_node(xmlNode, "Mass", do_not_warn=True)
-            self.collisionTrimeshAllowed.value = parse_str_to_bool(self.collisionTrimeshAllowed.default_value,
-                                                                   read_from_xml_node(xmlNode,
-                                                                                      "CollisionTrimeshAllowed",
-                                                                                      do_not_warn=True))
-            if mass is not None:
-                self.massValue.value = float(mass)
-            if self.massValue.value < 0.001:
-                logger.error(f"Mass is too low for prototype {self.prototypeName.value}")
-            return STATUS_SUCCESS
+    def CheckModelAndMass(self, xmlFile, xmlNode):
+        if not self.engineModelName.value and not issubclass(type(self), CompoundVehiclePartPrototypeInfo):
+            logger.error(f"No model file is provided for prototype {self.prototypeName.value}")
+        if self.massValue.value < 0.001:
+            logger.error(f"Mass is too low for prototype {self.prototypeName.value}")
+
+    LoadFromXML = SchemaLoader(after=CheckModelAndMass)
 
     def RefreshFromXml(self, xmlFile, xmlNode):
         # originaly DataServer.GetItemByName
@@ -153,6 +249,11 @@ class PhysicBodyPrototypeInfo(PrototypeInfo):
 
 
 class VehiclePartPrototypeInfo(PhysicBodyPrototypeInfo):
+    FIELDS = (FieldSpec("blowEffectName", missing=MISSING_DEFAULT),
+              FieldSpec("durability", float),
+              FieldSpec("repairCoef", float),
+              FieldSpec("canBeUsedInAutogenerating", bool, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         PhysicBodyPrototypeInfo.__init__(self, server)
         self.weaponPrototypeId = -1
@@ -177,40 +278,23 @@ class VehiclePartPrototypeInfo(PhysicBodyPrototypeInfo):
         self.collision_size = AnnotatedValue(None, "Size", group_type=GroupType.INTERNAL,
                                              saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PhysicBodyPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.blowEffectName.value = safe_check_and_set(self.blowEffectName.default_value, xmlNode, "BlowEffect")
-            durability = read_from_xml_node(xmlNode, "Durability", do_not_warn=True)
-            if durability is not None:
-                self.durability.value = float(durability)
-            strDurabilityCoeffs = read_from_xml_node(xmlNode, "DurCoeffsForDamageTypes", do_not_warn=True)
-            if strDurabilityCoeffs is not None:
-                self.durabilityCoeffsForDamageTypes.value = [float(coeff) for coeff in strDurabilityCoeffs.split()]
-                for coeff in self.durabilityCoeffsForDamageTypes.value:
-                    if coeff < -25.1 or coeff > 25.0:
-                        logger.error(f"Invalif DurCoeffsForDamageTypes:{coeff} for {self.prototypeName.value}, "
-                                     "should be between -25.0 and 25.0")
-
-            loadPoints = read_from_xml_node(xmlNode, "LoadPoints", do_not_warn=True)
-            if loadPoints is not None and loadPoints != "":
-                self.loadPoints.value = loadPoints.split()
-            price = read_from_xml_node(xmlNode, "Price", do_not_warn=True)
-            if price is not None:
-                self.price.value = int(price)
-
-            repairCoef = read_from_xml_node(xmlNode, "RepairCoef", do_not_warn=True)
-            if repairCoef is not None:
-                self.repairCoef.value = float(repairCoef)
-
-            self.canBeUsedInAutogenerating.value = parse_str_to_bool(self.canBeUsedInAutogenerating.default_value,
-                                                                     read_from_xml_node(xmlNode,
-                                                                                        "CanBeUsedInAutogenerating",
-                                                                                        do_not_warn=True))
-            # custom implementation. Originally called from PrototypeManager -> RefreshFromXml
-            VehiclePartPrototypeInfo.RefreshFromXml(self, xmlFile, xmlNode)
-            # custom implementation ends
-            return STATUS_SUCCESS
+    def LoadPartDetailsFromXML(self, xmlFile, xmlNode):
+        strDurabilityCoeffs = read_from_xml_node(xmlNode, "DurCoeffsForDamageTypes", do_not_warn=True)
+        if strDurabilityCoeffs is not None:
+            self.durabilityCoeffsForDamageTypes.value = [float(coeff) for coeff in strDurabilityCoeffs.split()]
+            for coeff in self.durabilityCoeffsForDamageTypes.value:
+                if coeff < -25.1 or coeff > 25.0:
+                    logger.error(f"Invalif DurCoeffsForDamageTypes:{coeff} for {self.prototypeName.value}, "
+                                 "should be between -25.0 and 25.0")
+
+        loadPoints = read_from_xml_node(xmlNode, "LoadPoints", do_not_warn=True)
+        if loadPoints is not None and loadPoints != "":
+            self.loadPoints.value = loadPoints.split()
+        # custom implementation. Originally called from PrototypeManager -> RefreshFromXml
+        VehiclePartPrototypeInfo.RefreshFromXml(self, xmlFile, xmlNode)
+        # custom implementation ends
+
+    LoadFromXML = SchemaLoader(after=LoadPartDetailsFromXML)
 
     def RefreshFromXml(self, xmlFile, xmlNode):
         # custom logic
@@ -228,7 +312,7 @@ class VehiclePartPrototypeInfo(PhysicBodyPrototypeInfo):
             #              "id": None,
             #              "variants": None}
             model_path = self.theServer.theAnimatedModelsServer.GetItemByName(self.engineModelName.value).file_name
-            model_group_health = parse_model_group_health(model_path)
+            model_group_health = theModelMetadataStore.get_group_health(model_path)
             if model_group_health is not None:
                 for group_health in model_group_health:
                     if group_health_node is not None:
@@ -262,6 +346,12 @@ class VehiclePartPrototypeInfo(PhysicBodyPrototypeInfo):
 
 
 class ChassisPrototypeInfo(VehiclePartPrototypeInfo):
+    FIELDS = (FieldSpec("maxHealth", float),
+              FieldSpec("maxFuel", float),
+              FieldSpec("brakingSoundName", warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("pneumoSoundName", warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("gearShiftSoundName", warn_if_missing=True, missing=MISSING_NONE))
+
     def __init__(self, server):
         VehiclePartPrototypeInfo.__init__(self, server)
         self.maxHealth = AnnotatedValue(1.0, "MaxHealth", group_type=GroupType.PRIMARY)
@@ -272,24 +362,18 @@ class ChassisPrototypeInfo(VehiclePartPrototypeInfo):
         # custom logic
         self.lookupModelFile = True
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            maxHealth = read_from_xml_node(xmlNode, "MaxHealth", do_not_warn=True)
-            if maxHealth is not None:
-                self.maxHealth.value = float(maxHealth)
-
-            maxFuel = read_from_xml_node(xmlNode, "MaxFuel", do_not_warn=True)
-            if maxFuel is not None:
-                self.maxFuel.value = float(maxFuel)
-
-            self.brakingSoundName.value = read_from_xml_node(xmlNode, "BrakingSound")
-            self.pneumoSoundName.value = read_from_xml_node(xmlNode, "PneumoSound")
-            self.gearShiftSoundName.value = read_from_xml_node(xmlNode, "GearShiftSound")
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class CabinPrototypeInfo(VehiclePartPrototypeInfo):
+    FIELDS = (FieldSpec("maxPower", float),
+              FieldSpec("maxTorque", float),
+              FieldSpec("maxSpeed", _kmh_to_ms),
+              FieldSpec("fuelConsumption", float),
+              FieldSpec("engineHighSoundName", missing=MISSING_DEFAULT),
+              FieldSpec("engineLowSoundName", missing=MISSING_DEFAULT),
+              FieldSpec("control", float))
+
     def __init__(self, server):
         VehiclePartPrototypeInfo.__init__(self, server)
         self.maxPower = AnnotatedValue(1.0, "MaxPower", group_type=GroupType.PRIMARY)
@@ -305,47 +389,19 @@ class CabinPrototypeInfo(VehiclePartPrototypeInfo):
         # custom logic
         self.lookupModelFile = True
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            maxPower = read_from_xml_node(xmlNode, self.maxPower.name, do_not_warn=True)
-            if maxPower is not None:
-                self.maxPower.value = float(maxPower)
-
-            maxTorque = read_from_xml_node(xmlNode, self.maxTorque.name, do_not_warn=True)
-            if maxTorque is not None:
-                self.maxTorque.value = float(maxTorque)
-
-            maxSpeed = read_from_xml_node(xmlNode, self.maxSpeed.name, do_not_warn=True)
-            if maxSpeed is not None:
-                self.maxSpeed.value = float(maxSpeed)
-                self.maxSpeed.value = self.maxSpeed.value * 0.27777779  # ~5/18 or 50/180
-
-            fuelConsumption = read_from_xml_node(xmlNode, self.fuelConsumption.name, do_not_warn=True)
-            if fuelConsumption is not None:
-                self.fuelConsumption.value = float(fuelConsumption)
-
-            self.engineHighSoundName.value = safe_check_and_set(self.engineHighSoundName.default_value,
-                                                                xmlNode,
-                                                                self.engineHighSoundName.name)
-            self.engineLowSoundName.value = safe_check_and_set(self.engineLowSoundName.default_value,
-                                                               xmlNode,
-                                                               self.engineLowSoundName.name)
-
-            control = read_from_xml_node(xmlNode, self.control.name, do_not_warn=True)
-            if control is not None:
-                self.control.value = float(control)
-            if self.control.value < 0.0 or self.control.value > 100.0:
-                self.control.value = 100.0
-
-            gadgetDescriptions = child_from_xml_node(xmlNode, self.gadgetSlots.name, do_not_warn=True)
-            if gadgetDescriptions is not None:
-                check_mono_xml_node(gadgetDescriptions, "Slot")
-                for gadget_node in gadgetDescriptions.iterchildren(tag="Slot"):
-                    gadget = {"resourceType": read_from_xml_node(gadget_node, "ResourceType"),
-                              "maxAmount": int(read_from_xml_node(gadget_node, "MaxAmount"))}
-                    self.gadgetSlots.value.append(gadget)
-            return STATUS_SUCCESS
+    def LoadGadgetSlotsFromXML(self, xmlFile, xmlNode):
+        if self.control.value < 0.0 or self.control.value > 100.0:
+            self.control.value = 100.0
+
+        gadgetDescriptions = child_from_xml_node(xmlNode, self.gadgetSlots.name, do_not_warn=True)
+        if gadgetDescriptions is not None:
+            check_mono_xml_node(gadgetDescriptions, "Slot")
+            for gadget_node in gadgetDescriptions.iterchildren(tag="Slot"):
+                gadget = {"resourceType": read_from_xml_node(gadget_node, "ResourceType"),
+                          "maxAmount": int(read_from_xml_node(gadget_node, "MaxAmount"))}
+                self.gadgetSlots.value.append(gadget)
+
+    LoadFromXML = SchemaLoader(after=LoadGadgetSlotsFromXML)
 
     def get_etree_prototype(self):
         result = VehiclePartPrototypeInfo.get_etree_prototype(self)
@@ -377,26 +433,22 @@ class BasketPrototypeInfo(VehiclePartPrototypeInfo):
         # custom logic
         self.lookupModelFile = True
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            repositoryDescriptions = child_from_xml_node(xmlNode, "RepositoryDescription")
-            repositorySize = read_from_xml_node(repositoryDescriptions, self.repositorySize.name)
-            repositorySize = repositorySize.split()
-            self.repositorySize.value = {"x": repositorySize[0],
-                                         "y": repositorySize[1]}
-            if len(repositoryDescriptions.getchildren()) > 0:
-                check_mono_xml_node(repositoryDescriptions, "Slot")
-                for slot_node in repositoryDescriptions.iterchildren(tag="Slot"):
-                    pos = read_from_xml_node(slot_node, "Pos").split()
-                    pos = {"x": pos[0], "y": pos[1]}
-                    slot = {"name": read_from_xml_node(slot_node, "Name"),
-                            "pos": pos}
-                    self.slots.value.append(slot)
-            return STATUS_SUCCESS
-
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
+    def LoadRepositoryFromXML(self, xmlFile, xmlNode):
+        repositoryDescriptions = child_from_xml_node(xmlNode, "RepositoryDescription")
+        repositorySize = read_from_xml_node(repositoryDescriptions, self.repositorySize.name)
+        repositorySize = repositorySize.split()
+        self.repositorySize.value = {"x": repositorySize[0],
+                                     "y": repositorySize[1]}
+        if len(repositoryDescriptions.getchildren()) > 0:
+            check_mono_xml_node(repositoryDescriptions, "Slot")
+            for slot_node in repositoryDescriptions.iterchildren(tag="Slot"):
+                pos = read_from_xml_node(slot_node, "Pos").split()
+                pos = {"x": pos[0], "y": pos[1]}
+                slot = {"name": read_from_xml_node(slot_node, "Name"),
+                        "pos": pos}
+                self.slots.value.append(slot)
+
+    LoadFromXML = SchemaLoader(after=LoadRepositoryFromXML)
 
     def get_etree_prototype(self):
         result = VehiclePartPrototypeInfo.get_etree_prototype(self)
@@ -417,6 +469,26 @@ class BasketPrototypeInfo(VehiclePartPrototypeInfo):
 
 
 class GunPrototypeInfo(VehiclePartPrototypeInfo):
+    FIELDS = (FieldSpec("shellPrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("damage", float),
+              FieldSpec("firingRate", float),
+              FieldSpec("firingRange", float),
+              FieldSpec("explosionTypeName", missing=MISSING_DEFAULT),
+              FieldSpec("recoilForce", float),
+              FieldSpec("decalName", missing=MISSING_DEFAULT),
+              FieldSpec("firingType", FiringTypesStruct.get, warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("damageType", DamageTypeStruct.get),
+              FieldSpec("withCharging", bool, missing=MISSING_DEFAULT),
+              FieldSpec("chargeSize", int, validator=is_non_negative),  # ??? why should it ever be less than 0?
+              FieldSpec("reChargingTime", float),
+              FieldSpec("reChargingTimePerShell", float),
+              # next field was made to convert only loaded value, to avoid double convertation of default
+              FieldSpec("turningSpeed", _turning_speed_to_radians),
+              FieldSpec("ignoreStopAnglesWhenFire", bool, missing=MISSING_DEFAULT),
+              FieldSpec("lowStopAngle", _degrees_to_radians),
+              FieldSpec("highStopAngle", _degrees_to_radians))
+
     def __init__(self, server):
         VehiclePartPrototypeInfo.__init__(self, server)
         self.barrelModelName = ""
@@ -456,94 +528,32 @@ class GunPrototypeInfo(VehiclePartPrototypeInfo):
         self.highStopAngle = AnnotatedValue(None, "HighStop", group_type=GroupType.INTERNAL,
                                             saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
-        result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.shellPrototypeName.value = safe_check_and_set(self.shellPrototypeName.default_value,
-                                                               xmlNode, self.shellPrototypeName.name)
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value,
-                                                                   xmlNode, self.blastWavePrototypeName.name)
-            damage = read_from_xml_node(xmlNode, self.damage.name, do_not_warn=True)
-            if damage is not None:
-                self.damage.value = float(damage)
-
-            firingRate = read_from_xml_node(xmlNode, self.firingRate.name, do_not_warn=True)
-            if firingRate is not None:
-                self.firingRate.value = float(firingRate)
-
-            firingRange = read_from_xml_node(xmlNode, self.firingRange.name, do_not_warn=True)
-            if firingRange is not None:
-                self.firingRange.value = float(firingRange)
-
-            self.explosionTypeName.value = safe_check_and_set(self.explosionTypeName.default_value,
-                                                              xmlNode, self.explosionTypeName.name)
-
-            recoilForce = read_from_xml_node(xmlNode, self.recoilForce.name, do_not_warn=True)
-            if recoilForce is not None:
-                self.recoilForce.value = float(recoilForce)
-
-            self.decalName.value = safe_check_and_set(self.decalName.default_value, xmlNode, self.decalName.name)
-            self.decalId = f"Placeholder for {self.decalName.value}!"  # DynamicScene.AddDecalName(decalName)
-
-            firingType = read_from_xml_node(xmlNode, self.firingType.name)
-            self.firingType.value = GunPrototypeInfo.Str2FiringType(firingType)
-            if self.firingType.value is None:
-                logger.warning(f"Unknown firing type: {self.firingType.value}!")
-
-            damageTypeName = read_from_xml_node(xmlNode, self.damageType.name, do_not_warn=True)
-            if damageTypeName is not None:
-                self.damageType.value = GunPrototypeInfo.Str2DamageType(damageTypeName)
-            if self.damageType.value is None:
-                logger.warning(f"Unknown damage type: {self.damageType.value}")
-
-            self.withCharging.value = parse_str_to_bool(self.withCharging.default_value,
-                                                        read_from_xml_node(xmlNode,
-                                                                           self.withCharging.name,
-                                                                           do_not_warn=True))
-
-            chargeSize = read_from_xml_node(xmlNode, self.chargeSize.name, do_not_warn=True)
-            if chargeSize is not None:
-                chargeSize = int(chargeSize)
-                if chargeSize >= 0:  # ??? whaaat, why should it ever be less than 0?
-                    self.chargeSize.value = chargeSize
-
-            reChargingTime = read_from_xml_node(xmlNode, self.reChargingTime.name, do_not_warn=True)
-            if reChargingTime is not None:
-                self.reChargingTime.value = float(reChargingTime)
-
-            reChargingTimePerShell = read_from_xml_node(xmlNode, self.reChargingTimePerShell.name, do_not_warn=True)
-            if reChargingTimePerShell is not None:
-                self.reChargingTimePerShell.value = float(reChargingTimePerShell)
-
-            shellsPoolSize = read_from_xml_node(xmlNode, self.shellsPoolSize.name, do_not_warn=True)
-            if shellsPoolSize is not None:
-                shellsPoolSize = int(shellsPoolSize)
-                if shellsPoolSize > 0:
-                    self.shellsPoolSize.value = shellsPoolSize
-                else:
-                    self.withShellsPoolLimit.default_value = False
-                    self.withShellsPoolLimit.value = False
-
-            self.withShellsPoolLimit.value = parse_str_to_bool(self.withShellsPoolLimit.default_value,
-                                                               read_from_xml_node(xmlNode,
-                                                                                  self.withShellsPoolLimit.name,
-                                                                                  do_not_warn=True))
+    def LoadFiringDetailsFromXML(self, xmlFile, xmlNode: etree._Element):
+        self.decalId = f"Placeholder for {self.decalName.value}!"  # DynamicScene.AddDecalName(decalName)
+        if self.firingType.value is None:
+            logger.warning(f"Unknown firing type: {self.firingType.value}!")
+        if self.damageType.value is None:
+            logger.warning(f"Unknown damage type: {self.damageType.value}")
+
+        shellsPoolSize = read_from_xml_node(xmlNode, self.shellsPoolSize.name, do_not_warn=True)
+        if shellsPoolSize is not None:
+            shellsPoolSize = int(shellsPoolSize)
+            if shellsPoolSize > 0:
+                self.shellsPoolSize.value = shellsPoolSize
+            else:
+                self.withShellsPoolLimit.default_value = False
+                self.withShellsPoolLimit.value = False
 
-            turningSpeed = read_from_xml_node(xmlNode, self.turningSpeed.name, do_not_warn=True)
-            if turningSpeed is not None:
-                self.turningSpeed.value = float(turningSpeed)
-                # next row was moved under if to avoid double convertation of default. Default also was changed.
-                self.turningSpeed.value *= pi / 180  # convert to rads
-            # initially in engineModelName we have gun carriage. Here we add Gun suffix to take related model.
+        self.withShellsPoolLimit.value = parse_str_to_bool(self.withShellsPoolLimit.default_value,
+                                                           read_from_xml_node(xmlNode,
+                                                                              self.withShellsPoolLimit.name,
+                                                                              do_not_warn=True))
+        # initially in engineModelName we have gun carriage. Here we add Gun suffix to take related model.
+        # Model inherited from parent gun already has the suffix
+        if not self.engineModelName.is_inherited:
             self.engineModelName.value += "Gun"
-            self.ignoreStopAnglesWhenFire.value = parse_str_to_bool(
-                self.ignoreStopAnglesWhenFire.default_value, read_from_xml_node(xmlNode,
-                                                                                self.ignoreStopAnglesWhenFire.name,
-                                                                                do_not_warn=True))
-            # custom implementation. Originally called from PrototypeManager -> RefreshFromXml
-            self.RefreshFromXml(xmlFile, xmlNode)
-            # custom implementation ends
-            return STATUS_SUCCESS
+
+    LoadFromXML = SchemaLoader(after=LoadFiringDetailsFromXML)
 
     def Str2FiringType(firing_type_name: str):
         return FiringTypesStruct.get(firing_type_name)
@@ -568,15 +578,6 @@ class GunPrototypeInfo(VehiclePartPrototypeInfo):
             logger.error(
                 f"Unknown blastwave prototype {self.blastWavePrototypeName.value} for {self.prototypeName.value}")
 
-    def RefreshFromXml(self, xmlFile, xmlNode):
-        lowStopAngle = read_from_xml_node(xmlNode, "LowStop", do_not_warn=True)
-        if lowStopAngle is not None:
-            self.lowStopAngle.value = float(lowStopAngle) * pi / 180  # 0.017453292
-
-        highStopAngle = read_from_xml_node(xmlNode, "HighStop", do_not_warn=True)
-        if highStopAngle is not None:
-            self.highStopAngle.value = float(highStopAngle) * pi / 180  # 0.017453292
-
     def get_etree_prototype(self):
         result = VehiclePartPrototypeInfo.get_etree_prototype(self)
         add_value_to_node(result, self.engineModelName, lambda x: x.value.strip("Gun"))
@@ -598,7 +599,7 @@ class GadgetPrototypeInfo(PrototypeInfo):
         self.skinNum = AnnotatedValue(0, "SkinNum", group_type=GroupType.VISUAL, display_type=DisplayType.SKIN_NUM)
         self.isUpdating = AnnotatedValue(False, "IsUpdating", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
+    def LoadFromXML(self, xmlFile, xmlNode: etree._Element):
         result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
         if result == STATUS_SUCCESS:
             modifications = read_from_xml_node(xmlNode, "Modifications").split(";")
@@ -725,7 +726,7 @@ class WanderersGeneratorPrototypeInfo(PrototypeInfo):  # special save and displa
         self.desiredCountHigh = AnnotatedValue(-1, "DesiredCountHigh", group_type=GroupType.PRIMARY,
                                                saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
+    def LoadFromXML(self, xmlFile, xmlNode: etree._Element):
         result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
         if result == STATUS_SUCCESS:
             desiredCount = read_from_xml_node(xmlNode, "DesiredCount", do_not_warn=True)
@@ -894,20 +895,16 @@ class AffixGeneratorPrototypeInfo(PrototypeInfo):
                                                 display_type=DisplayType.AFFIX_LIST,
                                                 saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
+    def LoadFromXML(self, xmlFile, xmlNode: etree._Element):
         result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
         if result == STATUS_SUCCESS:
-            affix_nodes = child_from_xml_node(xmlNode, "Affix")
-            for affix in affix_nodes:
+            for affix in children_from_xml_node(xmlNode, "Affix"):
                 self.affixDescriptions.value.append(read_from_xml_node(affix, "AffixName"))
             return STATUS_SUCCESS
 
     def GenerateAffixesForObj(self, obj, desiredNumAffixed):
         pass
 
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
-
     def get_etree_prototype(self):
         result = PrototypeInfo.get_etree_prototype(self)
 
@@ -937,24 +934,23 @@ class AffixGeneratorPrototypeInfo(PrototypeInfo):
 
 
 class PhysicObjPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("intersectionRadius"),
+              FieldSpec("lookRadius"))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.intersectionRadius = AnnotatedValue(0.0, "IntersectionRadius", group_type=GroupType.PRIMARY)
         self.lookRadius = AnnotatedValue(0.0, "LookRadius", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            intersectionRadius = read_from_xml_node(xmlNode, "IntersectionRadius", do_not_warn=True)
-            if intersectionRadius is not None:
-                self.intersectionRadius.value = intersectionRadius
-            lookRadius = read_from_xml_node(xmlNode, "LookRadius", do_not_warn=True)
-            if lookRadius is not None:
-                self.lookRadius.value = lookRadius
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class SimplePhysicObjPrototypeInfo(PhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("massValue", float),
+              # ??? maybe should fallback to "" instead None
+              FieldSpec("engineModelName", missing=MISSING_NONE),
+              FieldSpec("collisionTrimeshAllowed", bool, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         PhysicObjPrototypeInfo.__init__(self, server)
         self.collisionInfos = []
@@ -967,22 +963,11 @@ class SimplePhysicObjPrototypeInfo(PhysicObjPrototypeInfo):
         self.radius = AnnotatedValue(1.0, "Radius", group_type=GroupType.SECONDARY)
         self.massValue = AnnotatedValue(1.0, "Mass", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            mass = read_from_xml_node(xmlNode, "Mass", do_not_warn=True)
-            if mass is not None:
-                self.massValue.value = float(mass)
-            # ??? maybe should fallback to "" instead None
-            self.engineModelName.value = read_from_xml_node(xmlNode, "ModelFile", do_not_warn=True)
-            self.collisionTrimeshAllowed.value = parse_str_to_bool(self.collisionTrimeshAllowed.default_value,
-                                                                   read_from_xml_node(xmlNode,
-                                                                                      "CollisionTrimeshAllowed",
-                                                                                      do_not_warn=True))
-            # custom implementation. Originally called from PrototypeManager -> RefreshFromXml
-            self.RefreshFromXml(xmlFile, xmlNode)
-            # custom implementation ends
-            return STATUS_SUCCESS
+    def RefreshOnLoad(self, xmlFile, xmlNode):
+        # custom implementation. Originally called from PrototypeManager -> RefreshFromXml
+        self.RefreshFromXml(xmlFile, xmlNode)
+
+    LoadFromXML = SchemaLoader(after=RefreshOnLoad)
 
     def SetGeomType(self, geom_type):
         self.geomType = GEOM_TYPE[geom_type]
@@ -1021,24 +1006,28 @@ class SimplePhysicObjPrototypeInfo(PhysicObjPrototypeInfo):
 
 
 class ChestPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("lifeTime", float, missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.lifeTime = AnnotatedValue(-1.0, "LifeTime", group_type=GroupType.SECONDARY)
         self.withLifeTime = False
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("BOX")
-            self.lifeTime.value = safe_check_and_set(self.lifeTime.default_value, xmlNode, self.lifeTime.name, "float")
-            if self.lifeTime.value <= 0.0:
-                self.withLifeTime = False
-            else:
-                self.withLifeTime = True
-            return STATUS_SUCCESS
+    def SetUpGeometryAndLifeTime(self, xmlFile, xmlNode):
+        self.SetGeomType("BOX")
+        if self.lifeTime.value <= 0.0:
+            self.withLifeTime = False
+        else:
+            self.withLifeTime = True
+
+    LoadFromXML = SchemaLoader(after=SetUpGeometryAndLifeTime)
 
 
 class ComplexPhysicObjPrototypeInfo(PhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("massSize", parse_str_to_vector),
+              FieldSpec("massTranslation", parse_str_to_vector),
+              FieldSpec("massShape", int))
+
     def __init__(self, server):
         PhysicObjPrototypeInfo.__init__(self, server)
         self.partPrototypeIds = []
@@ -1055,34 +1044,26 @@ class ComplexPhysicObjPrototypeInfo(PhysicObjPrototypeInfo):
         self.allPartNames = []
         self.massShape = AnnotatedValue(0, "MassShape", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            main_part_description_node = child_from_xml_node(xmlNode, "MainPartDescription", do_not_warn=True)
-            if main_part_description_node is not None:
-                partPrototypeDescriptions = self.ComplexPhysicObjPartDescription()
-                partPrototypeDescriptions.LoadFromXML(xmlFile, main_part_description_node, self.theServer)
-                self.partPrototypeDescriptions.value = partPrototypeDescriptions
-            else:
-                if self.parent.partPrototypeDescriptions.value is None:
-                    logger.warning(f"Parts description is missing for prototype {self.prototypeName.value}")
-            parts_node = child_from_xml_node(xmlNode, "Parts")
-            if parts_node is not None:
-                check_mono_xml_node(parts_node, "Part")
-                for part_node in parts_node.iterchildren(tag="Part"):
-                    prototypeId = read_from_xml_node(part_node, "id")
-                    prototypeName = read_from_xml_node(part_node, "Prototype")
-                    protName = {"name": prototypeName,
-                                "id": prototypeId}
-                    self.partPrototypeNames.value.append(protName)
-            massSize = read_from_xml_node(xmlNode, "MassSize", do_not_warn=True)
-            if massSize is not None:
-                self.massSize.value = parse_str_to_vector(massSize)
-            massTranslation = read_from_xml_node(xmlNode, "MassTranslation", do_not_warn=True)
-            if massTranslation is not None:
-                self.massTranslation.value = parse_str_to_vector(massTranslation)
-            self.massShape.value = safe_check_and_set(self.massShape.value, xmlNode, "MassShape", "int")
-            return STATUS_SUCCESS
+    def LoadPartsFromXML(self, xmlFile, xmlNode):
+        main_part_description_node = child_from_xml_node(xmlNode, "MainPartDescription", do_not_warn=True)
+        if main_part_description_node is not None:
+            partPrototypeDescriptions = self.ComplexPhysicObjPartDescription()
+            partPrototypeDescriptions.LoadFromXML(xmlFile, main_part_description_node, self.theServer)
+            self.partPrototypeDescriptions.value = partPrototypeDescriptions
+        else:
+            if self.parent.partPrototypeDescriptions.value is None:
+                logger.warning(f"Parts description is missing for prototype {self.prototypeName.value}")
+        parts_node = child_from_xml_node(xmlNode, "Parts")
+        if parts_node is not None:
+            check_mono_xml_node(parts_node, "Part")
+            for part_node in parts_node.iterchildren(tag="Part"):
+                prototypeId = read_from_xml_node(part_node, "id")
+                prototypeName = read_from_xml_node(part_node, "Prototype")
+                protName = {"name": prototypeName,
+                            "id": prototypeId}
+                self.partPrototypeNames.value.append(protName)
+
+    LoadFromXML = SchemaLoader(after=LoadPartsFromXML)
 
     def PostLoad(self, prototype_manager):
         for prot_name in self.partPrototypeNames.value:
@@ -1173,6 +1154,25 @@ class StaticAutoGunPrototypeInfo(ComplexPhysicObjPrototypeInfo):
 
 
 class VehiclePrototypeInfo(ComplexPhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("diffRatio", float, missing=MISSING_DEFAULT),
+              FieldSpec("maxEngineRpm", float, missing=MISSING_DEFAULT),
+              FieldSpec("lowGearShiftLimit", float, missing=MISSING_DEFAULT),
+              FieldSpec("highGearShiftLimit", float, missing=MISSING_DEFAULT),
+              FieldSpec("selfbrakingCoeff", float, missing=MISSING_DEFAULT),
+              FieldSpec("steeringSpeed", float, missing=MISSING_DEFAULT),
+              FieldSpec("decisionMatrixName", missing=MISSING_NONE),  # new logic
+              FieldSpec("takingRadius", float, missing=MISSING_DEFAULT),
+              FieldSpec("priority", int, missing=MISSING_DEFAULT),
+              FieldSpec("hornSoundName", missing=MISSING_DEFAULT),
+              FieldSpec("cameraHeight", float, missing=MISSING_DEFAULT),
+              FieldSpec("cameraMaxDist", float, missing=MISSING_DEFAULT),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("additionalWheelsHover", float, missing=MISSING_DEFAULT),
+              FieldSpec("driftCoeff", float, missing=MISSING_DEFAULT),
+              FieldSpec("pressingForce", float, missing=MISSING_DEFAULT),
+              FieldSpec("healthRegeneration", float, missing=MISSING_DEFAULT),
+              FieldSpec("durabilityRegeneration", float, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         ComplexPhysicObjPrototypeInfo.__init__(self, server)
         self.diffRatio = AnnotatedValue(1.0, "DiffRatio", group_type=GroupType.SECONDARY)
@@ -1201,65 +1201,29 @@ class VehiclePrototypeInfo(ComplexPhysicObjPrototypeInfo):
         self.blastWavePrototypeId = -1
         self.decisionMatrixName = AnnotatedValue("", "DecisionMatrix", group_type=GroupType.SECONDARY)  # new logic
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ComplexPhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.diffRatio.value = safe_check_and_set(self.diffRatio.default_value, xmlNode,
-                                                      self.diffRatio.name, "float")
-            self.maxEngineRpm.value = safe_check_and_set(self.maxEngineRpm.default_value, xmlNode,
-                                                         self.maxEngineRpm.name, "float")
-            self.lowGearShiftLimit.value = safe_check_and_set(self.lowGearShiftLimit.default_value, xmlNode,
-                                                              self.lowGearShiftLimit.name, "float")
-            self.highGearShiftLimit.value = safe_check_and_set(self.highGearShiftLimit.default_value, xmlNode,
-                                                               self.highGearShiftLimit.name, "float")
-            self.selfbrakingCoeff.value = safe_check_and_set(self.selfbrakingCoeff.default_value, xmlNode,
-                                                             self.selfbrakingCoeff.name, "float")
-            self.steeringSpeed.value = safe_check_and_set(self.steeringSpeed.default_value, xmlNode,
-                                                          self.steeringSpeed.name, "float")
-            decisionMatrixName = read_from_xml_node(xmlNode, self.decisionMatrixName.name, do_not_warn=True)
-            self.decisionMatrixName.value = decisionMatrixName  # new logic
-            # theAIManager.LoadMatrix(decisionMatrixName)
-            # self.decisionMatrixNum = theAIManager.GetMatrixNum(decisionMatrixName)
-            self.decisionMatrixNum = f"DummyMatrixNum_{decisionMatrixName}"  # ??? replace when AIManager is implemented
-            self.takingRadius.value = safe_check_and_set(self.takingRadius.default_value, xmlNode,
-                                                         self.takingRadius.name, "float")
-            self.priority.value = safe_check_and_set(self.priority.default_value, xmlNode,
-                                                     self.priority.name, "int")
-            self.hornSoundName.value = safe_check_and_set(self.hornSoundName.default_value, xmlNode,
-                                                          self.hornSoundName.name)
-            self.cameraHeight.value = safe_check_and_set(self.cameraHeight.default_value, xmlNode,
-                                                         self.cameraHeight.name, "float")
-            self.cameraMaxDist.value = safe_check_and_set(self.cameraMaxDist.default_value, xmlNode,
-                                                          self.cameraMaxDist.name, "float")
-            destroyEffectNames = [read_from_xml_node(xmlNode, name, do_not_warn=True) for name in DESTROY_EFFECT_NAMES]
-            for i in range(len(self.destroyEffectNames.value)):
-                if destroyEffectNames[i] is not None:
-                    self.destroyEffectNames.value[i] = destroyEffectNames[i]
-            wheels_info = child_from_xml_node(xmlNode, self.wheelInfos.name, do_not_warn=True)
-            if self.parentPrototypeName.value is not None and wheels_info is not None:
-                logger.error(f"Wheels info is present for inherited vehicle {self.prototypeName.value}")
-            elif self.parentPrototypeName.value is None and wheels_info is None:
-                logger.error(f"Wheels info is not present for parent vehicle {self.prototypeName.value}")
-            elif self.parentPrototypeName.value is None and wheels_info is not None:
-                check_mono_xml_node(wheels_info, "Wheel")
-                for wheel_node in wheels_info.iterchildren(tag="Wheel"):
-                    steering = read_from_xml_node(wheel_node, "steering", do_not_warn=True)
-                    wheel_prototype_name = read_from_xml_node(wheel_node, "Prototype")
-                    wheel = self.WheelInfo(wheel_prototype_name, steering)
-                    self.wheelInfos.value.append(wheel)
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value, xmlNode,
-                                                                   self.blastWavePrototypeName.name)
-            self.additionalWheelsHover.value = safe_check_and_set(self.additionalWheelsHover.default_value, xmlNode,
-                                                                  self.additionalWheelsHover.name, "float")
-            self.driftCoeff.value = safe_check_and_set(self.driftCoeff.default_value, xmlNode,
-                                                       self.driftCoeff.name, "float")
-            self.pressingForce.value = safe_check_and_set(self.pressingForce.default_value, xmlNode,
-                                                          self.pressingForce.name, "float")
-            self.healthRegeneration.value = safe_check_and_set(self.healthRegeneration.default_value, xmlNode,
-                                                               self.healthRegeneration.name, "float")
-            self.durabilityRegeneration.value = safe_check_and_set(self.durabilityRegeneration.default_value, xmlNode,
-                                                                   self.durabilityRegeneration.name, "float")
-            return STATUS_SUCCESS
+    def LoadEffectsAndWheelsFromXML(self, xmlFile, xmlNode):
+        # theAIManager.LoadMatrix(decisionMatrixName)
+        # self.decisionMatrixNum = theAIManager.GetMatrixNum(decisionMatrixName)
+        # ??? replace when AIManager is implemented
+        self.decisionMatrixNum = f"DummyMatrixNum_{self.decisionMatrixName.value}"
+        destroyEffectNames = [read_from_xml_node(xmlNode, name, do_not_warn=True) for name in DESTROY_EFFECT_NAMES]
+        for i in range(len(self.destroyEffectNames.value)):
+            if destroyEffectNames[i] is not None:
+                self.destroyEffectNames.value[i] = destroyEffectNames[i]
+        wheels_info = child_from_xml_node(xmlNode, self.wheelInfos.name, do_not_warn=True)
+        if self.parentPrototypeName.value is not None and wheels_info is not None:
+            logger.error(f"Wheels info is present for inherited vehicle {self.prototypeName.value}")
+        elif self.parentPrototypeName.value is None and wheels_info is None:
+            logger.error(f"Wheels info is not present for parent vehicle {self.prototypeName.value}")
+        elif self.parentPrototypeName.value is None and wheels_info is not None:
+            check_mono_xml_node(wheels_info, "Wheel")
+            for wheel_node in wheels_info.iterchildren(tag="Wheel"):
+                steering = read_from_xml_node(wheel_node, "steering", do_not_warn=True)
+                wheel_prototype_name = read_from_xml_node(wheel_node, "Prototype")
+                wheel = self.WheelInfo(wheel_prototype_name, steering)
+                self.wheelInfos.value.append(wheel)
+
+    LoadFromXML = SchemaLoader(after=LoadEffectsAndWheelsFromXML)
 
     def PostLoad(self, prototype_manager):
         ComplexPhysicObjPrototypeInfo.PostLoad(self, prototype_manager)
@@ -1267,9 +1231,6 @@ class VehiclePrototypeInfo(ComplexPhysicObjPrototypeInfo):
             wheel_info.wheelPrototypeId = prototype_manager.GetPrototypeId(wheel_info.wheelPrototypeName)
         self.blastWavePrototypeId = prototype_manager.GetPrototypeId(self.blastWavePrototypeName.value)
 
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
-
     def get_etree_prototype(self):
         result = ComplexPhysicObjPrototypeInfo.get_etree_prototype(self)
         # destroyEffectNames start
@@ -1307,19 +1268,13 @@ class VehiclePrototypeInfo(ComplexPhysicObjPrototypeInfo):
 
 
 class ArticulatedVehiclePrototypeInfo(VehiclePrototypeInfo):
+    FIELDS = (FieldSpec("trailerPrototypeName", missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         VehiclePrototypeInfo.__init__(self, server)
         self.trailerPrototypeName = AnnotatedValue("", "TrailerPrototype", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = VehiclePrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.trailerPrototypeName.value = safe_check_and_set(self.trailerPrototypeName.default_value, xmlNode,
-                                                                 "TrailerPrototype")
-            return STATUS_SUCCESS
-
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
+    LoadFromXML = SchemaLoader()
 
     def PostLoad(self, prototype_manager):
         VehiclePrototypeInfo.PostLoad(self, prototype_manager)
@@ -1327,6 +1282,9 @@ class ArticulatedVehiclePrototypeInfo(VehiclePrototypeInfo):
 
 
 class DummyObjectPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("disablePhysics", bool, missing=MISSING_DEFAULT),
+              FieldSpec("disableGeometry", bool, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.isUpdating.value = False
@@ -1336,32 +1294,28 @@ class DummyObjectPrototypeInfo(SimplePhysicObjPrototypeInfo):
         self.disableGeometry = AnnotatedValue(False, "DisableGeometry",
                                               group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.disablePhysics.value = parse_str_to_bool(self.disablePhysics.default_value,
-                                                          read_from_xml_node(xmlNode,
-                                                                             self.disablePhysics.name,
-                                                                             do_not_warn=True))
-            self.disableGeometry.value = parse_str_to_bool(self.disableGeometry.default_value,
-                                                           read_from_xml_node(xmlNode,
-                                                                              self.disableGeometry.name,
-                                                                              do_not_warn=True))
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class LocationPrototypeInfo(SimplePhysicObjPrototypeInfo):
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("BOX")  # from GEOM_TYPE const enum
-            return STATUS_SUCCESS
+    def SetUpGeometry(self, xmlFile, xmlNode):
+        self.SetGeomType("BOX")  # from GEOM_TYPE const enum
+
+    LoadFromXML = SchemaLoader(after=SetUpGeometry)
 
 
 class WheelPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("suspensionRange", float),
+              FieldSpec("suspensionModelName", warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("suspensionCFM", float),
+              FieldSpec("suspensionERP", float),
+              FieldSpec("mU", float),
+              FieldSpec("typeName", missing=MISSING_DEFAULT),
+              FieldSpec("blowEffectName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.suspensionRange = AnnotatedValue(0.5, "SuspensionRange", group_type=GroupType.SECONDARY)
@@ -1372,32 +1326,7 @@ class WheelPrototypeInfo(SimplePhysicObjPrototypeInfo):
         self.typeName = AnnotatedValue("BIG", "EffectType", group_type=GroupType.SECONDARY)
         self.blowEffectName = AnnotatedValue("ET_PS_HARD_BLOW", "BlowEffect", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            suspensionRange = read_from_xml_node(xmlNode, self.suspensionRange.name, do_not_warn=True)
-            if suspensionRange is not None:
-                self.suspensionRange.value = float(suspensionRange)
-
-            self.suspensionModelName.value = read_from_xml_node(xmlNode, self.suspensionModelName.name)
-
-            suspensionCFM = read_from_xml_node(xmlNode, self.suspensionCFM.name, do_not_warn=True)
-            if suspensionCFM is not None:
-                self.suspensionCFM.value = float(suspensionCFM)
-
-            suspensionERP = read_from_xml_node(xmlNode, self.suspensionERP.name, do_not_warn=True)
-            if suspensionERP is not None:
-                self.suspensionERP.value = float(suspensionERP)
-
-            mU = read_from_xml_node(xmlNode, self.mU.name, do_not_warn=True)
-            if mU is not None:
-                self.mU.value = float(mU)
-
-            self.typeName.value = safe_check_and_set(self.typeName.default_value, xmlNode, self.typeName.name)
-            self.blowEffectName.value = safe_check_and_set(self.blowEffectName.default_value,
-                                                           xmlNode,
-                                                           self.blowEffectName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class RadioManagerPrototypeInfo(PrototypeInfo):
@@ -1415,17 +1344,13 @@ class VehicleRecollectionPrototypeInfo(PrototypeInfo):
 
 
 class VehicleRolePrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("vehicleFiringRangeCoeff"),)
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.vehicleFiringRangeCoeff = AnnotatedValue(1.0, "FiringRangeCoeff", display_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            vehicleFiringRangeCoeff = read_from_xml_node(xmlNode, self.vehicleFiringRangeCoeff.name, do_not_warn=True)
-            if vehicleFiringRangeCoeff is not None:
-                self.vehicleFiringRangeCoeff.value = vehicleFiringRangeCoeff
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class VehicleRoleBarrierPrototypeInfo(VehicleRolePrototypeInfo):
@@ -1453,17 +1378,14 @@ class VehicleRoleMeatPrototypeInfo(VehicleRolePrototypeInfo):
 
 
 class VehicleRoleOppressorPrototypeInfo(VehicleRolePrototypeInfo):
+    FIELDS = (FieldSpec("oppressionShift", str.split, warn_if_missing=True),)
+
     def __init__(self, server):
         VehicleRolePrototypeInfo.__init__(self, server)
         self.oppressionShift = AnnotatedValue([], "OppressionShift", group_type=GroupType.PRIMARY,
                                               saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = VehicleRolePrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            oppressionShift = read_from_xml_node(xmlNode, self.oppressionShift.name)
-            self.oppressionShift.value = oppressionShift.split()
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = VehicleRolePrototypeInfo.get_etree_prototype(self)
@@ -1472,6 +1394,10 @@ class VehicleRoleOppressorPrototypeInfo(VehicleRolePrototypeInfo):
 
 
 class VehicleRolePendulumPrototypeInfo(VehicleRolePrototypeInfo):
+    FIELDS = (FieldSpec("oppressionShift", str.split, warn_if_missing=True),
+              FieldSpec("a", float, warn_if_missing=True),
+              FieldSpec("b", float, warn_if_missing=True))
+
     def __init__(self, server):
         VehicleRolePrototypeInfo.__init__(self, server)
         self.oppressionShift = AnnotatedValue([], "OppressionShift", group_type=GroupType.PRIMARY,
@@ -1479,18 +1405,7 @@ class VehicleRolePendulumPrototypeInfo(VehicleRolePrototypeInfo):
         self.a = AnnotatedValue(0.0, "A", group_type=GroupType.PRIMARY)
         self.b = AnnotatedValue(0.0, "B", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = VehicleRolePrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            oppressionShift = read_from_xml_node(xmlNode, self.oppressionShift.name)
-            self.oppressionShift.value = oppressionShift.split()
-            a_param = read_from_xml_node(xmlNode, self.a.name)
-            b_param = read_from_xml_node(xmlNode, self.b.name)
-            if a_param is not None:
-                self.a.value = float(a_param)
-            if b_param is not None:
-                self.b.value = float(b_param)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = VehicleRolePrototypeInfo.get_etree_prototype(self)
@@ -1544,6 +1459,9 @@ class NPCMotionControllerPrototypeInfo(PrototypeInfo):
 
 
 class TeamPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("decisionMatrixName", warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("removeWhenChildrenDead", bool, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.decisionMatrixNum = -1
@@ -1559,21 +1477,16 @@ class TeamPrototypeInfo(PrototypeInfo):
         self.isUpdating = AnnotatedValue(False, "IsUpdating", group_type=GroupType.SECONDARY)
         self.formationDistBetweenVehicles = AnnotatedValue(30.0, "DistBetweenVehicles", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.decisionMatrixName.value = read_from_xml_node(xmlNode, "DecisionMatrix")
-            self.removeWhenChildrenDead.value = parse_str_to_bool(self.removeWhenChildrenDead.default_value,
-                                                                  read_from_xml_node(xmlNode, "RemoveWhenChildrenDead",
-                                                                                     do_not_warn=True))
-            formation = child_from_xml_node(xmlNode, "Formation", do_not_warn=True)
-            if formation is not None:
-                self.formationPrototypeName.value = read_from_xml_node(formation, "Prototype")
-                distBetweenVehicles = read_from_xml_node(formation, "DistBetweenVehicles", do_not_warn=True)
-                if distBetweenVehicles is not None:
-                    self.overridesDistBetweenVehicles.value = True
-                    self.formationDistBetweenVehicles.value = float(distBetweenVehicles)
-            return STATUS_SUCCESS
+    def LoadFormationFromXML(self, xmlFile, xmlNode):
+        formation = child_from_xml_node(xmlNode, "Formation", do_not_warn=True)
+        if formation is not None:
+            self.formationPrototypeName.value = read_from_xml_node(formation, "Prototype")
+            distBetweenVehicles = read_from_xml_node(formation, "DistBetweenVehicles", do_not_warn=True)
+            if distBetweenVehicles is not None:
+                self.overridesDistBetweenVehicles.value = True
+                self.formationDistBetweenVehicles.value = float(distBetweenVehicles)
+
+    LoadFromXML = SchemaLoader(after=LoadFormationFromXML)
 
     def PostLoad(self, prototype_manager):
         self.formationPrototypeId = prototype_manager.GetPrototypeId(self.formationPrototypeName.value)
@@ -1592,6 +1505,10 @@ class TeamPrototypeInfo(PrototypeInfo):
 
 
 class CaravanTeamPrototypeInfo(TeamPrototypeInfo):
+    FIELDS = (FieldSpec("tradersGeneratorPrototypeName"),
+              FieldSpec("guardsGeneratorPrototypeName"),
+              FieldSpec("waresPrototypes", str.split))
+
     def __init__(self, server):
         TeamPrototypeInfo.__init__(self, server)
         self.tradersGeneratorPrototypeName = AnnotatedValue("", "TradersVehiclesGeneratorName",
@@ -1605,20 +1522,12 @@ class CaravanTeamPrototypeInfo(TeamPrototypeInfo):
         self.formationPrototypeName.value = TEAM_DEFAULT_FORMATION_PROTOTYPE
         self.formationPrototypeName.default_value = TEAM_DEFAULT_FORMATION_PROTOTYPE
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = TeamPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.tradersGeneratorPrototypeName.value = safe_check_and_set(self.tradersGeneratorPrototypeName.value,
-                                                                          xmlNode, "TradersVehiclesGeneratorName")
-            self.guardsGeneratorPrototypeName.value = safe_check_and_set(self.guardsGeneratorPrototypeName.value,
-                                                                         xmlNode, "GuardVehiclesGeneratorName")
-            waresPrototypes = read_from_xml_node(xmlNode, "WaresPrototypes", do_not_warn=True)
-            if waresPrototypes is not None:
-                self.waresPrototypes.value = waresPrototypes.split()
-            if self.tradersGeneratorPrototypeName.value is not None:
-                if self.waresPrototypes.value is None:
-                    logger.error(f"No wares for caravan with traders: {self.prototypeName.value}")
-            return STATUS_SUCCESS
+    def CheckWaresOfTraders(self, xmlFile, xmlNode):
+        if self.tradersGeneratorPrototypeName.value is not None:
+            if self.waresPrototypes.value is None:
+                logger.error(f"No wares for caravan with traders: {self.prototypeName.value}")
+
+    LoadFromXML = SchemaLoader(after=CheckWaresOfTraders)
 
     def PostLoad(self, prototype_manager):
         TeamPrototypeInfo.PostLoad(self, prototype_manager)
@@ -1639,6 +1548,9 @@ class CaravanTeamPrototypeInfo(TeamPrototypeInfo):
 
 
 class VagabondTeamPrototypeInfo(TeamPrototypeInfo):
+    FIELDS = (FieldSpec("vehiclesGeneratorPrototype", warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("waresPrototypes", str.split, warn_if_missing=True))
+
     def __init__(self, server):
         TeamPrototypeInfo.__init__(self, server)
         self.vehiclesGeneratorPrototype = AnnotatedValue("", "VehicleGeneratorPrototype",
@@ -1647,12 +1559,7 @@ class VagabondTeamPrototypeInfo(TeamPrototypeInfo):
                                               saving_type=SavingType.SPECIFIC)
         self.removeWhenChildrenDead = AnnotatedValue(True, "RemoveWhenChildrenDead", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = TeamPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.vehiclesGeneratorPrototype.value = read_from_xml_node(xmlNode, self.vehiclesGeneratorPrototype.name)
-            self.waresPrototypes.value = read_from_xml_node(xmlNode, self.waresPrototypes.name).split()
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = TeamPrototypeInfo.get_etree_prototype(self)
@@ -1661,6 +1568,8 @@ class VagabondTeamPrototypeInfo(TeamPrototypeInfo):
 
 
 class InfectionTeamPrototypeInfo(TeamPrototypeInfo):
+    FIELDS = (FieldSpec("vehiclesGeneratorProtoName", missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         TeamPrototypeInfo.__init__(self, server)
         self.items = AnnotatedValue([], "Vehicles", group_type=GroupType.PRIMARY,
@@ -1668,20 +1577,16 @@ class InfectionTeamPrototypeInfo(TeamPrototypeInfo):
         self.vehiclesGeneratorProtoName = AnnotatedValue("", "VehiclesGenerator", group_type=GroupType.PRIMARY)
         self.vehiclesGeneratorProtoId = -1
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = TeamPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.vehiclesGeneratorProtoName.value = safe_check_and_set(self.vehiclesGeneratorProtoName.default_value,
-                                                                       xmlNode,
-                                                                       self.vehiclesGeneratorProtoName.name)
-            vehicles = child_from_xml_node(xmlNode, "Vehicles", do_not_warn=True)
-            if vehicles is not None and len(vehicles.getchildren()) > 0:
-                check_mono_xml_node(vehicles, "Vehicle")
-                for vehicle in vehicles.iterchildren(tag="Vehicle"):
-                    item = {"protoName": read_from_xml_node(vehicle, "PrototypeName"),
-                            "count": int(read_from_xml_node(vehicle, "Count"))}
-                    self.items.value.append(item)
-            return STATUS_SUCCESS
+    def LoadVehiclesFromXML(self, xmlFile, xmlNode):
+        vehicles = child_from_xml_node(xmlNode, "Vehicles", do_not_warn=True)
+        if vehicles is not None and len(vehicles.getchildren()) > 0:
+            check_mono_xml_node(vehicles, "Vehicle")
+            for vehicle in vehicles.iterchildren(tag="Vehicle"):
+                item = {"protoName": read_from_xml_node(vehicle, "PrototypeName"),
+                        "count": int(read_from_xml_node(vehicle, "Count"))}
+                self.items.value.append(item)
+
+    LoadFromXML = SchemaLoader(after=LoadVehiclesFromXML)
 
     def PostLoad(self, prototype_manager):
         TeamPrototypeInfo.PostLoad(self, prototype_manager)
@@ -1713,6 +1618,14 @@ class InfectionTeamPrototypeInfo(TeamPrototypeInfo):
 
 
 class InfectionZonePrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("minDistToPlayer", float),
+              FieldSpec("criticalTeamDist", float),
+              FieldSpec("criticalTeamTime", float),
+              FieldSpec("blindTeamDist", float),
+              FieldSpec("blindTeamTime", float),
+              FieldSpec("dropOutSegmentAngle", int),
+              FieldSpec("dropOutTimeOut", float))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.minDistToPlayer = AnnotatedValue(100.0, "MinDistToPlayer", group_type=GroupType.PRIMARY)
@@ -1725,37 +1638,7 @@ class InfectionZonePrototypeInfo(PrototypeInfo):
         # DropOutTimeOut  # used in ai::InfectionZone::Registration()
         self.dropOutTimeOut = AnnotatedValue(0, "DropOutTimeOut", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            minDistToPlayer = read_from_xml_node(xmlNode, self.minDistToPlayer.name, do_not_warn=True)
-            if minDistToPlayer is not None:
-                self.minDistToPlayer.value = float(minDistToPlayer)
-
-            criticalTeamDist = read_from_xml_node(xmlNode, self.criticalTeamDist.name, do_not_warn=True)
-            if criticalTeamDist is not None:
-                self.criticalTeamDist.value = float(criticalTeamDist)
-
-            criticalTeamTime = read_from_xml_node(xmlNode, self.criticalTeamTime.name, do_not_warn=True)
-            if criticalTeamTime is not None:
-                self.criticalTeamTime.value = float(criticalTeamTime)
-
-            blindTeamDist = read_from_xml_node(xmlNode, self.blindTeamDist.name, do_not_warn=True)
-            if blindTeamDist is not None:
-                self.blindTeamDist.value = float(blindTeamDist)
-
-            blindTeamTime = read_from_xml_node(xmlNode, self.blindTeamTime.name, do_not_warn=True)
-            if blindTeamTime is not None:
-                self.blindTeamTime.value = float(blindTeamTime)
-
-            dropOutSegmentAngle = read_from_xml_node(xmlNode, self.dropOutSegmentAngle.name, do_not_warn=True)
-            if dropOutSegmentAngle is not None:
-                self.dropOutSegmentAngle.value = int(dropOutSegmentAngle)
-
-            dropOutTimeOut = read_from_xml_node(xmlNode, self.dropOutTimeOut.name, do_not_warn=True)
-            if dropOutTimeOut is not None:
-                self.dropOutTimeOut.value = float(dropOutTimeOut)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class VehiclesGeneratorPrototypeInfo(PrototypeInfo):
@@ -1917,6 +1800,9 @@ class VehiclesGeneratorPrototypeInfo(PrototypeInfo):
 
 
 class FormationPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("linearVelocity", float),
+              FieldSpec("angularVelocity", float))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.maxVehicles = 5
@@ -1929,20 +1815,6 @@ class FormationPrototypeInfo(PrototypeInfo):
         self.isUpdating = AnnotatedValue(False, "IsUpdating", group_type=GroupType.SECONDARY)
         self.angularVelocity = AnnotatedValue(0.5, "AngularVelocity", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            linearVelocity = read_from_xml_node(xmlNode, self.linearVelocity.name, do_not_warn=True)
-            if linearVelocity is not None:
-                self.linearVelocity.value = float(linearVelocity)
-
-            angularVelocity = read_from_xml_node(xmlNode, self.angularVelocity.name, do_not_warn=True)
-            if angularVelocity is not None:
-                self.angularVelocity.value = float(angularVelocity)
-
-            self.LoadPolylinePoints(xmlFile, xmlNode)
-            return STATUS_SUCCESS
-
     def PostLoad(self, prototype_manager):
         self.CalcPolylineLengths()
 
@@ -1963,8 +1835,8 @@ class FormationPrototypeInfo(PrototypeInfo):
     def LoadPolylinePoints(self, xmlFile, xmlNode):
         polyline = child_from_xml_node(xmlNode, "Polyline")
         if polyline is not None:
-            check_mono_xml_node(xmlNode["Polyline"], "Point")
-            for child in xmlNode["Polyline"].iterchildren(tag="Point"):
+            check_mono_xml_node(polyline, "Point")
+            for child in polyline.iterchildren(tag="Point"):
                 point = read_from_xml_node(child, "Coord").split()
                 if len(point) == 2:
                     point = {"x": float(point[0]),
@@ -1979,6 +1851,8 @@ class FormationPrototypeInfo(PrototypeInfo):
                     logger.error(f"Unexpected coordinate format for Formation {self.prototypeName.value}, "
                                  "expected two numbers")
 
+    LoadFromXML = SchemaLoader(after=LoadPolylinePoints)
+
     def get_etree_prototype(self):
         result = PrototypeInfo.get_etree_prototype(self)
 
@@ -1994,31 +1868,30 @@ class FormationPrototypeInfo(PrototypeInfo):
 
 
 class SettlementPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("vehiclesPrototypeName", missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.zoneInfos = []  # newer used
         self.vehiclesPrototypeId = -1
         self.vehiclesPrototypeName = AnnotatedValue("", "Vehicles", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            zone_info = self.AuxZoneInfo()
-            zone_info.action = read_from_xml_node(xmlNode, "action", do_not_warn=True)
-            offset = read_from_xml_node(xmlNode, "offset", do_not_warn=True)
-            if offset is not None:
-                offset = offset.split()
-                zone_info.offset["x"] = offset[0]
-                zone_info.offset["y"] = offset[1]
-                zone_info.offset["z"] = offset[2]
-            zone = read_from_xml_node(xmlNode, "zone", do_not_warn=True)
-            if zone is not None:
-                radius = read_from_xml_node(xmlNode["zone"], "radius", do_not_warn=True)
-                zone_info.radius = float(radius)
-                self.zoneInfos.append(zone_info)
-            self.vehiclesPrototypeName.value = safe_check_and_set(self.vehiclesPrototypeName.default_value, xmlNode,
-                                                                  self.vehiclesPrototypeName.name)
-            return STATUS_SUCCESS
+    def LoadZoneInfoFromXML(self, xmlFile, xmlNode):
+        zone_info = self.AuxZoneInfo()
+        zone_info.action = read_from_xml_node(xmlNode, "action", do_not_warn=True)
+        offset = read_from_xml_node(xmlNode, "offset", do_not_warn=True)
+        if offset is not None:
+            offset = offset.split()
+            zone_info.offset["x"] = offset[0]
+            zone_info.offset["y"] = offset[1]
+            zone_info.offset["z"] = offset[2]
+        zone = read_from_xml_node(xmlNode, "zone", do_not_warn=True)
+        if zone is not None:
+            radius = read_from_xml_node(child_from_xml_node(xmlNode, "zone"), "radius", do_not_warn=True)
+            zone_info.radius = float(radius)
+            self.zoneInfos.append(zone_info)
+
+    LoadFromXML = SchemaLoader(after=LoadZoneInfoFromXML)
 
     def PostLoad(self, prototype_manager):
         if self.vehiclesPrototypeName.value:
@@ -2040,6 +1913,17 @@ class InfectionLairPrototypeInfo(SettlementPrototypeInfo):
 
 
 class TownPrototypeInfo(SettlementPrototypeInfo):
+    FIELDS = (FieldSpec("musicName", missing=MISSING_DEFAULT),
+              FieldSpec("gateModelName", missing=MISSING_DEFAULT),
+              FieldSpec("maxDefenders", int, missing=MISSING_DEFAULT),
+              FieldSpec("gunGeneratorPrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("desiredGunsInWorkshop", int, missing=MISSING_DEFAULT, validator=is_non_negative),
+              FieldSpec("gunAffixGeneratorPrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("gunAffixesCount", int, missing=MISSING_DEFAULT, validator=is_non_negative),
+              FieldSpec("cabinsAndBasketsAffixGeneratorPrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("cabinsAndBasketsAffixesCount", int, missing=MISSING_DEFAULT, validator=is_non_negative),
+              FieldSpec("numCollisionLayersBelowVehicle", int, missing=MISSING_DEFAULT, validator=is_non_negative))
+
     def __init__(self, server):
         SettlementPrototypeInfo.__init__(self, server)
         self.musicName = AnnotatedValue("", "MusicName", group_type=GroupType.SECONDARY)
@@ -2064,67 +1948,32 @@ class TownPrototypeInfo(SettlementPrototypeInfo):
         self.gunAffixGeneratorPrototypeId = -1
         self.cabinsAndBasketsAffixGeneratorPrototypeId = -1
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SettlementPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("FROM_MODEL")
-            self.musicName.value = safe_check_and_set(self.musicName.default_value, xmlNode, self.musicName.name)
-            self.gateModelName.value = safe_check_and_set(self.gateModelName.default_value, xmlNode,
-                                                          self.gateModelName.name)
-            self.maxDefenders.value = safe_check_and_set(self.maxDefenders.default_value, xmlNode,
-                                                         self.maxDefenders.name, "int")
-            if self.maxDefenders.value > 5:
-                logger.error(f"For Town prototype '{self.prototypeName.value}' maxDefenders > MAX_VEHICLES_IN_TEAM (5)")
-            self.gunGeneratorPrototypeName.value = safe_check_and_set(self.gunGeneratorPrototypeName.default_value,
-                                                                      xmlNode, self.gunGeneratorPrototypeName.name)
-            desiredGunsInWorkshop = safe_check_and_set(self.desiredGunsInWorkshop.default_value, xmlNode,
-                                                       self.desiredGunsInWorkshop.name, "int")
-            if desiredGunsInWorkshop >= 0:
-                self.desiredGunsInWorkshop.value = desiredGunsInWorkshop
-            self.gunAffixGeneratorPrototypeName.value = safe_check_and_set(
-                self.gunAffixGeneratorPrototypeName.default_value, xmlNode,
-                self.gunAffixGeneratorPrototypeName.name)
-            gunAffixesCount = safe_check_and_set(self.gunAffixesCount.default_value, xmlNode,
-                                                 self.gunAffixesCount.name, "int")
-            if gunAffixesCount >= 0:
-                self.gunAffixesCount.value = gunAffixesCount
-            self.cabinsAndBasketsAffixGeneratorPrototypeName.value = safe_check_and_set(
-                self.cabinsAndBasketsAffixGeneratorPrototypeName.default_value,
-                xmlNode,
-                self.cabinsAndBasketsAffixGeneratorPrototypeName.name)
-            cabinsAndBasketsAffixesCount = safe_check_and_set(self.cabinsAndBasketsAffixesCount.default_value, xmlNode,
-                                                              self.cabinsAndBasketsAffixesCount.name, "int")
-            if cabinsAndBasketsAffixesCount >= 0:
-                self.cabinsAndBasketsAffixesCount.value = cabinsAndBasketsAffixesCount
-
-            numCollisionLayersBelowVehicle = safe_check_and_set(self.numCollisionLayersBelowVehicle.default_value,
-                                                                xmlNode,
-                                                                self.numCollisionLayersBelowVehicle.name, "int")
-            if numCollisionLayersBelowVehicle >= 0:
-                self.numCollisionLayersBelowVehicle.value = numCollisionLayersBelowVehicle
-            Article.LoadArticlesFromNode(self.articles.value, xmlFile, xmlNode, self.theServer.thePrototypeManager)
-            self.LoadFromXmlResourceIdToRandomCoeffMap(xmlFile, xmlNode)
-            return STATUS_SUCCESS
+    def LoadTradeDetailsFromXML(self, xmlFile, xmlNode):
+        self.SetGeomType("FROM_MODEL")
+        if self.maxDefenders.value > 5:
+            logger.error(f"For Town prototype '{self.prototypeName.value}' maxDefenders > MAX_VEHICLES_IN_TEAM (5)")
+        Article.LoadArticlesFromNode(self.articles.value, xmlFile, xmlNode, self.theServer.thePrototypeManager)
+        self.LoadFromXmlResourceIdToRandomCoeffMap(xmlFile, xmlNode)
+
+    LoadFromXML = SchemaLoader(after=LoadTradeDetailsFromXML)
 
     def LoadFromXmlResourceIdToRandomCoeffMap(self, xmlFile, xmlNode):
         # self.resourceIdToRandomCoeffMap = []
-        resource_coeffs = child_from_xml_node(xmlNode, "ResourceCoeff", do_not_warn=True)
-        if resource_coeffs is not None:
-            for resource_coeff_node in resource_coeffs:
-                newRandomCoeff = 1.0
-                newRandomCoeff_4 = 0.0
-                newRandomCoeff = safe_check_and_set(newRandomCoeff, resource_coeff_node, "Coeff", "float")
-                newRandomCoeff_4 = safe_check_and_set(newRandomCoeff_4, resource_coeff_node, "Dispersion", "float")
-                resourceName = safe_check_and_set("", resource_coeff_node, "Resource")
-                resourceId = self.theServer.theResourceManager.GetResourceId(resourceName)
-                if resourceId == -1:
-                    logger.error(f"Unknown resource name: {resourceName} for prot: {self.prototypeName.value}")
-                else:
-                    coeff = {"first": resourceId,
-                             "second": self.RandomCoeffWithDispersion()}
-                    coeff["second"].baseCoeff = newRandomCoeff
-                    coeff["second"].baseDispersion = newRandomCoeff_4
-                    self.resourceIdToRandomCoeffMap.value.append(coeff)
+        for resource_coeff_node in children_from_xml_node(xmlNode, "ResourceCoeff", do_not_warn=True):
+            newRandomCoeff = 1.0
+            newRandomCoeff_4 = 0.0
+            newRandomCoeff = safe_check_and_set(newRandomCoeff, resource_coeff_node, "Coeff", "float")
+            newRandomCoeff_4 = safe_check_and_set(newRandomCoeff_4, resource_coeff_node, "Dispersion", "float")
+            resourceName = safe_check_and_set("", resource_coeff_node, "Resource")
+            resourceId = self.theServer.theResourceManager.GetResourceId(resourceName)
+            if resourceId == -1:
+                logger.error(f"Unknown resource name: {resourceName} for prot: {self.prototypeName.value}")
+            else:
+                coeff = {"first": resourceId,
+                         "second": self.RandomCoeffWithDispersion()}
+                coeff["second"].baseCoeff = newRandomCoeff
+                coeff["second"].baseDispersion = newRandomCoeff_4
+                self.resourceIdToRandomCoeffMap.value.append(coeff)
 
     def PostLoad(self, prototype_manager):
         SettlementPrototypeInfo.PostLoad(self, prototype_manager)
@@ -2160,30 +2009,31 @@ class TownPrototypeInfo(SettlementPrototypeInfo):
 
 
 class LairPrototypeInfo(SettlementPrototypeInfo):
+    FIELDS = (FieldSpec("maxAttackers", int, missing=MISSING_DEFAULT),
+              FieldSpec("maxDefenders", int, missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         SettlementPrototypeInfo.__init__(self, server)
         self.maxAttackers = AnnotatedValue(1, "MaxAttackers", group_type=GroupType.SECONDARY)
         self.maxDefenders = AnnotatedValue(1, "MaxDefenders", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SettlementPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("BOX")
-            self.maxAttackers.value = safe_check_and_set(self.maxAttackers.default_value, xmlNode,
-                                                         self.maxAttackers.name, "int")
-            if self.maxAttackers.value > 5:
-                logger.error(f"Lair {self.prototypeName.value} attrib MaxAttackers: "
-                             f"{self.maxAttackers.value} is higher than permitted MAX_VEHICLES_IN_TEAM: 5")
-
-            self.maxDefenders.value = safe_check_and_set(self.maxDefenders.default_value, xmlNode,
-                                                         self.maxDefenders.name, "int")
-            if self.maxDefenders.value > 5:
-                logger.error(f"Lair {self.prototypeName.value} attrib MaxDefenders: "
-                             f"{self.maxDefenders.value} is higher than permitted MAX_VEHICLES_IN_TEAM: 5")
-            return STATUS_SUCCESS
+    def CheckTeamSizes(self, xmlFile, xmlNode):
+        self.SetGeomType("BOX")
+        if self.maxAttackers.value > 5:
+            logger.error(f"Lair {self.prototypeName.value} attrib MaxAttackers: "
+                         f"{self.maxAttackers.value} is higher than permitted MAX_VEHICLES_IN_TEAM: 5")
+        if self.maxDefenders.value > 5:
+            logger.error(f"Lair {self.prototypeName.value} attrib MaxDefenders: "
+                         f"{self.maxDefenders.value} is higher than permitted MAX_VEHICLES_IN_TEAM: 5")
+
+    LoadFromXML = SchemaLoader(after=CheckTeamSizes)
 
 
 class PlayerPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("engineModelName", str, warn_if_missing=True, missing=MISSING_NONE),
+              FieldSpec("skinNumber", int, validator=is_positive),
+              FieldSpec("cfgNumber", int, validator=is_positive))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.engineModelName = AnnotatedValue("", "ModelFile", group_type=GroupType.SECONDARY)
@@ -2191,22 +2041,7 @@ class PlayerPrototypeInfo(PrototypeInfo):
         self.cfgNumber = AnnotatedValue(0, "CfgNum", group_type=GroupType.SECONDARY)
         # ??? some magic with World SceneGraph
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.engineModelName.value = read_from_xml_node(xmlNode, self.engineModelName.name)
-            skinNum = read_from_xml_node(xmlNode, self.skinNumber.name, do_not_warn=True)
-            if skinNum is not None:
-                skinNum = int(skinNum)
-                if skinNum > 0:
-                    self.skinNumber.value = skinNum
-
-            cfgNum = read_from_xml_node(xmlNode, self.cfgNumber.name, do_not_warn=True)
-            if cfgNum is not None:
-                cfgNum = int(cfgNum)
-                if cfgNum > 0:
-                    self.cfgNumber.value = cfgNum
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class TriggerPrototypeInfo(PrototypeInfo):
@@ -2220,116 +2055,79 @@ class CinematicMoverPrototypeInfo(PrototypeInfo):
 
 
 class DynamicQuestPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("minReward", int, warn_if_missing=True),)
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.minReward = AnnotatedValue(0, "MinReward", group_type=GroupType.PRIMARY, saving_type=SavingType.REQUIRED)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            minReward = read_from_xml_node(xmlNode, "MinReward")
-            if minReward is not None:
-                self.minReward.value = int(minReward)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class DynamicQuestConvoyPrototypeInfo(DynamicQuestPrototypeInfo):
+    FIELDS = (FieldSpec("playerSchwarzPart", float, warn_if_missing=True),
+              FieldSpec("criticalDistFromPlayer", float, warn_if_missing=True),
+              FieldSpec("criticalTime", float, warn_if_missing=True))
+
     def __init__(self, server):
         DynamicQuestPrototypeInfo.__init__(self, server)
         self.playerSchwarzPart = AnnotatedValue(0.0, "PlayerSchwarzPart", group_type=GroupType.SECONDARY)
         self.criticalDistFromPlayer = AnnotatedValue(100.0, "CriticalDistFromPlayer", group_type=GroupType.SECONDARY)
         self.criticalTime = AnnotatedValue(20.0, "CriticalTime", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DynamicQuestPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            playerSchwarzPart = read_from_xml_node(xmlNode, self.playerSchwarzPart.name)
-            if playerSchwarzPart is not None:
-                self.playerSchwarzPart.value = float(playerSchwarzPart)
-
-            criticalDistFromPlayer = read_from_xml_node(xmlNode, self.criticalDistFromPlayer.name)
-            if criticalDistFromPlayer is not None:
-                self.criticalDistFromPlayer.value = float(criticalDistFromPlayer)
-
-            criticalTime = read_from_xml_node(xmlNode, self.criticalTime.name)
-            if criticalTime is not None:
-                self.criticalTime.value = float(criticalTime)
-
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class DynamicQuestDestroyPrototypeInfo(DynamicQuestPrototypeInfo):
+    FIELDS = (FieldSpec("targetSchwarzPart", float, warn_if_missing=True),)
+
     def __init__(self, server):
         DynamicQuestPrototypeInfo.__init__(self, server)
         self.targetSchwarzPart = AnnotatedValue(0.0, "TargetSchwarzPart", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DynamicQuestPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            targetSchwarzPart = read_from_xml_node(xmlNode, self.targetSchwarzPart.name)
-            if targetSchwarzPart is not None:
-                self.targetSchwarzPart.value = float(targetSchwarzPart)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class DynamicQuestHuntPrototypeInfo(DynamicQuestPrototypeInfo):
+    FIELDS = (FieldSpec("playerSchwarzPart", float, warn_if_missing=True),
+              FieldSpec("huntSeasonLength", float, warn_if_missing=True))
+
     def __init__(self, server):
         DynamicQuestPrototypeInfo.__init__(self, server)
         self.playerSchwarzPart = AnnotatedValue(0.0, "PlayerSchwarzPart", group_type=GroupType.SECONDARY)
         self.huntSeasonLength = AnnotatedValue(0.0, "HuntSeasonLength", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DynamicQuestPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            playerSchwarzPart = read_from_xml_node(xmlNode, self.playerSchwarzPart.name)
-            if playerSchwarzPart is not None:
-                self.playerSchwarzPart.value = float(playerSchwarzPart)
-
-            huntSeasonLength = read_from_xml_node(xmlNode, self.huntSeasonLength.name)
-            if huntSeasonLength is not None:
-                self.huntSeasonLength.value = float(huntSeasonLength)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class DynamicQuestPeacePrototypeInfo(DynamicQuestPrototypeInfo):
+    FIELDS = (FieldSpec("playerMoneyPart", float, warn_if_missing=True),)
+
     def __init__(self, server):
         DynamicQuestPrototypeInfo.__init__(self, server)
         self.playerMoneyPart = AnnotatedValue(0.0, "PlayerMoneyPart", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DynamicQuestPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            playerMoneyPart = read_from_xml_node(xmlNode, self.playerMoneyPart.name)
-            if playerMoneyPart is not None:
-                self.playerMoneyPart.value = float(playerMoneyPart)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class DynamicQuestReachPrototypeInfo(DynamicQuestPrototypeInfo):
+    FIELDS = (FieldSpec("playerSchwarzPart", float, warn_if_missing=True),)
+
     def __init__(self, server):
         DynamicQuestPrototypeInfo.__init__(self, server)
         self.playerSchwarzPart = AnnotatedValue(0.0, "PlayerSchwarzPart", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DynamicQuestPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            playerSchwarzPart = read_from_xml_node(xmlNode, self.playerSchwarzPart.name)
-            if playerSchwarzPart is not None:
-                self.playerSchwarzPart.value = float(playerSchwarzPart)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class SgNodeObjPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("engineModelName", missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.engineModelName = AnnotatedValue("", "ModelFile", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.engineModelName.value = safe_check_and_set(self.engineModelName.default_value, xmlNode,
-                                                            self.engineModelName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class LightObjPrototypeInfo(SgNodeObjPrototypeInfo):
@@ -2351,7 +2149,7 @@ class BossArmPrototypeInfo(VehiclePartPrototypeInfo):
         self.attacks = AnnotatedValue([], "AttackActions", group_type=GroupType.SECONDARY,
                                       saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
+    def LoadFromXML(self, xmlFile, xmlNode: etree._Element):
         result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
         if result == STATUS_SUCCESS:
             turningSpeed = read_from_xml_node(xmlNode, "TurningSpeed", do_not_warn=True)
@@ -2415,6 +2213,12 @@ class BossArmPrototypeInfo(VehiclePartPrototypeInfo):
 
 
 class Boss02ArmPrototypeInfo(BossArmPrototypeInfo):
+    FIELDS = (FieldSpec("frameToPickUpContainerForBlock", int),
+              FieldSpec("frameToReleaseContainerForBlock", int),
+              FieldSpec("frameToPickUpContainerForDie", int),
+              FieldSpec("frameToReleaseContainerForDie", int),
+              FieldSpec("blockingContainerPrototypeName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         BossArmPrototypeInfo.__init__(self, server)
         self.frameToPickUpContainerForBlock = AnnotatedValue(0, "FrameToPickUpContainerForBlock",
@@ -2432,39 +2236,15 @@ class Boss02ArmPrototypeInfo(BossArmPrototypeInfo):
         self.blockingContainerPrototypeId = -1
         self.blockingContainerPrototypeName = AnnotatedValue("", "ContainerPrototype", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
-        result = BossArmPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            frameToPickUpContainerForBlock = read_from_xml_node(xmlNode, "FrameToPickUpContainerForBlock",
-                                                                do_not_warn=True)
-            if frameToPickUpContainerForBlock is not None:
-                self.frameToPickUpContainerForBlock.value = int(frameToPickUpContainerForBlock)
-
-            frameToReleaseContainerForBlock = read_from_xml_node(xmlNode, "FrameToReleaseContainerForBlock",
-                                                                 do_not_warn=True)
-            if frameToReleaseContainerForBlock is not None:
-                self.frameToReleaseContainerForBlock.value = int(frameToReleaseContainerForBlock)
-
-            frameToPickUpContainerForDie = read_from_xml_node(xmlNode, "FrameToPickUpContainerForDie",
-                                                              do_not_warn=True)
-            if frameToPickUpContainerForDie is not None:
-                self.frameToPickUpContainerForDie.value = int(frameToPickUpContainerForDie)
-
-            frameToReleaseContainerForDie = read_from_xml_node(xmlNode, "FrameToReleaseContainerForDie",
-                                                               do_not_warn=True)
-            if frameToReleaseContainerForDie is not None:
-                self.frameToReleaseContainerForDie.value = int(frameToReleaseContainerForDie)
-
-            actionForBlock = read_from_xml_node(xmlNode, "ActionForBlock")
-            self.actionForBlock.value = GetActionByName(actionForBlock)
-
-            actionForDie = read_from_xml_node(xmlNode, "ActionForDie")
-            self.actionForDie.value = GetActionByName(actionForDie)
-
-            self.blockingContainerPrototypeName.value = \
-                safe_check_and_set(self.blockingContainerPrototypeName.default_value,
-                                   xmlNode, "ContainerPrototype")
-            return STATUS_SUCCESS
+    def LoadActionsFromXML(self, xmlFile, xmlNode: etree._Element):
+        # missing actions are unknown ones
+        actionForBlock = read_from_xml_node(xmlNode, "ActionForBlock")
+        self.actionForBlock.value = GetActionByName(actionForBlock)
+
+        actionForDie = read_from_xml_node(xmlNode, "ActionForDie")
+        self.actionForDie.value = GetActionByName(actionForDie)
+
+    LoadFromXML = SchemaLoader(after=LoadActionsFromXML)
 
     def PostLoad(self, prototype_manager):
         self.blockingContainerPrototypeId = prototype_manager.GetPrototypeId(self.blockingContainerPrototypeName.value)
@@ -2576,6 +2356,10 @@ class BossMetalArmPrototypeInfo(SimplePhysicObjPrototypeInfo):
 
 
 class BossMetalArmLoadPrototypeInfo(DummyObjectPrototypeInfo):
+    FIELDS = (FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT),
+              FieldSpec("explosionEffectName", missing=MISSING_DEFAULT),
+              FieldSpec("maxHealth", float, warn_if_missing=True))
+
     def __init__(self, server):
         DummyObjectPrototypeInfo.__init__(self, server)
         self.blastWavePrototypeId = -1
@@ -2584,18 +2368,7 @@ class BossMetalArmLoadPrototypeInfo(DummyObjectPrototypeInfo):
         self.blastWavePrototypeName = AnnotatedValue("", "BlastWavePrototype", group_type=GroupType.SECONDARY)
         self.isUpdating = AnnotatedValue(True, "IsUpdating", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DummyObjectPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value, xmlNode,
-                                                                   "BlastWavePrototype")
-            self.explosionEffectName.value = safe_check_and_set(self.explosionEffectName.default_value, xmlNode,
-                                                                "ExplosionEffect")
-
-            maxHealth = read_from_xml_node(xmlNode, "MaxHealth")
-            if maxHealth is not None:
-                self.maxHealth.value = float(maxHealth)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def PostLoad(self, prototype_manager):
         self.blastWavePrototypeId = prototype_manager.GetPrototypeId(self.blastWavePrototypeName.value)
@@ -2612,41 +2385,29 @@ class Boss04PartPrototypeInfo(VehiclePartPrototypeInfo):
 
 
 class Boss04DronePrototypeInfo(ComplexPhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("maxLinearVelocity", float, warn_if_missing=True),)
+
     def __init__(self, server):
         ComplexPhysicObjPrototypeInfo.__init__(self, server)
         self.maxLinearVelocity = AnnotatedValue(0.0, "MaxLinearVelocity", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ComplexPhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            maxLinearVelocity = read_from_xml_node(xmlNode, "MaxLinearVelocity")
-            if maxLinearVelocity is not None:
-                self.maxLinearVelocity.value = float(maxLinearVelocity)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class Boss04StationPartPrototypeInfo(VehiclePartPrototypeInfo):
+    FIELDS = (FieldSpec("strCriticalMeshGroups", str.split),)
+
     def __init__(self, server):
         VehiclePartPrototypeInfo.__init__(self, server)
         self.criticalMeshGroupIds = []
         self.collisionTrimeshAllowed = AnnotatedValue(False, "CollisionTrimeshAllowed",
                                                       group_type=GroupType.SECONDARY)
         self.maxHealth = 0.0
-        # custom value, only created and used in RefreshFromXml in original
+        # custom value, only created and used in RefreshFromXml in original, loaded by schema here
         self.strCriticalMeshGroups = AnnotatedValue("", "CriticalMeshGroups", group_type=GroupType.SECONDARY,
                                                     saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        # custom implementation. Originally called from PrototypeManager -> RefreshFromXml
-        result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.RefreshFromXml(xmlFile, xmlNode)
-            return STATUS_SUCCESS
-
-    def RefreshFromXml(self, xmlFile, xmlNode):
-        strCriticalMeshGroups = read_from_xml_node(xmlNode, "CriticalMeshGroups", do_not_warn=True)
-        if strCriticalMeshGroups is not None:
-            self.strCriticalMeshGroups.value = strCriticalMeshGroups.split()
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = VehiclePartPrototypeInfo.get_etree_prototype(self)
@@ -2734,6 +2495,21 @@ class AnimatedComplexPhysicObjPrototypeInfo(ComplexPhysicObjPrototypeInfo):
 
 
 class Boss03PrototypeInfo(ComplexPhysicObjPrototypeInfo):
+    # experimental do_not_warn for drones, velocities and accelerations
+    FIELDS = (FieldSpec("dronePrototypeNames", str.split, warn_if_missing=True),
+              FieldSpec("maxDrones", int),
+              FieldSpec("maxHealth", float),
+              FieldSpec("maxHorizAngularVelocity", float),
+              FieldSpec("horizAngularAcceleration", float),
+              FieldSpec("maxVertAngularVelocity", float),
+              FieldSpec("vertAngularAcceleration", float),
+              FieldSpec("maxLinearVelocity", float),
+              FieldSpec("linearAcceleration", float),
+              FieldSpec("pathTrackTiltAngle", _degrees_to_radians, warn_if_missing=True),
+              FieldSpec("maxShootingTime", float, warn_if_missing=True),
+              FieldSpec("defaultHover", float, warn_if_missing=True),
+              FieldSpec("hoverForPlacingDrones", float, warn_if_missing=True))
+
     def __init__(self, server):
         AnimatedComplexPhysicObjPrototypeInfo.__init__(self, server)
         self.dronePrototypeNames = AnnotatedValue([], "DronePrototypes", group_type=GroupType.PRIMARY,
@@ -2755,67 +2531,7 @@ class Boss03PrototypeInfo(ComplexPhysicObjPrototypeInfo):
         self.defaultHover = AnnotatedValue(10.0, "DefaultHover", group_type=GroupType.SECONDARY)
         self.hoverForPlacingDrones = AnnotatedValue(10.0, "HoverForPlacingDrones", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ComplexPhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.dronePrototypeNames.value = read_from_xml_node(xmlNode, "DronePrototypes").split()
-            # experimental do_not_warn
-            maxDrones = read_from_xml_node(xmlNode, "MaxDrones", do_not_warn=True)
-            if maxDrones is not None:
-                self.maxDrones.value = int(maxDrones)
-
-            # experimental do_not_warn
-            maxHealth = read_from_xml_node(xmlNode, "MaxHealth", do_not_warn=True)
-            if maxHealth is not None:
-                self.maxHealth.value = float(maxHealth)
-
-            # experimental do_not_warn
-            maxHorizAngularVelocity = read_from_xml_node(xmlNode, "MaxHorizAngularVelocity", do_not_warn=True)
-            if maxHorizAngularVelocity is not None:
-                self.maxHorizAngularVelocity.value = float(maxHorizAngularVelocity)
-
-            # experimental do_not_warn
-            horizAngularAcceleration = read_from_xml_node(xmlNode, "HorizAngularAcceleration", do_not_warn=True)
-            if horizAngularAcceleration is not None:
-                self.horizAngularAcceleration.value = float(horizAngularAcceleration)
-
-            # experimental do_not_warn
-            maxVertAngularVelocity = read_from_xml_node(xmlNode, "MaxVertAngularVelocity", do_not_warn=True)
-            if maxVertAngularVelocity is not None:
-                self.maxVertAngularVelocity.value = float(maxVertAngularVelocity)
-
-            # experimental do_not_warn
-            vertAngularAcceleration = read_from_xml_node(xmlNode, "VertAngularAcceleration", do_not_warn=True)
-            if vertAngularAcceleration is not None:
-                self.vertAngularAcceleration.value = float(vertAngularAcceleration)
-
-            # experimental do_not_warn
-            maxLinearVelocity = read_from_xml_node(xmlNode, "MaxLinearVelocity", do_not_warn=True)
-            if maxLinearVelocity is not None:
-                self.maxLinearVelocity.value = float(maxLinearVelocity)
-
-            # experimental do_not_warn
-            linearAcceleration = read_from_xml_node(xmlNode, "LinearAcceleration", do_not_warn=True)
-            if linearAcceleration is not None:
-                self.linearAcceleration.value = float(linearAcceleration)
-
-            pathTrackTiltAngle = read_from_xml_node(xmlNode, "PathTrackTiltAngle")
-            if pathTrackTiltAngle is not None:
-                self.pathTrackTiltAngle.value = float(pathTrackTiltAngle) * pi / 180  # 0.017453292
-
-            maxShootingTime = read_from_xml_node(xmlNode, "MaxShootingTime")
-            if maxShootingTime is not None:
-                self.maxShootingTime.value = float(maxShootingTime)
-
-            defaultHover = read_from_xml_node(xmlNode, "DefaultHover")
-            if defaultHover is not None:
-                self.defaultHover.value = float(defaultHover)
-
-            hoverForPlacingDrones = read_from_xml_node(xmlNode, "HoverForPlacingDrones")
-            if hoverForPlacingDrones is not None:
-                self.hoverForPlacingDrones.value = float(hoverForPlacingDrones)
-
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def PostLoad(self, prototype_manager):
         ComplexPhysicObjPrototypeInfo.PostLoad(self, prototype_manager)
@@ -2892,32 +2608,30 @@ class Boss04PrototypeInfo(ComplexPhysicObjPrototypeInfo):
 
 
 class BlastWavePrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("waveForceIntensity", float, warn_if_missing=True),
+              FieldSpec("waveDamageIntensity", float, warn_if_missing=True),
+              FieldSpec("effectName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.waveForceIntensity = AnnotatedValue(0.0, "WaveForceIntensity", group_type=GroupType.PRIMARY)
         self.waveDamageIntensity = AnnotatedValue(0.0, "WaveDamageIntensity", group_type=GroupType.PRIMARY)
         self.effectName = AnnotatedValue("", "Effect", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("SPHERE")
-            waveForceIntensity = read_from_xml_node(xmlNode, "WaveForceIntensity")
-            if waveForceIntensity is not None:
-                self.waveForceIntensity.value = float(waveForceIntensity)
+    def SetUpGeometry(self, xmlFile, xmlNode):
+        self.SetGeomType("SPHERE")
 
-            waveDamageIntensity = read_from_xml_node(xmlNode, "WaveDamageIntensity")
-            if waveDamageIntensity is not None:
-                self.waveDamageIntensity.value = float(waveDamageIntensity)
-
-            self.effectName.value = safe_check_and_set(self.effectName.default_value, xmlNode, "Effect")
-            return STATUS_SUCCESS
-
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
+    LoadFromXML = SchemaLoader(after=SetUpGeometry)
 
 
 class BulletLauncherPrototypeInfo(GunPrototypeInfo):
+    # groupingAngle implemented partially. Check ai::BulletLauncherPrototypeInfo::LoadFromXML
+    FIELDS = (FieldSpec("groupingAngle", _grouping_angle_to_radians),
+              FieldSpec("numBulletsInShot", int),
+              FieldSpec("tracerRange", int),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_NONE),
+              FieldSpec("tracerEffectName", missing=MISSING_NONE))
+
     def __init__(self, server):
         GunPrototypeInfo.__init__(self, server)
         self.groupingAngle = AnnotatedValue(0.0, "GroupingAngle", group_type=GroupType.SECONDARY,
@@ -2930,26 +2644,7 @@ class BulletLauncherPrototypeInfo(GunPrototypeInfo):
         self.damageType = AnnotatedValue(0, "DamageType", group_type=GroupType.PRIMARY,
                                          saving_type=SavingType.SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = GunPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            # groupingAngle implemented partially. Check ai::BulletLauncherPrototypeInfo::LoadFromXML
-            groupingAngle = read_from_xml_node(xmlNode, self.groupingAngle.name, do_not_warn=True)
-            if groupingAngle is not None:
-                self.groupingAngle.value = float(groupingAngle)
-                self.groupingAngle.value = (self.groupingAngle.value * 0.017453292) * 0.5
-
-            numBulletsInShot = read_from_xml_node(xmlNode, self.numBulletsInShot.name, do_not_warn=True)
-            if numBulletsInShot is not None:
-                self.numBulletsInShot.value = int(numBulletsInShot)
-
-            tracerRange = read_from_xml_node(xmlNode, self.tracerRange.name, do_not_warn=True)
-            if tracerRange is not None:
-                self.tracerRange.value = int(tracerRange)
-
-            self.blastWavePrototypeName.value = read_from_xml_node(xmlNode, self.blastWavePrototypeName.name, True)
-            self.tracerEffectName.value = read_from_xml_node(xmlNode, self.tracerEffectName.name, True)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = GunPrototypeInfo.get_etree_prototype(self)
@@ -2966,16 +2661,13 @@ class CompoundVehiclePartPrototypeInfo(VehiclePartPrototypeInfo):
     def LoadFromXML(self, xmlFile, xmlNode):
         result = VehiclePartPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
         if result == STATUS_SUCCESS:
-            parts_description_nodes = child_from_xml_node(xmlNode, "Part", do_not_warn=True)
-            if parts_description_nodes is not None:
-                descriptions_number = len(parts_description_nodes)
-                for i in range(descriptions_number):
-                    part_node = parts_description_nodes[i]
-                    new_part = self.TPartInfo()
-                    part_id = safe_check_and_set(new_part.prototypeId, part_node, "id")
-                    new_part.prototypeName = safe_check_and_set(new_part.prototypeName, part_node, "Prototype")
-                    new_part.index = i
-                    self.partInfo.value[part_id] = new_part
+            parts_description_nodes = children_from_xml_node(xmlNode, "Part", do_not_warn=True)
+            for i, part_node in enumerate(parts_description_nodes):
+                new_part = self.TPartInfo()
+                part_id = safe_check_and_set(new_part.prototypeId, part_node, "id")
+                new_part.prototypeName = safe_check_and_set(new_part.prototypeName, part_node, "Prototype")
+                new_part.index = i
+                self.partInfo.value[part_id] = new_part
             return STATUS_SUCCESS
 
     def PostLoad(self, prototype_manager):
@@ -3005,6 +2697,8 @@ class CompoundGunPrototypeInfo(CompoundVehiclePartPrototypeInfo):
 
 
 class RocketLauncherPrototypeInfo(GunPrototypeInfo):
+    FIELDS = (FieldSpec("withAngleLimit", bool, missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         GunPrototypeInfo.__init__(self, server)
         self.withAngleLimit = AnnotatedValue(True, "WithAngleLimit", group_type=GroupType.PRIMARY)
@@ -3013,32 +2707,23 @@ class RocketLauncherPrototypeInfo(GunPrototypeInfo):
                                          saving_type=SavingType.SPECIFIC)
         self.withShellsPoolLimit = AnnotatedValue(True, "WithShellsPoolLimit", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = GunPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.withAngleLimit.value = parse_str_to_bool(self.withAngleLimit.default_value,
-                                                          read_from_xml_node(xmlNode,
-                                                                             self.withAngleLimit.name,
-                                                                             do_not_warn=True))
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class RocketVolleyLauncherPrototypeInfo(RocketLauncherPrototypeInfo):
+    FIELDS = (FieldSpec("actionDist", float, warn_if_missing=True),)
+
     def __init__(self, server):
         RocketLauncherPrototypeInfo.__init__(self, server)
         self.actionDist = AnnotatedValue(0.0, "ActionDist", group_type=GroupType.PRIMARY)
         self.withShellsPoolLimit = AnnotatedValue(True, "WithShellsPoolLimit", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = GunPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            actionDist = read_from_xml_node(xmlNode, self.actionDist.name)
-            if actionDist is not None:
-                self.actionDist.value = float(actionDist)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class ThunderboltLauncherPrototypeInfo(GunPrototypeInfo):
+    FIELDS = (FieldSpec("actionDist", float, warn_if_missing=True),)
+
     def __init__(self, server):
         GunPrototypeInfo.__init__(self, server)
         # damageType save and load implemented in parrent
@@ -3047,13 +2732,7 @@ class ThunderboltLauncherPrototypeInfo(GunPrototypeInfo):
         self.withShellsPoolLimit = AnnotatedValue(True, "WithShellsPoolLimit", group_type=GroupType.PRIMARY)
         self.actionDist = AnnotatedValue(0.0, "ActionDist", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = GunPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            actionDist = read_from_xml_node(xmlNode, self.actionDist.name)
-            if actionDist is not None:
-                self.actionDist.value = float(actionDist)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class PlasmaBunchLauncherPrototypeInfo(GunPrototypeInfo):
@@ -3068,6 +2747,8 @@ class PlasmaBunchLauncherPrototypeInfo(GunPrototypeInfo):
 
 
 class MortarPrototypeInfo(GunPrototypeInfo):
+    FIELDS = (FieldSpec("initialVelocity", float, warn_if_missing=True),)
+
     def __init__(self, server):
         GunPrototypeInfo.__init__(self, server)
         # damageType save and load implemented in parrent
@@ -3076,13 +2757,7 @@ class MortarPrototypeInfo(GunPrototypeInfo):
         self.withShellsPoolLimit = AnnotatedValue(True, "WithShellsPoolLimit", group_type=GroupType.PRIMARY)
         self.initialVelocity = AnnotatedValue(50.0, "InitialVelocity", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = GunPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            initialVelocity = read_from_xml_node(xmlNode, self.initialVelocity.name)
-            if initialVelocity is not None:
-                self.initialVelocity.value = float(initialVelocity)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class MortarVolleyLauncherPrototypeInfo(MortarPrototypeInfo):
@@ -3104,22 +2779,15 @@ class MinePusherPrototypeInfo(GunPrototypeInfo):
 
 
 class TurboAccelerationPusherPrototypeInfo(GunPrototypeInfo):
+    FIELDS = (FieldSpec("accelerationValue", float, warn_if_missing=True),
+              FieldSpec("accelerationTime", float, warn_if_missing=True))
+
     def __init__(self, server):
         GunPrototypeInfo.__init__(self, server)
         self.accelerationValue = AnnotatedValue(1.0, "AccelerationValue", group_type=GroupType.PRIMARY)
         self.accelerationTime = AnnotatedValue(0.0, "AccelerationTime", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = GunPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            accelerationValue = read_from_xml_node(xmlNode, self.accelerationValue.name)
-            if accelerationValue is not None:
-                self.accelerationValue.value = float(accelerationValue)
-
-            accelerationTime = read_from_xml_node(xmlNode, self.accelerationTime.name)
-            if accelerationTime is not None:
-                self.accelerationTime.value = float(accelerationTime)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class ShellPrototypeInfo(SimplePhysicObjPrototypeInfo):
@@ -3128,6 +2796,12 @@ class ShellPrototypeInfo(SimplePhysicObjPrototypeInfo):
 
 
 class RocketPrototypeInfo(ShellPrototypeInfo):
+    FIELDS = (FieldSpec("velocity", float, warn_if_missing=True),
+              FieldSpec("acceleration", float, warn_if_missing=True),
+              FieldSpec("minTurningRadius", float, warn_if_missing=True),
+              FieldSpec("flyTime", float, warn_if_missing=True),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         ShellPrototypeInfo.__init__(self, server)
         self.velocity = AnnotatedValue(1.0, "Velocity", group_type=GroupType.PRIMARY)
@@ -3137,30 +2811,10 @@ class RocketPrototypeInfo(ShellPrototypeInfo):
         self.blastWavePrototypeId = -1
         self.blastWavePrototypeName = AnnotatedValue("", "BlastWavePrototype", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ShellPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
+    def SetUpGeometry(self, xmlFile, xmlNode):
         self.SetGeomType("BOX")
-        if result == STATUS_SUCCESS:
-            velocity = read_from_xml_node(xmlNode, self.velocity.name)
-            if velocity is not None:
-                self.velocity.value = float(velocity)
-
-            acceleration = read_from_xml_node(xmlNode, self.acceleration.name)
-            if acceleration is not None:
-                self.acceleration.value = float(acceleration)
 
-            minTurningRadius = read_from_xml_node(xmlNode, self.minTurningRadius.name)
-            if minTurningRadius is not None:
-                self.minTurningRadius.value = float(minTurningRadius)
-
-            flyTime = read_from_xml_node(xmlNode, self.flyTime.name)
-            if flyTime is not None:
-                self.flyTime.value = float(flyTime)
-
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value,
-                                                                   xmlNode,
-                                                                   self.blastWavePrototypeName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader(after=SetUpGeometry)
 
     def PostLoad(self, prototype_manager):
         if self.blastWavePrototypeName.value:
@@ -3171,6 +2825,11 @@ class RocketPrototypeInfo(ShellPrototypeInfo):
 
 
 class PlasmaBunchPrototypeInfo(ShellPrototypeInfo):
+    FIELDS = (FieldSpec("velocity", float, warn_if_missing=True),
+              FieldSpec("acceleration", float, warn_if_missing=True),
+              FieldSpec("flyTime", float, warn_if_missing=True),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         ShellPrototypeInfo.__init__(self, server)
         self.velocity = AnnotatedValue(1.0, "Velocity", group_type=GroupType.PRIMARY)
@@ -3179,25 +2838,7 @@ class PlasmaBunchPrototypeInfo(ShellPrototypeInfo):
         self.blastWavePrototypeName = AnnotatedValue("", "BlastWavePrototype", group_type=GroupType.PRIMARY)
         self.blastWavePrototypeId = -1
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ShellPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            velocity = read_from_xml_node(xmlNode, self.velocity.name)
-            if velocity is not None:
-                self.velocity.value = float(velocity)
-
-            acceleration = read_from_xml_node(xmlNode, self.acceleration.name)
-            if acceleration is not None:
-                self.acceleration.value = float(acceleration)
-
-            flyTime = read_from_xml_node(xmlNode, self.flyTime.name)
-            if flyTime is not None:
-                self.flyTime.value = float(flyTime)
-
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value,
-                                                                   xmlNode,
-                                                                   self.blastWavePrototypeName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def PostLoad(self, prototype_manager):
         if self.blastWavePrototypeName.value:
@@ -3208,6 +2849,9 @@ class PlasmaBunchPrototypeInfo(ShellPrototypeInfo):
 
 
 class MortarShellPrototypeInfo(ShellPrototypeInfo):
+    FIELDS = (FieldSpec("flyTime", float, warn_if_missing=True),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         ShellPrototypeInfo.__init__(self, server)
         self.velocity = 1.0
@@ -3216,17 +2860,7 @@ class MortarShellPrototypeInfo(ShellPrototypeInfo):
         self.blastWavePrototypeName = AnnotatedValue("", "BlastWavePrototype", group_type=GroupType.PRIMARY)
         self.blastWavePrototypeId = -1
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ShellPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            flyTime = read_from_xml_node(xmlNode, self.flyTime.name)
-            if flyTime is not None:
-                self.flyTime.value = float(flyTime)
-
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value,
-                                                                   xmlNode,
-                                                                   self.blastWavePrototypeName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def PostLoad(self, prototype_manager):
         if self.blastWavePrototypeName.value:
@@ -3237,25 +2871,23 @@ class MortarShellPrototypeInfo(ShellPrototypeInfo):
 
 
 class MinePrototypeInfo(RocketPrototypeInfo):
+    FIELDS = (FieldSpec("TTL", float, warn_if_missing=True),
+              FieldSpec("timeForActivation", float, warn_if_missing=True))
+
     def __init__(self, server):
         RocketPrototypeInfo.__init__(self, server)
         self.TTL = AnnotatedValue(100.0, "TTL", group_type=GroupType.SECONDARY)
         self.timeForActivation = AnnotatedValue(0.0, "TimeForActivation", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = RocketPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            TTL = read_from_xml_node(xmlNode, self.TTL.name)
-            if TTL is not None:
-                self.TTL.value = float(TTL)
-
-            timeForActivation = read_from_xml_node(xmlNode, self.timeForActivation.name)
-            if timeForActivation is not None:
-                self.timeForActivation.value = float(timeForActivation)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class ThunderboltPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("flyTime", float, warn_if_missing=True),
+              FieldSpec("damage", float),
+              FieldSpec("averageSegmentLength", float, warn_if_missing=True),
+              FieldSpec("effectName", str, warn_if_missing=True, missing=MISSING_NONE))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.flyTime = AnnotatedValue(1.0, "FlyTime", group_type=GroupType.SECONDARY)
@@ -3263,23 +2895,7 @@ class ThunderboltPrototypeInfo(PrototypeInfo):
         self.averageSegmentLength = AnnotatedValue(0.1, "AverageSegmentLength", group_type=GroupType.SECONDARY)
         self.effectName = AnnotatedValue("", "Effect", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            flyTime = read_from_xml_node(xmlNode, self.flyTime.name)
-            if flyTime is not None:
-                self.flyTime.value = float(flyTime)
-
-            damage = read_from_xml_node(xmlNode, self.damage.name, do_not_warn=True)
-            if damage is not None:
-                self.damage.value = float(damage)
-
-            averageSegmentLength = read_from_xml_node(xmlNode, self.averageSegmentLength.name)
-            if averageSegmentLength is not None:
-                self.averageSegmentLength.value = float(averageSegmentLength)
-
-            self.effectName.value = read_from_xml_node(xmlNode, self.effectName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def PostLoad(self, prototype_manager):
         if self.averageSegmentLength.value < 0.01:
@@ -3290,33 +2906,24 @@ class BulletPrototypeInfo(ShellPrototypeInfo):
     def __init__(self, server):
         ShellPrototypeInfo.__init__(self, server)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ShellPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("RAY")
-            return STATUS_SUCCESS
+    def SetUpRayGeometry(self, xmlFile, xmlNode):
+        self.SetGeomType("RAY")
+
+    LoadFromXML = SchemaLoader(after=SetUpRayGeometry)
 
 
 class TemporaryLocationPrototypeInfo(LocationPrototypeInfo):
+    FIELDS = (FieldSpec("TTL", float, warn_if_missing=True),
+              FieldSpec("timeForActivation", float, warn_if_missing=True),
+              FieldSpec("effectName", str, warn_if_missing=True, missing=MISSING_NONE))
+
     def __init__(self, server):
         LocationPrototypeInfo.__init__(self, server)
         self.TTL = AnnotatedValue(0.0, "TTL", group_type=GroupType.SECONDARY)
         self.timeForActivation = AnnotatedValue(0.0, "ActivateTime", group_type=GroupType.SECONDARY)
         self.effectName = AnnotatedValue(False, "Effect", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = LocationPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            TTL = read_from_xml_node(xmlNode, self.TTL.name)
-            if TTL is not None:
-                self.TTL.value = float(TTL)
-
-            timeForActivation = read_from_xml_node(xmlNode, self.timeForActivation.name)
-            if timeForActivation is not None:
-                self.timeForActivation.value = float(timeForActivation)
-
-            self.effectName.value = read_from_xml_node(xmlNode, self.effectName.name)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class NailLocationPrototypeInfo(TemporaryLocationPrototypeInfo):
@@ -3335,6 +2942,11 @@ class EngineOilLocationPrototypeInfo(TemporaryLocationPrototypeInfo):
 
 
 class SubmarinePrototypeInfo(DummyObjectPrototypeInfo):
+    FIELDS = (FieldSpec("maxLinearVelocity", _kmh_to_ms, warn_if_missing=True),
+              FieldSpec("linearAcceleration", float, warn_if_missing=True),
+              FieldSpec("platformOpenFps", int, warn_if_missing=True),
+              FieldSpec("vehicleMaxSpeed", _kmh_to_ms))
+
     def __init__(self, server):
         DummyObjectPrototypeInfo.__init__(self, server)
         self.maxLinearVelocity = AnnotatedValue(0.0 * 0.27777779, "MaxLinearVelocity",
@@ -3348,27 +2960,7 @@ class SubmarinePrototypeInfo(DummyObjectPrototypeInfo):
         self.vehicleRelativePosition = deepcopy(ZERO_VECTOR)
         self.isUpdating = AnnotatedValue(True, "IsUpdating", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = DummyObjectPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            maxLinearVelocity = read_from_xml_node(xmlNode, self.maxLinearVelocity.name)
-            if maxLinearVelocity is not None:
-                self.maxLinearVelocity.value = float(maxLinearVelocity)
-                self.maxLinearVelocity.value = self.maxLinearVelocity.value * 0.27777779  # ~5/18 or 50/180
-
-            linearAcceleration = read_from_xml_node(xmlNode, self.linearAcceleration.name)
-            if linearAcceleration is not None:
-                self.linearAcceleration.value = float(linearAcceleration)
-
-            platformOpenFps = read_from_xml_node(xmlNode, self.platformOpenFps.name)
-            if platformOpenFps is not None:
-                self.platformOpenFps.value = int(platformOpenFps)
-
-            vehicleMaxSpeed = read_from_xml_node(xmlNode, self.vehicleMaxSpeed.name, do_not_warn=True)
-            if vehicleMaxSpeed is not None:
-                self.vehicleMaxSpeed.value = float(vehicleMaxSpeed)
-                self.vehicleMaxSpeed.value = self.vehicleMaxSpeed.value * 0.27777779  # ~5/18 or 50/180
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = DummyObjectPrototypeInfo.get_etree_prototype(self)
@@ -3378,17 +2970,14 @@ class SubmarinePrototypeInfo(DummyObjectPrototypeInfo):
 
 
 class BuildingPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("buildingType", Building.GetBuildingTypeByName),)
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.buildingType = AnnotatedValue(5, "BuildingType", group_type=GroupType.SECONDARY,
                                            saving_type=SavingType.REQUIRED_SPECIFIC)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            buildingTypeName = safe_check_and_set("", xmlNode, self.buildingType.name)
-            self.buildingType.value = Building.GetBuildingTypeByName(buildingTypeName)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
     def get_etree_prototype(self):
         result = PrototypeInfo.get_etree_prototype(self)
@@ -3398,22 +2987,14 @@ class BuildingPrototypeInfo(PrototypeInfo):
 
 
 class BarPrototypeInfo(BuildingPrototypeInfo):
+    FIELDS = (FieldSpec("withBarman", bool, missing=MISSING_DEFAULT),)
+
     def __init__(self, server):
         BuildingPrototypeInfo.__init__(self, server)
         self.withBarman = AnnotatedValue(True, "WithBarman", group_type=GroupType.SECONDARY,
                                          saving_type=SavingType.REQUIRED)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = BuildingPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.withBarman.value = parse_str_to_bool(self.withBarman.default_value,
-                                                      read_from_xml_node(xmlNode,
-                                                                         self.withBarman.name,
-                                                                         do_not_warn=True))
-            return STATUS_SUCCESS
-
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
+    LoadFromXML = SchemaLoader()
 
 
 class WorkshopPrototypeInfo(BuildingPrototypeInfo):
@@ -3422,6 +3003,13 @@ class WorkshopPrototypeInfo(BuildingPrototypeInfo):
 
 
 class WarePrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("maxItems", int, validator=is_non_negative),
+              FieldSpec("maxDurability", float),
+              FieldSpec("priceDispersion", float),
+              FieldSpec("engineModelName", missing=MISSING_DEFAULT),
+              FieldSpec("minCount", int),
+              FieldSpec("maxCount", int))
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.maxItems = AnnotatedValue(1, "MaxItems", group_type=GroupType.SECONDARY)
@@ -3431,51 +3019,33 @@ class WarePrototypeInfo(PrototypeInfo):
         self.minCount = AnnotatedValue(0, "MinCount", group_type=GroupType.SECONDARY)
         self.maxCount = AnnotatedValue(50, "MaxCount", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            maxItems = read_from_xml_node(xmlNode, self.maxItems.name, do_not_warn=True)
-            if maxItems is not None:
-                maxItems = int(maxItems)
-                if maxItems >= 0:
-                    self.maxItems.value = maxItems
-
-            maxDurability = read_from_xml_node(xmlNode, self.maxDurability.name, do_not_warn=True)
-            if maxDurability is not None:
-                self.maxDurability.value = float(maxDurability)
-
-            priceDispersion = read_from_xml_node(xmlNode, self.priceDispersion.name, do_not_warn=True)
-            if priceDispersion is not None:
-                self.priceDispersion.value = float(priceDispersion)
+    def CheckPriceDispersion(self, xmlFile, xmlNode):
+        if self.priceDispersion.value < 0.0 or self.priceDispersion.value > 100.0:
+            logger.error(f"Price dispersion can't be outside 0.0-100.0 range: see {self.prototypeName.value}")
 
-            if self.priceDispersion.value < 0.0 or self.priceDispersion.value > 100.0:
-                logger(f"Price dispersion can't be outside 0.0-100.0 range: see {self.prototypeName.value}")
-
-            self.engineModelName.value = safe_check_and_set(self.engineModelName.default_value, xmlNode, self.engineModelName.name)
-
-            minCount = read_from_xml_node(xmlNode, self.minCount.name, do_not_warn=True)
-            if minCount is not None:
-                self.minCount.value = int(minCount)
-
-            maxCount = read_from_xml_node(xmlNode, self.maxCount.name, do_not_warn=True)
-            if maxCount is not None:
-                self.maxCount.value = int(maxCount)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader(after=CheckPriceDispersion)
 
 
 class QuestItemPrototypeInfo(PrototypeInfo):
+    FIELDS = (FieldSpec("engineModelName"),)
+
     def __init__(self, server):
         PrototypeInfo.__init__(self, server)
         self.engineModelName = AnnotatedValue("", "ModelFile", group_type=GroupType.VISUAL)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.engineModelName.value = safe_check_and_set(self.engineModelName.value, xmlNode, "ModelFile")
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader()
 
 
 class BreakableObjectPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("destroyable", int, warn_if_missing=True),
+              FieldSpec("criticalHitEnergy", float, warn_if_missing=True),
+              FieldSpec("effectType", missing=MISSING_DEFAULT),
+              FieldSpec("destroyEffectType", missing=MISSING_DEFAULT),
+              FieldSpec("brokenModelName", missing=MISSING_DEFAULT),
+              FieldSpec("destroyedModelName", missing=MISSING_DEFAULT),
+              FieldSpec("breakEffect", missing=MISSING_DEFAULT),
+              FieldSpec("blastWavePrototypeName", missing=MISSING_DEFAULT))
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.destroyable = AnnotatedValue(0, "Destroyable", group_type=GroupType.SECONDARY,
@@ -3490,29 +3060,10 @@ class BreakableObjectPrototypeInfo(SimplePhysicObjPrototypeInfo):
         self.blastWavePrototypeName = AnnotatedValue("", "BlastWave", group_type=GroupType.SECONDARY)
         self.isUpdating = AnnotatedValue(False, "IsUpdating", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("BOX")
-            destroyable = read_from_xml_node(xmlNode, self.destroyable.name)
-            if destroyable is not None:
-                self.destroyable.value = int(destroyable)
-
-            criticalHitEnergy = read_from_xml_node(xmlNode, self.criticalHitEnergy.name)
-            if criticalHitEnergy is not None:
-                self.criticalHitEnergy.value = float(criticalHitEnergy)
-
-            self.effectType.value = safe_check_and_set(self.effectType.default_value, xmlNode, self.effectType.name)
-            self.destroyEffectType.value = safe_check_and_set(self.destroyEffectType.default_value, xmlNode,
-                                                              self.destroyEffectType.name)
-            self.brokenModelName.value = safe_check_and_set(self.brokenModelName.default_value, xmlNode,
-                                                            self.brokenModelName.name)
-            self.destroyedModelName.value = safe_check_and_set(self.destroyedModelName.default_value, xmlNode,
-                                                               self.destroyedModelName.name)
-            self.breakEffect.value = safe_check_and_set(self.breakEffect.default_value, xmlNode, self.breakEffect.name)
-            self.blastWavePrototypeName.value = safe_check_and_set(self.blastWavePrototypeName.default_value, xmlNode,
-                                                                   self.blastWavePrototypeName.name)
-            return STATUS_SUCCESS
+    def SetUpGeometry(self, xmlFile, xmlNode):
+        self.SetGeomType("BOX")
+
+    LoadFromXML = SchemaLoader(after=SetUpGeometry)
 
     def PostLoad(self, prototype_manager):
         if self.blastWavePrototypeName.value:
@@ -3530,28 +3081,20 @@ class VehicleSplinterPrototypeInfo(DummyObjectPrototypeInfo):
 
 
 class PhysicUnitPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("walkSpeed", float),
+              FieldSpec("maxStandTime", float),
+              FieldSpec("turnSpeed", float))
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.walkSpeed = AnnotatedValue(1.0, "WalkSpeed", group_type=GroupType.SECONDARY)
         self.turnSpeed = AnnotatedValue(1.0, "MaxStandTime", group_type=GroupType.SECONDARY)
         self.maxStandTime = AnnotatedValue(1.0, "TurnSpeed", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("FROM_MODEL")
-            walkSpeed = read_from_xml_node(xmlNode, self.walkSpeed.name, do_not_warn=True)
-            if walkSpeed is not None:
-                self.walkSpeed.value = float(walkSpeed)
-
-            maxStandTime = read_from_xml_node(xmlNode, self.maxStandTime.name, do_not_warn=True)
-            if maxStandTime is not None:
-                self.maxStandTime.value = float(maxStandTime)
+    def SetUpGeometry(self, xmlFile, xmlNode):
+        self.SetGeomType("FROM_MODEL")
 
-            turnSpeed = read_from_xml_node(xmlNode, self.turnSpeed.name, do_not_warn=True)
-            if turnSpeed is not None:
-                self.turnSpeed.value = float(turnSpeed)
-            return STATUS_SUCCESS
+    LoadFromXML = SchemaLoader(after=SetUpGeometry)
 
 
 class JointedObjPrototypeInfo(PrototypeInfo):
@@ -3570,17 +3113,17 @@ class GeomObjPrototypeInfo(PhysicObjPrototypeInfo):
 
 
 class RopeObjPrototypeInfo(SimplePhysicObjPrototypeInfo):
+    FIELDS = (FieldSpec("brokenModelName", warn_if_missing=True, missing=MISSING_NONE),)
+
     def __init__(self, server):
         SimplePhysicObjPrototypeInfo.__init__(self, server)
         self.brokenModelName = AnnotatedValue("", "BrokenModel", group_type=GroupType.PRIMARY)
         self.isUpdating = AnnotatedValue(False, "IsUpdating", group_type=GroupType.SECONDARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = SimplePhysicObjPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            self.SetGeomType("BOX")
-            self.brokenModelName.value = read_from_xml_node(xmlNode, "BrokenModel")
-            return STATUS_SUCCESS
+    def SetUpBoxGeometry(self, xmlFile, xmlNode):
+        self.SetGeomType("BOX")
+
+    LoadFromXML = SchemaLoader(after=SetUpBoxGeometry)
 
 
 class ObjPrefabPrototypeInfo(SimplePhysicObjPrototypeInfo):
@@ -3655,21 +3198,14 @@ class ObjPrefabPrototypeInfo(SimplePhysicObjPrototypeInfo):
 
 
 class BarricadePrototypeInfo(ObjPrefabPrototypeInfo):
+    FIELDS = (FieldSpec("probability", float, warn_if_missing=True),)
+
     def __init__(self, server):
         ObjPrefabPrototypeInfo.__init__(self, server)
         self.objInfos = AnnotatedValue([], "ObjInfos", group_type=GroupType.PRIMARY, saving_type=SavingType.SPECIFIC)
         self.probability = AnnotatedValue(1.0, "Probability", group_type=GroupType.PRIMARY)
 
-    def LoadFromXML(self, xmlFile, xmlNode):
-        result = ObjPrefabPrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
-        if result == STATUS_SUCCESS:
-            probability = read_from_xml_node(xmlNode, "Probability")
-            if probability is not None:
-                self.probability.value = float(probability)
-            return STATUS_SUCCESS
-
-    def InternalCopyFrom(self, prot_to_copy_from):
-        self.parent = prot_to_copy_from
+    LoadFromXML = SchemaLoader()
 
 
 class NpcPrototypeInfo(PrototypeInfo):
@@ -3687,8 +3223,7 @@ class RepositoryObjectsGeneratorPrototypeInfo(PrototypeInfo):
     def LoadFromXML(self, xmlFile, xmlNode):
         result = PrototypeInfo.LoadFromXML(self, xmlFile, xmlNode)
         if result == STATUS_SUCCESS:
-            objects = child_from_xml_node(xmlNode, "Object")
-            for object_node in objects:
+            for object_node in children_from_xml_node(xmlNode, "Object"):
                 newDescription = self.ObjectDescription()
                 newDescription.prototypeName = safe_check_and_set("", object_node, "PrototypeName")
                 newDescription.prototypeId = -1
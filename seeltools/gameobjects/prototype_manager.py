@@ -1,11 +1,20 @@
-from lxml import objectify
-from os import path
+from os import path, cpu_count
+from threading import Lock
+from collections import deque
+from timeit import default_timer as timer
+from concurrent.futures import ThreadPoolExecutor
 
 from utilities.log import logger
+from utilities.load_profiler import theLoadProfiler, PHASE, SOURCE_FILE, PROTOTYPE_CLASS
 
-from utilities.parse import xml_to_objfy, read_from_xml_node, log_comment
-from utilities.constants import STATUS_SUCCESS
-from gameobjects.prototype_info import PrototypeInfo, thePrototypeInfoClassDict
+from utilities.parse import xml_to_etree, iterparse_xml, read_from_xml_node, log_comment, is_comment
+from utilities.constants import STATUS_SUCCESS, PRESCAN_MODELS, PRESCAN_LOOKAHEAD, STREAM_PROTOTYPES
+from utilities.model_metadata import ModelPrescan, theModelMetadataStore
+from utilities.symbol_table import SymbolIndex, theSymbolTable
+from utilities.value_classes import recording_loaded_fields
+from gameobjects.prototype_info import (PrototypeInfo, thePrototypeInfoClassDict, VehiclePartPrototypeInfo,
+                                        CabinPrototypeInfo, BasketPrototypeInfo, ChassisPrototypeInfo)
+from gameobjects.reference_graph import ReferenceGraph
 
 
 from utilities.game_path import WORKING_DIRECTORY
@@ -13,17 +22,99 @@ from utilities.file_ops import save_to_file
 from lxml import etree
 
 
+class PrototypeHeader(object):
+    ''' Name, class and parent of prototype with the place it was loaded from.
+    For lazily loaded prototypes also keeps xml node to materialize prototype from.
+    '''
+    __slots__ = ("prototypeId", "prototypeName", "className", "parentPrototypeName",
+                 "sourceFile", "sourceLine", "directory", "xmlNode", "failed")
+
+    def __init__(self, prototypeId, prototypeName, className, parentPrototypeName,
+                 sourceFile=None, sourceLine=None, directory=None, xmlNode=None):
+        self.prototypeId = prototypeId
+        self.prototypeName = theSymbolTable.intern_name(prototypeName)
+        self.className = theSymbolTable.intern_name(className)
+        self.parentPrototypeName = theSymbolTable.intern_name(parentPrototypeName)
+        self.sourceFile = sourceFile
+        self.sourceLine = sourceLine
+        self.directory = directory
+        self.xmlNode = xmlNode
+        self.failed = False
+
+
+class LazyPrototypeList(list):
+    '''Prototypes by id, headers of lazily loaded prototypes are materialized on indexing or iteration'''
+    def __init__(self, prototype_manager):
+        list.__init__(self)
+        self.prototypeManager = prototype_manager
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.prototypeManager.GetMaterialized(entry) for entry in list.__getitem__(self, index)]
+        return self.prototypeManager.GetMaterialized(list.__getitem__(self, index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            prototype = self[index]
+            if prototype is not None:
+                yield prototype
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            prototype = self[index]
+            if prototype is not None:
+                yield prototype
+
+
+class LazyPrototypeDict(dict):
+    '''Prototypes by name, headers of lazily loaded prototypes are materialized on lookup'''
+    def __init__(self, prototype_manager):
+        dict.__init__(self)
+        self.prototypeManager = prototype_manager
+
+    def __getitem__(self, prototypeName):
+        return self.prototypeManager.GetMaterialized(dict.__getitem__(self, prototypeName))
+
+    def get(self, prototypeName, default=None):
+        entry = dict.get(self, prototypeName)
+        if entry is None:
+            return default
+        return self.prototypeManager.GetMaterialized(entry)
+
+    def values(self):
+        return [prototype for prototype in (self[name] for name in list(self.keys())) if prototype is not None]
+
+    def items(self):
+        items = ((name, self[name]) for name in list(self.keys()))
+        return [(name, prototype) for name, prototype in items if prototype is not None]
+
+
 class PrototypeManager(object):
-    def __init__(self, server):
+    def __init__(self, server, lazy: bool = False):
         # self.Clear()
         self.theServer = server
-        self.prototypes = []
-        self.prototypesMap = {}
-        self.prototypeNamesToIds = {}  # int: int
+        # in lazy mode only headers are read on load, prototypes are built on first access
+        self.lazy = lazy
+        self.prototypes = LazyPrototypeList(self) if lazy else []
+        self.prototypesMap = LazyPrototypeDict(self) if lazy else {}
+        self.prototypeHeaders = []
+        self.prototypeNamesToIds = SymbolIndex()  # int: int, prototype ids by symbols of prototype names
         self.prototypeFullNamesLocalizedForms = {}  # unsgn_int:unsgn_int
         self.prototypeFullNames = {}  # str:str
         self.loadingLock = 0
         self.prototypeClasses = []
+        # classes which files should be rewritten on next save, besides classes of changed prototypes
+        self.dirtyClasses = set()
+        # files of gameobjects tree parsed ahead of time by loading threads, {file_name: Future}
+        self.prefetchedFiles = None
+        self.modelPrescan = None
+        # streamed prototypes waiting to be built while their models are prescanned, [(directory, xml node)]
+        self.deferredPrototypes = None
+        # prototype names resolved by PostLoad are recorded as references of prototype being post loaded
+        self.postLoadingPrototypeId = -1
+        self.resolvedReferences = []  # [(prototype id, referenced prototype id or -1, referenced name)]
+        self.referenceGraph = None
+        self.referenceGraphKey = None  # (resolved references, prototypes) counts graph was built for
 
     def InternalGetPrototypeInfo(self, prototypeName):
         return self.prototypesMap.get(prototypeName)  # might be best to completely replace method with direct dict get
@@ -33,24 +124,239 @@ class PrototypeManager(object):
         return isinstance(prototype_info, thePrototypeInfoClassDict[class_name])
 
     def GetPrototypeId(self, prototypeName):
-        prot_id = -1
-        prot_id_from_loaded = self.prototypeNamesToIds.get(prototypeName)
-        if prot_id_from_loaded is None and prototypeName:
-            logger.error(f"No prototype with name '{prototypeName}' registred by PrototypeManager!")
-        else:
-            prot_id = prot_id_from_loaded
+        prot_id = self.prototypeNamesToIds.get_by_name(prototypeName)
+        if self.postLoadingPrototypeId != -1 and prototypeName:
+            self.resolvedReferences.append((self.postLoadingPrototypeId, prot_id, prototypeName))
+        if prot_id == -1:
+            if prototypeName:
+                logger.error(f"No prototype with name '{prototypeName}' registred by PrototypeManager!")
+            else:
+                return None
         return prot_id
 
-    def LoadFromXMLFile(self, fileName):
+    def GetPrototypeIdBySymbol(self, symbolId: int):
+        return self.prototypeNamesToIds.get(symbolId)
+
+    def LoadFromXMLFile(self, fileName, parallel=True, prescan_models=PRESCAN_MODELS, streaming=STREAM_PROTOTYPES):
+        ''' Streaming load keeps only the prototype node being read in memory, parallel only applies to loads
+        of whole files: included files are parsed on a thread pool while prototypes of parsed ones are built.
+        lxml releases GIL while parsing, building prototypes stays on the calling thread'''
         self.loadingLock += 1
-        self.LoadGameObjectsFolderFromXML(fileName)
+        with theLoadProfiler.section(PHASE, "PrototypeManager parse"):
+            if prescan_models and not self.lazy:
+                self.modelPrescan = ModelPrescan(theModelMetadataStore)
+            if streaming:
+                # streamed files are profiled with prototypes built from them and files they include,
+                # prototypes deferred for prescan can be built while one of the next files is streamed
+                with theLoadProfiler.section(SOURCE_FILE, fileName):
+                    if self.modelPrescan is not None:
+                        self.deferredPrototypes = deque()
+                    try:
+                        self.StreamGameObjectsFile(fileName)
+                        while self.deferredPrototypes:
+                            self.BuildDeferredPrototype()
+                    finally:
+                        self.deferredPrototypes = None
+            elif parallel:
+                # executor and lock only live for the load, manager is pickled into Server snapshot
+                with ThreadPoolExecutor(max_workers=min(8, cpu_count() or 1)) as executor:
+                    self.prefetchedFiles = {}
+                    self.PrefetchGameObjectsFile(executor, Lock(), fileName)
+                    try:
+                        self.LoadGameObjectsFolderFromXML(fileName)
+                    finally:
+                        self.prefetchedFiles = None
+            else:
+                self.LoadGameObjectsFolderFromXML(fileName)
+            if self.modelPrescan is not None:
+                self.modelPrescan.wait()
+                self.modelPrescan = None
+            theLoadProfiler.add_counts(prototypes=len(self.prototypeHeaders))
         self.loadingLock -= 1
-        for prototype in self.prototypes:
-            logger.debug(f"PostLoad for prototype {prototype.prototypeName}")
-            prototype.PostLoad(self)
+        # lazily loaded prototypes get PostLoad when materialized, here only already built ones are processed
+        loaded_prototypes = list(self.IterMaterializedPrototypes())
+        with theLoadProfiler.section(PHASE, "PrototypeManager PostLoad"):
+            for prototype in loaded_prototypes:
+                logger.debug(f"PostLoad for prototype {prototype.prototypeName}")
+                self.RunPostLoad(prototype)
+            theLoadProfiler.add_counts(prototypes=len(loaded_prototypes))
+        with theLoadProfiler.section(PHASE, "PrototypeManager reference graph"):
+            self.GetReferenceGraph()
+        for prototype in loaded_prototypes:
+            prototype.MarkClean()
+        self.dirtyClasses.clear()
+
+    def RunPostLoad(self, prototype_info: PrototypeInfo):
+        # prototype can be materialized during PostLoad of another one
+        outer_prototype_id = self.postLoadingPrototypeId
+        self.postLoadingPrototypeId = prototype_info.prototypeId
+        try:
+            with theLoadProfiler.section(PROTOTYPE_CLASS, f"{prototype_info.className.value} PostLoad",
+                                         keep_event=False):
+                prototype_info.PostLoad(self)
+        finally:
+            self.postLoadingPrototypeId = outer_prototype_id
+
+    def GetReferenceGraph(self):
+        ''' Graph of references between prototypes, built from references resolved by PostLoad and parents.
+        Graph is rebuilt on request after more prototypes were loaded or post loaded. In lazy mode only
+        materialized prototypes are known to reference anything.'''
+        graph_key = (len(self.resolvedReferences), len(self.prototypeHeaders))
+        if self.referenceGraph is None or self.referenceGraphKey != graph_key:
+            references = []
+            unresolved = []
+            for prototype_id, referenced_id, referenced_name in self.resolvedReferences:
+                if referenced_id == -1:
+                    unresolved.append((prototype_id, referenced_name))
+                else:
+                    references.append((prototype_id, referenced_id))
+            for header in self.prototypeHeaders:
+                if header.parentPrototypeName:
+                    parent_id = self.prototypeNamesToIds.get_by_name(header.parentPrototypeName)
+                    if parent_id != -1:
+                        references.append((header.prototypeId, parent_id))
+            self.referenceGraph = ReferenceGraph(len(self.prototypeHeaders), references, unresolved)
+            self.referenceGraphKey = graph_key
+        return self.referenceGraph
+
+    def IterPrototypeHeaders(self):
+        '''Headers of all prototypes in load order, prototypes are not materialized'''
+        return iter(self.prototypeHeaders)
+
+    def IterMaterializedPrototypes(self):
+        for entry in list.__iter__(self.prototypes):
+            if not isinstance(entry, PrototypeHeader):
+                yield entry
+
+    def GetMaterialized(self, entry):
+        if isinstance(entry, PrototypeHeader):
+            return self.MaterializePrototype(entry)
+        return entry
+
+    def MaterializePrototype(self, header: PrototypeHeader):
+        '''Builds prototype from header of lazy load, parent is materialized first when building'''
+        if header.failed:
+            return None
+        logger.debug(f"Materializing prototype {header.prototypeName}")
+        with theLoadProfiler.section(PROTOTYPE_CLASS, header.className, keep_event=False):
+            prototype_info = self.BuildPrototypeInfo(header.directory, header.xmlNode, header.className,
+                                                     header.prototypeId)
+        if prototype_info is None:
+            header.failed = True
+            return None
+        list.__setitem__(self.prototypes, header.prototypeId, prototype_info)
+        dict.__setitem__(self.prototypesMap, header.prototypeName, prototype_info)
+        header.xmlNode = None
+        if not self.loadingLock:
+            self.RunPostLoad(prototype_info)
+            prototype_info.MarkClean()
+        return prototype_info
+
+    def PrefetchGameObjectsFile(self, executor, prefetch_lock, fileName):
+        '''Schedules parsing of gameobjects file, included files are scheduled as soon as their includer is parsed'''
+        with prefetch_lock:
+            if fileName in self.prefetchedFiles:
+                return
+            self.prefetchedFiles[fileName] = executor.submit(self.ParseGameObjectsFile, executor, prefetch_lock,
+                                                             fileName)
+
+    def ParseGameObjectsFile(self, executor, prefetch_lock, fileName):
+        xmlFileNode = xml_to_etree(fileName)
+        directory = path.dirname(fileName)
+        for folder_node in xmlFileNode.iter("Folder"):
+            file_attrib = folder_node.attrib.get("File")
+            if file_attrib is not None:
+                self.PrefetchGameObjectsFile(executor, prefetch_lock, f"{directory}/{file_attrib}")
+        self.PrescanModels(xmlFileNode)
+        return xmlFileNode
+
+    def PrescanModels(self, xmlFileNode):
+        '''Schedules scan of model files which RefreshFromXml of vehicle parts in file will need'''
+        if self.modelPrescan is None:
+            return
+        for prototype_node in xmlFileNode.iter("Prototype"):
+            self.PrescanPrototypeModel(prototype_node)
+
+    def PrescanPrototypeModel(self, prototype_node):
+        prototype_class = thePrototypeInfoClassDict.get(prototype_node.attrib.get("Class"))
+        if prototype_class is None or not issubclass(prototype_class, VehiclePartPrototypeInfo):
+            return
+        if (issubclass(prototype_class, (CabinPrototypeInfo, BasketPrototypeInfo, ChassisPrototypeInfo))
+                or prototype_node.find("GroupsHealth") is not None):
+            model = self.theServer.theAnimatedModelsServer.GetItemByName(prototype_node.attrib.get("ModelFile"))
+            if model != -1:
+                self.modelPrescan.submit(model.file_name)
+
+    def StreamGameObjectsFile(self, fileName):
+        ''' Builds prototypes from iterparse events as soon as Prototype node ends, included files are streamed
+        when their Folder node starts, so prototypes are created in the same order as by LoadFromFolder.
+        Only Folder, Prototype and comment nodes produce events, children of prototypes are left to loaders.
+        Consumed nodes are cleared, in lazy mode they are kept for headers instead.
+        When models are prescanned, prototypes are deferred and built PRESCAN_LOOKAHEAD prototypes later,
+        so models of streamed prototypes are scanned before they are needed without parsing files twice.
+        '''
+        directory = path.dirname(fileName)
+        nested_depth = 0  # depth inside of Prototype node or Folder node with included file
+        root = None
+        for event, node in iterparse_xml(fileName, tag=("Prototypes", "Folder", "Prototype", etree.Comment)):
+            if event == "comment":
+                # comments outside of root node have no parent, loading of whole trees never sees them
+                if nested_depth == 0 and node.getparent() is not None:
+                    log_comment(node, node.getparent())
+                continue
+            if root is None:
+                root = node.getroottree().getroot()
+                if root.tag != "Prototypes":
+                    raise AttributeError(f"Given file {root.base} should contain <Prototypes> tag!")
+            if event == "start":
+                if nested_depth > 0 or node.tag == "Prototype":
+                    nested_depth += 1
+                elif node.tag == "Folder":
+                    file_attrib = read_from_xml_node(node, "File", do_not_warn=True)
+                    if file_attrib is not None:
+                        nested_depth = 1
+                        included_file = f"{directory}/{file_attrib}"
+                        with theLoadProfiler.section(SOURCE_FILE, included_file):
+                            self.StreamGameObjectsFile(included_file)
+            elif nested_depth > 1:
+                nested_depth -= 1
+            elif node.getparent() is not None:
+                if nested_depth == 1 and node.tag == "Prototype":
+                    if self.deferredPrototypes is not None:
+                        self.DeferStreamedPrototype(directory, node)
+                    else:
+                        self.ReadNewPrototype(directory, node)
+                nested_depth = 0
+                # while prototypes are deferred their nodes are released as they are built
+                if not self.lazy and not self.deferredPrototypes:
+                    self.ReleaseStreamedNode(node)
+
+    def DeferStreamedPrototype(self, directory, node):
+        self.PrescanPrototypeModel(node)
+        self.deferredPrototypes.append((directory, node))
+        if len(self.deferredPrototypes) > PRESCAN_LOOKAHEAD:
+            self.BuildDeferredPrototype()
+
+    def BuildDeferredPrototype(self):
+        directory, node = self.deferredPrototypes.popleft()
+        self.ReadNewPrototype(directory, node)
+        if not self.lazy:
+            self.ReleaseStreamedNode(node)
+
+    def ReleaseStreamedNode(self, node):
+        '''Clears consumed node and drops nodes before it, which are consumed already'''
+        node.clear()
+        while node.getprevious() is not None:
+            node.getparent().remove(node.getprevious())
 
     def LoadGameObjectsFolderFromXML(self, fileName):
-        xmlFileNode = xml_to_objfy(fileName)
+        '''Prototypes are always created here in document order, only parsing of files is done by loading threads'''
+        prefetched_file = self.prefetchedFiles.get(fileName) if self.prefetchedFiles is not None else None
+        if prefetched_file is not None:
+            xmlFileNode = prefetched_file.result()
+        else:
+            xmlFileNode = xml_to_etree(fileName)
+            self.PrescanModels(xmlFileNode)
         if xmlFileNode.tag != "Prototypes":
             raise AttributeError(f"Given file {xmlFileNode.base} should contain <Prototypes> tag!")
         directory = path.dirname(fileName)
@@ -59,7 +365,7 @@ class PrototypeManager(object):
     def LoadFromFolder(self, xmlFile, xmlNode, directory):
         for prototype_node in xmlNode.iterchildren():
             is_folder_node = prototype_node.tag == "Folder"
-            if prototype_node.tag != "comment":
+            if not is_comment(prototype_node):
                 if not is_folder_node:
                     self.ReadNewPrototype(directory, prototype_node)
                 else:
@@ -71,50 +377,114 @@ class PrototypeManager(object):
             else:
                 log_comment(prototype_node, xmlNode)
 
-    def ReadNewPrototype(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
+    def ReadNewPrototype(self, xmlFile, xmlNode: etree._Element):
         class_name = read_from_xml_node(xmlNode, "Class")
+        prototype_id = len(self.prototypes)
+        if self.lazy:
+            if thePrototypeInfoClassDict.get(class_name) is None:
+                logger.error(f"Invalid class name: <{class_name}>!")
+                return 0
+            header = PrototypeHeader(prototype_id, read_from_xml_node(xmlNode, "Name"), class_name,
+                                     read_from_xml_node(xmlNode, "ParentPrototype", do_not_warn=True),
+                                     xmlNode.base, xmlNode.sourceline, xmlFile, xmlNode)
+            return self.RegisterPrototype(header, header)
+
+        with theLoadProfiler.section(PROTOTYPE_CLASS, class_name, keep_event=False):
+            prototype_info = self.BuildPrototypeInfo(xmlFile, xmlNode, class_name, prototype_id)
+        if prototype_info is None:
+            return 0
+        header = PrototypeHeader(prototype_id, prototype_info.prototypeName.value, class_name,
+                                 prototype_info.parentPrototypeName.value, xmlNode.base, xmlNode.sourceline)
+        return self.RegisterPrototype(prototype_info, header)
+
+    def BuildPrototypeInfo(self, xmlFile, xmlNode: etree._Element, class_name, prototype_id):
         logger.debug(f"Loading {class_name} prototype from {xmlNode.base}")
         prototype_info = self.theServer.CreatePrototypeInfoByClassName(class_name)(self.theServer)
         if prototype_info:
             prototype_info.className.value = class_name
             parent_prot_name = read_from_xml_node(xmlNode, "ParentPrototype", do_not_warn=True)
             if parent_prot_name is not None:
-                parent_prot_info = self.InternalGetPrototypeInfo(parent_prot_name)
+                parent_prot_info = self.GetLoadedParent(parent_prot_name, prototype_id)
                 dummy = PrototypeInfo(self.theServer)
                 if parent_prot_info is None:
                     logger.error(f"Parent prototype of {class_name} is not loaded! Expected parent: {parent_prot_name}")
                     parent_prot_info = dummy
                 prototype_info.CopyFrom(parent_prot_info)
-            prototypes_length = len(self.prototypes)
-            prototype_info.prototypeId = prototypes_length
-            if prototype_info.LoadFromXML(xmlFile, xmlNode) == STATUS_SUCCESS:
-                if self.prototypeNamesToIds.get(prototype_info.prototypeName.value) is not None:
-                    logger.critical(f"Duplicate prototype in game objects: {prototype_info.prototypeName.value}")
-                    raise AttributeError("Duplicate prototype, critical error!")
-                else:
-                    self.prototypeNamesToIds[prototype_info.prototypeName.value] = prototype_info.prototypeId
-                    self.prototypes.append(prototype_info)
-                    self.prototypesMap[prototype_info.prototypeName.value] = prototype_info
-                    if prototype_info.className.value not in self.prototypeClasses:
-                        self.prototypeClasses.append(prototype_info.className.value)
-
-                    return 1
+            prototype_info.prototypeId = prototype_id
+            with recording_loaded_fields() as load_record:
+                result = prototype_info.LoadFromXML(xmlFile, xmlNode)
+            if result == STATUS_SUCCESS:
+                if prototype_info.parent is not None:
+                    prototype_info.DropDefaultOverrides(load_record)
+                return prototype_info
             else:
                 logger.error(f"Prototype {prototype_info.prototypeName.value} "
                              f"of class {prototype_info.className.value} was not loaded!")
-                return 0
+                return None
         else:
             logger.error("Invalid class name: <{class_name}>!")
-            return 0
+            return None
+
+    def GetLoadedParent(self, parentPrototypeName, prototypeId):
+        '''Parent should be loaded before the child, lazy load sees the same parents as full load'''
+        parent_entry = dict.get(self.prototypesMap, parentPrototypeName)
+        if parent_entry is None or parent_entry.prototypeId >= prototypeId:
+            return None
+        return self.GetMaterialized(parent_entry)
+
+    def RegisterPrototype(self, prototype_entry, header: PrototypeHeader):
+        prototype_symbol = theSymbolTable.intern(header.prototypeName)
+        if self.prototypeNamesToIds.get(prototype_symbol) != -1:
+            logger.critical(f"Duplicate prototype in game objects: {header.prototypeName}")
+            raise AttributeError("Duplicate prototype, critical error!")
+        self.prototypeNamesToIds.set(prototype_symbol, header.prototypeId)
+        self.prototypes.append(prototype_entry)
+        self.prototypesMap[header.prototypeName] = prototype_entry
+        self.prototypeHeaders.append(header)
+        if header.className not in self.prototypeClasses:
+            self.prototypeClasses.append(header.className)
+        if not self.loadingLock:
+            self.dirtyClasses.add(header.className)
+        return 1
 
-    def save_to_xml(self, gameObjectsFilePath):
+    def save_to_xml(self, gameObjectsFilePath, only_changed: bool = True):
+        '''Saves gameobjects, by default only files of classes with changed prototypes are regenerated.
+        Returns {file_path: seconds spent} for generated files'''
         full_path = path.join(WORKING_DIRECTORY, gameObjectsFilePath)
         full_path = self.tempFuncRenameFile(full_path)
         folder_path = path.split(full_path)[0]
 
+        prototypes_by_class = {prototype_class: [] for prototype_class in self.prototypeClasses}
+        changed_classes = set(self.dirtyClasses)
+        for prototype in self.prototypes:
+            prototypes_by_class[prototype.className.value].append(prototype)
+            if prototype.IsDirty():
+                changed_classes.add(prototype.className.value)
+
+        timings = {}
+        start = timer()
         self.generateGameObjectsFile(full_path)
-        for prototype_class in self.prototypeClasses:
-            self.generateSpecificPrototypesFile(prototype_class, folder_path)
+        timings[full_path] = timer() - start
+        # class files are generated one by one: get_etree_prototype takes most of the time and needs prototypes
+        # with their Server, so threads don't run it in parallel and processes would have to load the Server again
+        for prototype_class, class_prototypes in prototypes_by_class.items():
+            class_file_path = path.join(folder_path, self.getClassFileName(prototype_class))
+            if only_changed and prototype_class not in changed_classes and path.exists(class_file_path):
+                continue
+            class_file_path, spent_time = self.generateSpecificPrototypesFile(prototype_class, class_prototypes,
+                                                                              class_file_path)
+            timings[class_file_path] = spent_time
+            self.dirtyClasses.discard(prototype_class)
+            for prototype in class_prototypes:
+                prototype.MarkClean()
+
+        for file_path, spent_time in timings.items():
+            logger.info(f"Saved '{file_path}' in {spent_time:.3f}s")
+        logger.info(f"Saved {len(timings)} gameobjects files in {timer() - start:.3f}s")
+        return timings
+
+    def getClassFileName(self, className):
+        return f'new_{className.lower()}.xml'
 
     def generateGameObjectsFile(self, fullPath):
         prototypesTree = etree.Element("Prototypes")
@@ -122,27 +492,25 @@ class PrototypeManager(object):
         for prototype_class in self.prototypeClasses:
             folder = etree.Element("Folder")
             folder.set("Name", prototype_class)
-            folder.set("File", f'new_{prototype_class.lower()}.xml')
+            folder.set("File", self.getClassFileName(prototype_class))
             prototypesTree.append(folder)
 
-        save_to_file(prototypesTree, fullPath)
-
-    def generateSpecificPrototypesFile(self, className, pathToFolder):
-        filename = f'new_{className.lower()}.xml'
-        fullPath = path.join(pathToFolder, filename)
+        save_to_file(prototypesTree, fullPath, skip_unchanged=True)
 
+    def generateSpecificPrototypesFile(self, className, classPrototypes, fullPath):
+        start = timer()
         prototypesTree = etree.Element("Prototypes")
-        filteredPrototypes = [x for x in self.prototypes if x.className.value == className]
         if className == "Ware":
-            filteredPrototypes.sort(key=lambda x: x.price.value, reverse=False)
+            sortedPrototypes = sorted(classPrototypes, key=lambda x: x.price.value, reverse=False)
         elif className == "Vehicle":
-            filteredPrototypes.sort(key=lambda x: x.isAbstract.value, reverse=True)
+            sortedPrototypes = sorted(classPrototypes, key=lambda x: x.isAbstract.value, reverse=True)
         else:
-            filteredPrototypes.sort(key=lambda x: x.prototypeName.value, reverse=False)
+            sortedPrototypes = sorted(classPrototypes, key=lambda x: x.prototypeName.value, reverse=False)
 
-        for prototype in filteredPrototypes:
+        for prototype in sortedPrototypes:
             prototypesTree.append(prototype.get_etree_prototype())
-        save_to_file(prototypesTree, fullPath)
+        save_to_file(prototypesTree, fullPath, skip_unchanged=True)
+        return fullPath, timer() - start
 
     def tempFuncRenameFile(self, docfile):
         pathN, filename = path.split(docfile)
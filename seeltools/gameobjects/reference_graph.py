@@ -0,0 +1,109 @@
+import numpy
+
+
+def _to_csr(rows, columns, row_count: int):
+    '''Offsets and columns of CSR adjacency, rows should be sorted'''
+    offsets = numpy.zeros(row_count + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(rows, minlength=row_count), out=offsets[1:])
+    return offsets, columns
+
+
+class ReferenceGraph(object):
+    ''' References between prototypes by prototype ids, stored as CSR arrays. Prototypes referenced by
+    prototype i are targets[offsets[i]:offsets[i + 1]], prototypes referencing it are found the same way
+    in reverse_offsets and reverse_sources. References to unknown prototypes are kept in unresolved.
+    '''
+    def __init__(self, prototype_count: int, references, unresolved=()):
+        self.prototype_count = prototype_count
+        references = numpy.asarray(references, dtype=numpy.int64).reshape(-1, 2)
+        # every reference is kept once, sorted by source and then by target
+        edges = numpy.unique(references[:, 0] * prototype_count + references[:, 1])
+        sources = edges // prototype_count if prototype_count else edges
+        targets = edges - sources * prototype_count
+        self.offsets, self.targets = _to_csr(sources, targets, prototype_count)
+        reverse_order = numpy.lexsort((sources, targets))
+        self.reverse_offsets, self.reverse_sources = _to_csr(targets[reverse_order], sources[reverse_order],
+                                                             prototype_count)
+        self.unresolved = list(unresolved)  # [(prototype id, name of missing prototype)]
+
+    def __len__(self):
+        return len(self.targets)
+
+    def get_dependencies(self, prototype_id: int):
+        '''Ids of prototypes referenced by prototype'''
+        return self.targets[self.offsets[prototype_id]:self.offsets[prototype_id + 1]]
+
+    def get_dependents(self, prototype_id: int):
+        '''Ids of prototypes referencing prototype'''
+        return self.reverse_sources[self.reverse_offsets[prototype_id]:self.reverse_offsets[prototype_id + 1]]
+
+    def get_transitive_dependencies(self, prototype_ids):
+        '''Ids of all prototypes reachable by references from given ones, given ones are only included
+        if they are part of a cycle'''
+        return self._reach(prototype_ids, self.offsets, self.targets)
+
+    def get_transitive_dependents(self, prototype_ids):
+        '''Ids of all prototypes which would be affected by change of given ones'''
+        return self._reach(prototype_ids, self.reverse_offsets, self.reverse_sources)
+
+    def _reach(self, prototype_ids, offsets, adjacent):
+        reached = numpy.zeros(self.prototype_count, dtype=bool)
+        frontier = numpy.atleast_1d(numpy.asarray(prototype_ids, dtype=numpy.int64))
+        while frontier.size:
+            neighbours = numpy.concatenate([adjacent[offsets[node]:offsets[node + 1]] for node in frontier])
+            frontier = numpy.unique(neighbours[~reached[neighbours]])
+            reached[frontier] = True
+        return numpy.flatnonzero(reached)
+
+    def get_orphans(self):
+        '''Ids of prototypes which are not referenced by any other prototype'''
+        return numpy.flatnonzero(numpy.diff(self.reverse_offsets) == 0)
+
+    def find_cycles(self):
+        '''Groups of prototypes referencing each other directly or through others, sorted lists of ids'''
+        # iterative Tarjan's strongly connected components
+        offsets = self.offsets.tolist()
+        targets = self.targets.tolist()
+        index = [-1] * self.prototype_count
+        low = [0] * self.prototype_count
+        on_stack = [False] * self.prototype_count
+        stack = []
+        cycles = []
+        counter = 0
+        for root in range(self.prototype_count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, offsets[root])]
+            while work:
+                node, edge = work[-1]
+                if edge < offsets[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    target = targets[edge]
+                    if index[target] == -1:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, offsets[target]))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], index[target])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in targets[offsets[node]:offsets[node + 1]]:
+                        cycles.append(sorted(component))
+        return cycles
@@ -4,6 +4,9 @@ import winreg
 from urllib.parse import unquote
 import logging
 
+from utilities.xml_cache import XmlTreeCache
+from utilities.file_ops import MACHINA_DOCTYPE, can_stream_machina_xml, stream_machina_xml
+
 
 ENCODING = 'windows-1251'
 
@@ -17,7 +20,7 @@ logging.info(f"'{WORKING_DIRECTORY}': choosen as game working directory")
 def machina_xml_beautify(xml_string: str):
     ''' Format and beautify xml string in the style very similar to
     original Ex Machina dynamicscene.xml files.'''
-    beautified_string = b""
+    beautified_lines = []
     previous_line_indent = -1
 
     # As first line of xml file is XML Declaration, we want to exclude it
@@ -44,8 +47,8 @@ def machina_xml_beautify(xml_string: str):
         # first for its tree level, as described above
         previous_line_indent = line_indent
 
-        beautified_string += line
-    return beautified_string
+        beautified_lines.append(line)
+    return b"".join(beautified_lines)
 
 
 def _split_tag_on_attributes(xml_line: str, line_indent: int):
@@ -69,7 +72,18 @@ def _split_tag_on_attributes(xml_line: str, line_indent: int):
                 + _split_tag_on_attributes(xml_line[second_quotmark_index:],
                                            line_indent))
 
-def xml_to_objfy(full_path: str):
+
+xml_tree_cache = XmlTreeCache()
+
+
+def xml_to_objfy(full_path: str, use_cache: bool = False):
+    '''Trees are edited and saved by this tool, so every caller gets its own copy of cached tree'''
+    if use_cache:
+        return xml_tree_cache.get_tree(full_path, _parse_objfy, writable=True)
+    return _parse_objfy(full_path)
+
+
+def _parse_objfy(full_path: str):
     with open(full_path, 'r', encoding=ENCODING) as f:
         parser_recovery = objectify.makeparser(recover=True, encoding=ENCODING, collect_ids=False)
         objectify.enable_recursive_str()
@@ -91,9 +105,16 @@ def save_to_file(objectify_tree: objectify.ObjectifiedElement, path,
     dynamicscene.xml files by default. Can skip beautifier and save raw
     lxml formated file.
     '''
+    if machina_beautify and can_stream_machina_xml(objectify_tree, ENCODING):
+        with open(path, "wb") as writer:
+            # lxml puts own declaration before the doctype, beautifier drops it and treats doctype as a tag
+            writer.write(_split_tag_on_attributes(MACHINA_DOCTYPE.encode(ENCODING), 0) + b"\n")
+            stream_machina_xml(objectify_tree, writer, ENCODING, previous_line_indent=0)
+        return
+
     xml_string = etree.tostring(objectify_tree,
                                 pretty_print=True,
-                                doctype='<?xml version="1.0" encoding="windows-1251" standalone="yes" ?>',
+                                doctype=MACHINA_DOCTYPE,
                                 encoding="windows-1251")
     with open(path, "wb") as writer:
         if machina_beautify:
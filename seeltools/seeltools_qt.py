@@ -387,7 +387,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 attrib_value = QtWidgets.QLineEdit()
                 attrib_value.setText(str(attrib.value))
                 attrib_value.setFixedHeight(20)
-                if attrib.value == attrib.default_value:
+                if attrib.value == attrib.base_value:
                     palette = QtGui.QPalette()
                     palette.setColor(QtGui.QPalette.Text, QtGui.QColor(253, 174, 37))
                     attrib_value.setPalette(palette)
@@ -645,7 +645,7 @@ class PrototypeEditor(QtWidgets.QWidget):
                     attrib_value.setText(str(attrib.value))
                     attrib_value.setFixedHeight(20)
 
-                if attrib.value == attrib.default_value:
+                if attrib.value == attrib.base_value:
                     palette = QtGui.QPalette()
                     palette.setColor(QtGui.QPalette.Text, QtGui.QColor(253, 174, 37))
                     attrib_value.setPalette(palette)
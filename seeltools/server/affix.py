@@ -1,8 +1,9 @@
-from lxml import objectify
+from lxml import etree
 
 from utilities.log import logger
 from utilities.engine_config import theEngineConfig
-from utilities.parse import xml_to_objfy, read_from_xml_node, child_from_xml_node, check_mono_xml_node
+from utilities.parse import (xml_to_etree, read_from_xml_node, child_from_xml_node, children_from_xml_node,
+                             check_mono_xml_node)
 
 from server.resource_manager import ResourceManager
 from server.wnd_station import theWndStation
@@ -26,7 +27,7 @@ class Affix(object):
         self.name = ""
         self.modifications = []
 
-    def LoadFromXML(self, xmlFile, xmlNode: objectify.ObjectifiedElement):
+    def LoadFromXML(self, xmlFile, xmlNode: etree._Element):
         self.name = read_from_xml_node(xmlNode, "Name")
         forms_quantity = 1
         is_prefix = self.affixGroup.affixType == 0
@@ -69,7 +70,7 @@ class AffixGroup(object):
         self.name = read_from_xml_node(xmlNode, "Name")
         self.order = int(read_from_xml_node(xmlNode, "order"))
         check_mono_xml_node(xmlNode, "Affix")
-        for affix_node in xmlNode["Affix"]:
+        for affix_node in children_from_xml_node(xmlNode, "Affix"):
             affix = Affix(self)
             affix.LoadFromXML(xmlFile, affix_node)
             self.affixIds.append(affix)
@@ -82,12 +83,18 @@ class AffixManager(object):
         self.affixes = []
         self.affix_map = {}
         self.theResourceManager = theResourceManager
+        # tables indexed by resource id, include groups and affixes of all ancestor resources
+        self.prefixGroupsByResource = ()  # tuple of AffixGroup ids for every resource
+        self.suffixGroupsByResource = ()
+        self.affixesByResource = ()  # tuple of Affix ids for every resource
+        self._affixesByTarget = {}  # {(name, targetResourceId): affix id}, filled while affixes are added
+        self.affixIndex = {}  # {(name, resourceId): affix id}, inherited ones included
 
     def LoadFromXML(self, fileName):
-        xmlFile = xml_to_objfy(fileName)
+        xmlFile = xml_to_etree(fileName)
         if xmlFile.tag == "Affixes":
             check_mono_xml_node(xmlFile, "ForResource")
-            for resource_node in xmlFile["ForResource"]:
+            for resource_node in children_from_xml_node(xmlFile, "ForResource"):
                 resource_name = read_from_xml_node(resource_node, "Name")
                 resource_id = self.theResourceManager.GetResourceId(resource_name)
                 if resource_id == -1:
@@ -98,33 +105,61 @@ class AffixManager(object):
 
                     if prefixes is not None:
                         check_mono_xml_node(prefixes, "AffixGroup")
-                        for affix_group_node in child_from_xml_node(prefixes, "AffixGroup"):
+                        for affix_group_node in children_from_xml_node(prefixes, "AffixGroup"):
                             affix_group = AffixGroup(self)
                             affix_group.affixType = 0
-                            affix_group.LoadFromXML(xmlFile, affix_group_node)
-
                             affix_groups_list_size = len(self.affixGroups)
                             affix_group.affixGroupId = affix_groups_list_size
                             affix_group.targetResourceId = resource_id
+                            affix_group.LoadFromXML(xmlFile, affix_group_node)
 
                             self.affixGroups.append(affix_group)
                     if suffixes is not None:
                         check_mono_xml_node(suffixes, "AffixGroup")
-                        for affix_group_node in child_from_xml_node(suffixes, "AffixGroup"):
+                        for affix_group_node in children_from_xml_node(suffixes, "AffixGroup"):
                             affix_group = AffixGroup(self)
                             affix_group.affixType = 1
-                            affix_group.LoadFromXML(xmlFile, affix_group_node)
-
                             affix_groups_list_size = len(self.affixGroups)
                             affix_group.affixGroupId = affix_groups_list_size
                             affix_group.targetResourceId = resource_id
+                            affix_group.LoadFromXML(xmlFile, affix_group_node)
 
                             self.affixGroups.append(affix_group)
                     if suffixes is None and prefixes is None:
                         logger.warning(f"Affixes node for resource {resource_name} has no Prefixes and no Suffixes!")
+            self._BuildResourceTables()
         else:
             raise NameError("Affixes file should contain root Affixes tag")
 
+    def _BuildResourceTables(self):
+        ''' Groups applicable to resource are the ones targeting resource itself or any of its ancestors,
+        so groups of target are given to every resource of its subtree in hierarchy index of ResourceManager.
+        If affixes of the same name are applicable, one targeting the closest ancestor is indexed'''
+        resourceSubtreeEnd = self.theResourceManager.resourceSubtreeEnd
+        resourceCount = len(resourceSubtreeEnd)
+        groupsByTarget = {}
+        for affix_group in self.affixGroups:
+            if 0 <= affix_group.targetResourceId < resourceCount:
+                groupsByTarget.setdefault(affix_group.targetResourceId, []).append(affix_group)
+        prefixGroups = [[] for _ in range(resourceCount)]
+        suffixGroups = [[] for _ in range(resourceCount)]
+        affixes = [[] for _ in range(resourceCount)]
+        affixIndex = {}
+        # ancestors are numbered before their descendants, so affixes of closer ancestors are indexed last
+        for targetId in sorted(groupsByTarget):
+            for affix_group in groupsByTarget[targetId]:
+                groupsOfType = prefixGroups if affix_group.affixType == 0 else suffixGroups
+                groupAffixes = [affix for affix in affix_group.affixIds if affix.affixId != -1]
+                for resourceId in range(targetId, resourceSubtreeEnd[targetId]):
+                    groupsOfType[resourceId].append(affix_group.affixGroupId)
+                    for affix in groupAffixes:
+                        affixes[resourceId].append(affix.affixId)
+                        affixIndex[(affix.name, resourceId)] = affix.affixId
+        self.prefixGroupsByResource = tuple(tuple(sorted(groupIds)) for groupIds in prefixGroups)
+        self.suffixGroupsByResource = tuple(tuple(sorted(groupIds)) for groupIds in suffixGroups)
+        self.affixesByResource = tuple(tuple(sorted(affixIds)) for affixIds in affixes)
+        self.affixIndex = affixIndex
+
     def GetAffixById(self, affixId: int):
         if affixId < 0 or affixId > len(self.affixes):
             return 0  # ??? maybe replace with None
@@ -148,8 +183,9 @@ class AffixManager(object):
             return -1
         else:
             if resourceId != -1:
-                valid_afx_gr = [afx_gr for afx_gr in self.affixGroups
-                                if self.theResourceManager.ResourceIsKindOf(resourceId, afx_gr.targetResourceId)]
+                valid_afx_gr = [self.affixGroups[affixGroupId] for affixGroupId
+                                in sorted(self.prefixGroupsByResource[resourceId]
+                                          + self.suffixGroupsByResource[resourceId])]
                 if len(valid_afx_gr) > 1:
                     logger.warning(f"There is more than one available affixGroup for resource id {resourceId}!")
                 return valid_afx_gr[0]
@@ -157,14 +193,32 @@ class AffixManager(object):
             else:
                 raise ValueError(f"Invalid resourceId given, can't return AffixGroup!")
 
+    def _CheckResourceId(self, resourceId):
+        # negative ids would silently index tables from the end
+        if resourceId < 0 or resourceId >= len(self.affixesByResource):
+            raise ValueError(f"Invalid resourceId {resourceId} given, can't return affixes of resource!")
+
+    def GetPrefixGroupIds(self, resourceId):
+        self._CheckResourceId(resourceId)
+        return self.prefixGroupsByResource[resourceId]
+
+    def GetSuffixGroupIds(self, resourceId):
+        self._CheckResourceId(resourceId)
+        return self.suffixGroupsByResource[resourceId]
+
+    def GetAffixIdsByResourceId(self, resourceId):
+        self._CheckResourceId(resourceId)
+        return self.affixesByResource[resourceId]
+
     def GetAffixIdByNameAndResource(self, affixName, resourceId):
         if resourceId == -1 or not self.affixes:
             return -1
         else:
-            afx = self.affix_map[affixName]
-            if self.theResourceManager.ResourceIsKindOf(resourceId, afx.affixGroup.targetResourceId):
-                return afx.affixId
+            affixId = self.affixIndex.get((affixName, resourceId))
+            if affixId is not None:
+                return affixId
             else:
+                afx = self.affix_map[affixName]
                 raise TypeError(f"Affix {affixName} has unexpected resource type {afx.affixGroup.targetResourceId}, "
                                 f"compared to given resourceId {resourceId}")
 
@@ -172,9 +226,11 @@ class AffixManager(object):
         return len(self.affixes)
 
     def AddAffix(self, affix: Affix):
-        if self.GetAffixIdByNameAndResource(affix.name, affix.affixGroup.targetResourceId) != -1:
+        affixKey = (affix.name, affix.affixGroup.targetResourceId)
+        if affixKey in self._affixesByTarget:
             logger.warning(f"Affix {affix.name} already exists for resource!")
         else:
             affix.affixId = len(self.affixes)
             self.affixes.append(affix)
             self.affix_map[affix.name] = affix
+            self._affixesByTarget[affixKey] = affix.affixId
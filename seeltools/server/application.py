@@ -1,12 +1,14 @@
 import os
 from urllib.parse import unquote
+from lxml import etree
 # from copy import deepcopy
 
 from server.wnd_station import theWndStation
 from utilities.log import logger
-from utilities.parse import (xml_to_objfy, check_mono_xml_node,
+from utilities.parse import (xml_to_etree, check_mono_xml_node,
                              safe_check_and_set)
 from utilities.game_path import WORKING_DIRECTORY
+from utilities.symbol_table import theSymbolTable
 # from seeltools.utilities.constants import ZERO_VECTOR
 
 
@@ -33,9 +35,9 @@ class Application(object):
         animated_models_server.server.AddAllItems(os.path.join(WORKING_DIRECTORY, "data/models/animmodels.xml"))
         logger.info(f"Loading Servers: {file_name}")
 
-        xml_file_node = xml_to_objfy(file_name)
+        xml_file_node = xml_to_etree(file_name)
         if xml_file_node is not None:
-            for server_node in xml_file_node.iterchildren():
+            for server_node in xml_file_node.iterchildren(etree.Element):
                 server_container = self.servers.get(server_node.tag)
                 if server_container is not None:
                     logger.info(f"Loading server :{server_container.name}")
@@ -47,9 +49,9 @@ class Application(object):
             logger.error("Load servers: cannot find Servers")
 
     def LoadAdditionalServers(self, file_name):
-        xml_file_node = xml_to_objfy(file_name)
+        xml_file_node = xml_to_etree(file_name)
         if xml_file_node is not None:
-            for server_node in xml_file_node.iterchildren():
+            for server_node in xml_file_node.iterchildren(etree.Element):
                 server_container = self.servers.get(server_node.tag)
                 if server_container is not None:
                     logger.debug(f"Loading additional server :{server_container.name}")
@@ -131,7 +133,7 @@ class AnimatedModelsServer(DataServer):
         if item == -1:
             proto = self.ParseProto(params)
             if proto == 1:
-                xml_file_node = xml_to_objfy(params)
+                xml_file_node = xml_to_etree(params)
                 if xml_file_node.tag == "AnimatedModels":
                     for model_node in xml_file_node.iterchildren(tag="model"):
                         anim_model = self.AnimatedModel()
@@ -149,11 +151,12 @@ class AnimatedModelsServer(DataServer):
 
     def AddAllItems(self, filepath):
         '''Replacement to read all models from animmodels.xml'''
-        xml_file_node = xml_to_objfy(filepath)
+        xml_file_node = xml_to_etree(filepath)
         if xml_file_node.tag == "AnimatedModels":
             for model_node in xml_file_node.iterchildren(tag="model"):
                 anim_model = self.AnimatedModel()
-                anim_model.model_id = safe_check_and_set(anim_model.model_id, model_node, "id")
+                anim_model.model_id = theSymbolTable.intern_name(safe_check_and_set(anim_model.model_id,
+                                                                                    model_node, "id"))
                 anim_model.file_name = safe_check_and_set(anim_model.file_name, model_node, "file")
                 # ToDo: deprecate check on duplication if not needed
                 if self.models.get(anim_model.model_id) is not None:
@@ -1,11 +1,22 @@
+import numpy
+from lxml import etree
+
 from utilities.log import logger
-from utilities.parse import read_from_xml_node, xml_to_objfy
+from utilities.parse import read_from_xml_node, xml_to_etree, is_comment
+from utilities.file_ops import save_to_file
 
 
 class Relationship(object):
+    ''' Tolerances between belongs in range from minID to maxID. Tolerances are kept in int8 matrix indexed
+    by offsets of belongs from minID: [who][forwhom], filled symmetrically. Default tolerances share
+    the matrix with current ones until current tolerances are changed for the first time.
+    FormatType 0 map lists tolerances different from DefaultTolerance, FormatType 1 (save) map lists
+    tolerances different from default ones, loaded before from FormatType 0 map.
+    '''
     def __init__(self):
         self.pTolerance = 0
         self.pDefaultTolerance = 0
+        self.toleranceShared = False  # pTolerance is the same matrix as pDefaultTolerance
         self.defaultTolerance = 1
         self.minID = 0
         self.maxID = -1
@@ -23,7 +34,7 @@ class Relationship(object):
         self.toleranceList = list(self.toleranceMap.values())
 
     def LoadFromXML(self, xmlFile, copy_to_default: bool = True):
-        xmlNode = xml_to_objfy(xmlFile)
+        xmlNode = xml_to_etree(xmlFile)
         if xmlNode.tag != "relationship":
             raise ValueError("Relationship XML should contain root tag 'relationship'!")
         formatType = 0
@@ -37,30 +48,37 @@ class Relationship(object):
                 self.maxID = self.minID + 1001
                 logger.warning(f"Tolerance range can't be more than 1001, for example 1000-2001 range is valid."
                                f"Reseting max value to be {self.maxID}")
-            self.pTolerance = {}
-            tolerance_range_len = self.maxID - self.minID
-            tolerance_id_range = range(0, tolerance_range_len**2)
-            for tolerance_id in tolerance_id_range:
-                self.pTolerance[tolerance_id] = self.defaultTolerance
+            tolerance_range_len = self.maxID - self.minID + 1
+            self.pTolerance = numpy.full((tolerance_range_len, tolerance_range_len), self.defaultTolerance,
+                                         dtype=numpy.int8)
+            self.toleranceShared = False
             format_type_read = read_from_xml_node(xmlNode, "FormatType", do_not_warn=True)
             if format_type_read is not None:
                 formatType = int(format_type_read)
             if formatType != 0:
                 if formatType == 1:
-                    raise NotImplementedError("Can't work with saves yet, do not load from currentmap.xml")
-                    self.LoadFormat(xmlFile, xmlNode, 1)  # ??? do we even need this for format_type 1?
+                    if getattr(self.pDefaultTolerance, "shape", None) == self.pTolerance.shape:
+                        self.pTolerance = self.pDefaultTolerance
+                        self.toleranceShared = True
+                    else:
+                        logger.warning(f"Relationship save {xmlNode.base} is loaded without default relationship "
+                                       f"for the same belongs, changes are applied to DefaultTolerance")
+                    self.LoadFormat(xmlFile, xmlNode, 1)
                 else:
                     raise ValueError(f"Invalid format type {formatType} for relationship")
             else:
                 self.LoadFormat(xmlFile, xmlNode, 0)
-        if copy_to_default:
-            self.pDefaultTolerance = self.pTolerance
+            if copy_to_default:
+                self.pDefaultTolerance = self.pTolerance
+                self.toleranceShared = True
         else:
             raise ValueError("Relationship MinPlayerID should be less than MaxPlayerID")
 
     def LoadFormat(self, xmlFile, xmlNode, format_type: int = 0):
         for rel in xmlNode.iterchildren():
-            if rel.tag != "set":
+            if is_comment(rel):
+                continue
+            elif rel.tag != "set":
                 logger.warning(f"Invalid tag {rel.tag} in Relationship map {xmlNode.base}")
             else:
                 tolerance = self.GetToleranceByName(read_from_xml_node(rel, "tolerance"))
@@ -69,44 +87,132 @@ class Relationship(object):
                 self.SetTolerance(for_whom, who, tolerance)
 
     def SaveFormat(self, xmlFile, xmlNode, format_type: int = 0):
-        raise NotImplementedError("Not imlemented SaveFormat method for Relationship")
+        if format_type == 0:
+            base_tolerance = self.defaultTolerance
+        elif format_type == 1:
+            if getattr(self.pDefaultTolerance, "shape", None) == self.pTolerance.shape:
+                base_tolerance = self.pDefaultTolerance
+            else:
+                # as on load without default map, changes are saved relative to DefaultTolerance
+                logger.warning(f"Relationship save {xmlFile} is saved without default relationship "
+                               f"for the same belongs, changes are saved relative to DefaultTolerance")
+                base_tolerance = self.defaultTolerance
+        else:
+            raise ValueError(f"Invalid format type {format_type} for relationship")
+        for for_whom, who, tolerance in self.GetToleranceSets(base_tolerance):
+            rel = etree.SubElement(xmlNode, "set")
+            rel.set("forwhom", " ".join(str(belong) for belong in for_whom))
+            rel.set("who", " ".join(str(belong) for belong in who))
+            rel.set("tolerance", self.GetToleranceName(tolerance))
 
-    def SaveToXML(self, xmlFile, xmlNode):
-        raise NotImplementedError("Not imlemented SaveToXML method for Relationship")
+    def SaveToXML(self, xmlFile, xmlNode=None, format_type: int = 0):
+        '''Saves relationship map to xmlFile, xmlNode is filled if given, returns saved node'''
+        if xmlNode is None:
+            xmlNode = etree.Element("relationship")
+        xmlNode.set("MinPlayerID", str(self.minID))
+        xmlNode.set("MaxPlayerID", str(self.maxID))
+        xmlNode.set("DefaultTolerance", self.GetToleranceName(self.defaultTolerance))
+        if format_type != 0:
+            xmlNode.set("FormatType", str(format_type))
+        self.SaveFormat(xmlFile, xmlNode, format_type)
+        save_to_file(xmlNode, xmlFile)
+        return xmlNode
 
-    def SetTolerance(self, for_whom, who, tolerance):
-        invalid_belongs = []
-        min_id = self.minID
-        max_id = self.maxID
-        for_whom = [int(belong) for belong in for_whom.split()]
-        invalid_belongs.extend([bel for bel in for_whom if bel > self.maxID or bel < self.minID])
-        who = [int(belong) for belong in who.split()]
-        invalid_belongs.extend([bel for bel in who if bel > self.maxID or bel < self.minID])
-        if invalid_belongs:
-            for belong in invalid_belongs:
+    def GetToleranceSets(self, base_tolerance):
+        ''' Minimal list of (forwhom belongs, who belongs, tolerance) sets, which applied to base tolerance
+        (value or matrix) give current tolerances. Every pair is only listed once, in upper triangle of matrix,
+        so belongs with the same row of changed tolerances there are grouped in one set'''
+        changed = numpy.triu(self.pTolerance != base_tolerance, 1)
+        tolerance_sets = []
+        for tolerance in numpy.unique(self.pTolerance[changed]):
+            tolerance_rows = changed & (self.pTolerance == tolerance)
+            belongs = numpy.flatnonzero(tolerance_rows.any(axis=1))
+            # rows are packed to bytes, so identical rows are found by sorting short byte strings
+            packed_rows = numpy.packbits(tolerance_rows[belongs], axis=1)
+            unique_rows, row_groups = numpy.unique(packed_rows, axis=0, return_inverse=True)
+            row_groups = row_groups.reshape(-1)
+            group_order = numpy.argsort(row_groups, kind="stable")
+            group_starts = numpy.searchsorted(row_groups[group_order], numpy.arange(len(unique_rows)))
+            for for_whom in numpy.split(belongs[group_order], group_starts[1:]):
+                who = numpy.flatnonzero(tolerance_rows[for_whom[0]])
+                tolerance_sets.append(((for_whom + self.minID).tolist(), (who + self.minID).tolist(), int(tolerance)))
+        tolerance_sets.sort(key=lambda tolerance_set: (tolerance_set[0][0], tolerance_set[2]))
+        return tolerance_sets
+
+    def GetToleranceName(self, tolerance: int):
+        for tolerance_state in self.toleranceList:
+            if tolerance_state["tolerance"] == tolerance:
+                return tolerance_state["name"]
+        raise ValueError(f"Unknown tolerance {tolerance} in relationship")
+
+    def GetWritableTolerance(self):
+        '''Current tolerances matrix, copied from default one before it's changed for the first time'''
+        if self.toleranceShared:
+            self.pTolerance = self.pTolerance.copy()
+            self.toleranceShared = False
+        return self.pTolerance
+
+    def _ParseBelongs(self, belongs: str):
+        '''Offsets of valid belongs listed in string'''
+        offsets = []
+        for belong in belongs.split():
+            belong = int(belong)
+            if belong > self.maxID or belong < self.minID:
                 logger.warning(f"Invalid belong {belong} listed in relationship map! "
                                f"Belong should be between {self.minID} and {self.maxID}")
+            else:
+                offsets.append(belong - self.minID)
+        return offsets
 
-        for who_belong in who:
-            for whom_belong in for_whom:
-                if whom_belong != who_belong:
-                    # strange native way to store belong to belong tolerance mappings
-                    self.pTolerance[whom_belong + (who_belong - min_id) * (max_id - min_id + 1) - min_id] = tolerance
-                    self.pTolerance[who_belong + (whom_belong - min_id) * (max_id - min_id + 1) - min_id] = tolerance
-                else:
-                    logger.warning(f"Belong {who_belong} is in both 'forwhom' and 'who' attribs of set!")
+    def SetTolerance(self, for_whom, who, tolerance):
+        '''Sets tolerance between every belong of for_whom and every belong of who, both ways.
+        Belongs are given as strings of space separated ids, as in set tag of relationship map'''
+        for_whom = self._ParseBelongs(for_whom)
+        who = self._ParseBelongs(who)
+        both_sides = sorted(set(for_whom).intersection(who))
+        for belong in both_sides:
+            logger.warning(f"Belong {belong + self.minID} is in both 'forwhom' and 'who' attribs of set!")
+
+        tolerance_matrix = self.GetWritableTolerance()
+        if both_sides:
+            # belong is never set against itself
+            kept_diagonal = tolerance_matrix[both_sides, both_sides]
+        tolerance_matrix[numpy.ix_(who, for_whom)] = tolerance
+        tolerance_matrix[numpy.ix_(for_whom, who)] = tolerance
+        if both_sides:
+            tolerance_matrix[both_sides, both_sides] = kept_diagonal
 
-    def GetTolerance(self, belongId1: int, belongId2: int, from_default: bool = False):
+    def GetTolerance(self, belongId1, belongId2, from_default: bool = False):
+        ''' Tolerance of two belongs, belongs can be arrays of ids, then array of tolerances for every pair
+        is returned. Belongs outside of the map have default tolerance.'''
         if from_default:
             tolerance_source = self.pDefaultTolerance
         else:
             tolerance_source = self.pTolerance
+        if type(belongId1) is not int or type(belongId2) is not int:
+            return self._GetTolerances(tolerance_source, belongId1, belongId2)
         if belongId1 == belongId2:
-            return self.toleranceMap["own"]
+            return self.toleranceMap["own"]["tolerance"]
         if belongId1 < self.minID or belongId1 > self.maxID or belongId2 < self.minID or belongId2 > self.maxID:
             return self.defaultTolerance
         else:
-            return tolerance_source[belongId1 + (belongId2 - self.minID) * (self.maxID - self.minID + 1) - self.minID]
+            return int(tolerance_source[belongId2 - self.minID, belongId1 - self.minID])
+
+    def _GetMapOffsets(self, belongIds1, belongIds2):
+        '''Offsets of belongs broadcasted against each other, mask of pairs inside of the map and mask of own pairs'''
+        belongIds1, belongIds2 = numpy.broadcast_arrays(numpy.asarray(belongIds1), numpy.asarray(belongIds2))
+        offsets1 = belongIds1 - self.minID
+        offsets2 = belongIds2 - self.minID
+        range_len = self.maxID - self.minID + 1
+        in_map = (offsets1 >= 0) & (offsets1 < range_len) & (offsets2 >= 0) & (offsets2 < range_len)
+        return offsets1, offsets2, in_map, belongIds1 == belongIds2
+
+    def _GetTolerances(self, tolerance_source, belongIds1, belongIds2):
+        offsets1, offsets2, in_map, is_own = self._GetMapOffsets(belongIds1, belongIds2)
+        tolerances = numpy.full(in_map.shape, self.defaultTolerance, dtype=numpy.int8)
+        tolerances[in_map] = tolerance_source[offsets2[in_map], offsets1[in_map]]
+        tolerances[is_own] = self.toleranceMap["own"]["tolerance"]
+        return tolerances
 
     def GetToleranceByName(self, tol_name):
         tol = self.toleranceMap.get(tol_name)
@@ -115,9 +221,12 @@ class Relationship(object):
         else:
             return self.defaultTolerance
 
-    def CheckTolerance(self, belongId1: int, belongId2: int, from_default: bool = False):
+    def CheckTolerance(self, belongId1, belongId2, from_default: bool = False):
+        ''' Nearest known tolerance to declared one, belongs can be arrays of ids as for GetTolerance'''
+        if type(belongId1) is not int or type(belongId2) is not int:
+            return self._CheckTolerances(belongId1, belongId2, from_default)
         if belongId1 == belongId2:
-            return self.toleranceMap["own"]
+            return self.toleranceMap["own"]["tolerance"]
         if belongId1 < self.minID or belongId1 > self.maxID or belongId2 < self.minID or belongId2 > self.maxID:
             return self.defaultTolerance
         tolerance_difference = self.GetTolerance(belongId1, belongId2, from_default) - self.defaultTolerance
@@ -132,3 +241,21 @@ class Relationship(object):
                 min_tolerance = abs(tolerance_declared - tolerance_for_index)
 
         return nearest_tolerance
+
+    def _CheckTolerances(self, belongIds1, belongIds2, from_default: bool = False):
+        # same search as for single pair, done for all pairs at once per tolerance state
+        tolerance_difference = self.GetTolerance(belongIds1, belongIds2, from_default).astype(numpy.int16)
+        tolerance_declared = self.GetTolerance(belongIds1, belongIds2).astype(numpy.int16)
+        nearest_tolerance = numpy.full(tolerance_declared.shape, self.defaultTolerance, dtype=numpy.int8)
+        min_tolerance = numpy.abs(tolerance_difference - self.defaultTolerance)
+        for tolerance_state in self.toleranceList:
+            tolerance_for_index = tolerance_state['tolerance']
+            distance = numpy.abs(tolerance_declared - tolerance_for_index)
+            is_nearer = min_tolerance > distance
+            nearest_tolerance[is_nearer] = tolerance_for_index
+            min_tolerance = numpy.minimum(min_tolerance, distance)
+        # own and out of map pairs are returned as is, as for single pair
+        _, _, in_map, is_own = self._GetMapOffsets(belongIds1, belongIds2)
+        nearest_tolerance[~in_map] = self.defaultTolerance
+        nearest_tolerance[is_own] = self.toleranceMap["own"]["tolerance"]
+        return nearest_tolerance
@@ -1,5 +1,6 @@
 from utilities.log import logger
-from utilities.parse import xml_to_objfy, read_from_xml_node, check_mono_xml_node
+from utilities.parse import xml_to_etree, read_from_xml_node, children_from_xml_node, check_mono_xml_node
+from utilities.symbol_table import SymbolIndex, theSymbolTable
 
 
 class Resource(object):
@@ -15,7 +16,7 @@ class Resource(object):
             self.parentId = parent.id
 
     def LoadFromXML(self, xmlFile, xmlNode):
-        self.name = read_from_xml_node(xmlNode, "Name")
+        self.name = theSymbolTable.intern_name(read_from_xml_node(xmlNode, "Name"))
         strGeomSize = xmlNode.attrib.get("geomsize")
         if strGeomSize is not None:
             self.geomSize_x = strGeomSize.split()[0]
@@ -32,12 +33,8 @@ class Resource(object):
             if self.id < 0 or self.id > resourceVectorSize:
                 logger.warning(f"Resource id given is {self.id}, resourceVector size is {resourceVectorSize}")
                 return False
-            elif self.parentId == -1:
-                return False
-            elif self.parentId == resourceId:
-                return True
             else:
-                return False
+                return theResourceManager.ResourceIsKindOf(self.id, resourceId)
         else:
             logger.error("theResourceManager doesn't have a resourceVector!")
             return False
@@ -46,26 +43,32 @@ class Resource(object):
 class ResourceManager(object):
     def __init__(self, theServer, isContinuousMap: int = 0, some_other_int=0):
         self.resourceMap = {"[NO RESOURCE]": -1}
+        self.resourceNamesToIds = SymbolIndex()  # resource ids by symbols of resource names
         self.resourceVector = []
+        # resources are numbered in pre-order, so resource and all its descendants are ids in
+        # range(id, resourceSubtreeEnd[id]), index is built once all resources are loaded
+        self.resourceSubtreeEnd = []
+        self.resourceChildren = {}  # {parentId: tuple of children ids}, top level resources are under -1
         self.vehiclePart2Resource = {}
         self._LoadFromXmlFile(isContinuousMap, theServer.theGlobalProperties.pathToResourceTypes)
         self._LoadVehiclePartTypeToResourceXmlFile(some_other_int, theServer.theGlobalProperties.pathToVehiclePartTypes)
 
     def _LoadFromXmlFile(self, some_int, fileName):
-        resourceTypesXmlNode = xml_to_objfy(fileName)
+        resourceTypesXmlNode = xml_to_etree(fileName)
         if resourceTypesXmlNode.tag == "ResourceTypes":
             check_mono_xml_node(resourceTypesXmlNode, "Type")
-            for resource in resourceTypesXmlNode["Type"]:
+            for resource in children_from_xml_node(resourceTypesXmlNode, "Type"):
                 self._ReadResourceFromXml(fileName, resource, 0)
+            self._BuildHierarchyIndex()
         else:
             raise FileNotFoundError("Can't load ResourceTypes from XML!")
 
     def _LoadVehiclePartTypeToResourceXmlFile(self, some_other_int, fileName):
-        vehiclePartTypesXmlNode = xml_to_objfy(fileName)
+        vehiclePartTypesXmlNode = xml_to_etree(fileName)
         if vehiclePartTypesXmlNode.tag == "VehiclePartTypes":
             if len(vehiclePartTypesXmlNode.getchildren()) > 0:
                 check_mono_xml_node(vehiclePartTypesXmlNode, "VehiclePart")
-                for vehicle_part in vehiclePartTypesXmlNode["VehiclePart"]:
+                for vehicle_part in children_from_xml_node(vehiclePartTypesXmlNode, "VehiclePart"):
                     vehiclePartName = read_from_xml_node(vehicle_part, "PartName")
                     resourceName = read_from_xml_node(vehicle_part, "ResourceName")
                     if self.GetResourceId(resourceName) == -1:
@@ -73,7 +76,8 @@ class ResourceManager(object):
                                        f"is matched to vehicle part type '{vehiclePartName}'")
                     else:
                         if self.vehiclePart2Resource.get(vehiclePartName) is None:
-                            self.vehiclePart2Resource[vehiclePartName] = resourceName
+                            self.vehiclePart2Resource[theSymbolTable.intern_name(vehiclePartName)] = \
+                                theSymbolTable.intern_name(resourceName)
                         else:
                             raise NameError(f"ResourceManager: Can't add vehicle part with name {vehiclePartName} "
                                             f"to vehiclePart2Resource map. Already exist mapping with this name.")
@@ -103,12 +107,25 @@ class ResourceManager(object):
         resourceVectorSize = len(self.resourceVector)
         resource.id = resourceVectorSize
         self.resourceVector.append(resource)
+        if self.resourceMap[resource.name] is resource:
+            self.resourceNamesToIds.set(theSymbolTable.intern(resource.name), resource.id)
 
         if len(xmlNode.getchildren()) > 0:
             check_mono_xml_node(xmlNode, "Type")
-            for child in xmlNode["Type"]:
+            for child in children_from_xml_node(xmlNode, "Type"):
                 self._ReadResourceFromXml(xmlFile, child, resource)
 
+    def _BuildHierarchyIndex(self):
+        subtreeEnd = [resource.id + 1 for resource in self.resourceVector]
+        children = {}
+        # children always follow their parent, so subtree of every child is complete when it's reached
+        for resource in reversed(self.resourceVector):
+            if resource.parentId != -1:
+                subtreeEnd[resource.parentId] = max(subtreeEnd[resource.parentId], subtreeEnd[resource.id])
+            children.setdefault(resource.parentId, []).append(resource.id)
+        self.resourceSubtreeEnd = subtreeEnd
+        self.resourceChildren = {parentId: tuple(reversed(childrenIds)) for parentId, childrenIds in children.items()}
+
     def GetResource(self, resourceId):
         return self.resourceVector[resourceId]
 
@@ -122,18 +139,24 @@ class ResourceManager(object):
             return self.resourceVector[resourceId].name
 
     def GetResourceId(self, resourceName):
-        resource = self.resourceMap.get(resourceName)
-        if resource is not None:
-            return resource.id
-        else:
-            return -1
+        return self.resourceNamesToIds.get_by_name(resourceName)
+
+    def GetResourceIdBySymbol(self, symbolId: int):
+        return self.resourceNamesToIds.get(symbolId)
 
     def ResourceIsKindOf(self, resourceId, ancestorId):
-        return self.resourceVector[resourceId].IsKindOf(self, ancestorId)
+        '''Resource is ancestor itself or its descendant at any depth. Resource is kind of itself, as
+        Resource.IsKindOf always treated it: affixes targeting resource apply to resource itself'''
+        if ancestorId < 0 or ancestorId >= len(self.resourceSubtreeEnd):
+            return False
+        return ancestorId <= resourceId < self.resourceSubtreeEnd[ancestorId]
 
     def ResourceHasChildren(self, resourceId):
-        # finds all resource that list given resourceId as parent and evaluate list to bool - empty list is false
-        return bool([resource for resource in self.resourceVector if resource.parentId == resourceId])
+        return resourceId in self.resourceChildren
+
+    def GetResourceChildren(self, resourceId):
+        '''Ids of direct children of resource, ids of top level resources for -1'''
+        return self.resourceChildren.get(resourceId, ())
 
     def GetResourceNameByVehiclePartName(self, vehiclePartName):  # (self, *result, vehiclePartName) in original
         res_name = self.vehiclePart2Resource.get(vehiclePartName)
@@ -143,4 +166,8 @@ class ResourceManager(object):
             logger.warning(f"ResourceManager: can't find ResourceName for given VehiclePartName : {vehiclePartName}")
 
     def GetResourceDescendants(self, resourceId):
-        return [resource for resource in self.resourceVector if resource.IsKindOf(self, resourceId)]
+        '''Resource itself and all its descendants, in order of ids. Resource is included, as it is kind of itself,
+        strict descendants are GetResourceDescendants(resourceId)[1:]'''
+        if resourceId < 0 or resourceId >= len(self.resourceSubtreeEnd):
+            return []
+        return self.resourceVector[resourceId:self.resourceSubtreeEnd[resourceId]]
@@ -1,15 +1,24 @@
+import os
+from datetime import datetime
 from timeit import default_timer as timer
 
-from utilities.log import logger
-from utilities.parse import check_mono_xml_node, child_from_xml_node, read_from_xml_node, xml_to_objfy
+from utilities.log import logger, log_path
+from utilities.parse import check_mono_xml_node, children_from_xml_node, read_from_xml_node, xml_to_etree
 from utilities.engine_config import EngineConfig
 from utilities.global_properties import GlobalProperties
+from utilities.constants import USE_SERVER_SNAPSHOT, LAZY_PROTOTYPES, PROFILE_SERVER_LOAD, PROFILE_SERVER_LOAD_MEMORY
+from utilities.constants import COUNT_XML_HELPERS
+from utilities.load_profiler import theLoadProfiler, PHASE
+from utilities.helper_counters import theHelperCounters
+from utilities.model_metadata import theModelMetadataStore
 
 from server.affix import AffixManager
 from server.relationship import Relationship
 from server.resource_manager import ResourceManager
 from server.application import Application
 from server.objcontainer import ObjContainer
+from server.wnd_station import theWndStation
+from server.server_snapshot import load_server_snapshot, save_server_snapshot
 
 from level.level import Level
 
@@ -29,12 +38,18 @@ class Server(object):
     def InitOnce(self, theKernel):
         '''Called by CMiracle3d::LoadLevel'''
         self.engine_config = theKernel.engineConfig
-        self.LoadGlobalPropertiesFromXML(self.engine_config.global_properties)
-        self.theResourceManager = ResourceManager(self, 0, 0)
-        self.theAffixManager = AffixManager(self.theResourceManager)
-        self.theAffixManager.LoadFromXML(self.theGlobalProperties.pathToAffixes)
+        with theLoadProfiler.section(PHASE, "GlobalProperties"):
+            self.LoadGlobalPropertiesFromXML(self.engine_config.global_properties)
+        with theLoadProfiler.section(PHASE, "ResourceManager"):
+            self.theResourceManager = ResourceManager(self, 0, 0)
+            theLoadProfiler.add_counts(resources=len(self.theResourceManager.resourceMap) - 1)
+        with theLoadProfiler.section(PHASE, "AffixManager"):
+            self.theAffixManager = AffixManager(self.theResourceManager)
+            self.theAffixManager.LoadFromXML(self.theGlobalProperties.pathToAffixes)
+            theLoadProfiler.add_counts(affixes=len(self.theAffixManager.affixes))
         app = Application()
-        app.LoadServers("data/models/commonservers.xml")
+        with theLoadProfiler.section(PHASE, "Application.LoadServers"):
+            app.LoadServers("data/models/commonservers.xml")
         # app.LoadAdditionalServers("data/maps/r1m1/servers.xml")
         # app.LoadAdditionalServers("data/maps/r1m2/servers.xml")
         # app.LoadAdditionalServers("data/maps/r1m3/servers.xml")
@@ -53,15 +68,17 @@ class Server(object):
         self.saveType = saveType
         if not isContiniousMap:
             logger.info("Loading Relationship")
-            self.theRelationship = Relationship()
-            self.theRelationship.LoadFromXML(self.theGlobalProperties.pathToRelationship, copy_to_default=True)
+            with theLoadProfiler.section(PHASE, "Relationship"):
+                self.theRelationship = Relationship()
+                self.theRelationship.LoadFromXML(self.theGlobalProperties.pathToRelationship, copy_to_default=True)
         logger.info("Skipping loading SoilProps")
         logger.info("Skipping loading ExternalPaths")
         logger.info("Skipping loading PlayerPassMap")
         if not isContiniousMap:
             logger.info("Skipping loading GameObjects")
-            self.thePrototypeManager = PrototypeManager(self)
-            self.thePrototypeManager.LoadFromXMLFile(self.theGlobalProperties.pathToGameObjects)
+            with theLoadProfiler.section(PHASE, "PrototypeManager"):
+                self.thePrototypeManager = PrototypeManager(self, lazy=LAZY_PROTOTYPES)
+                self.thePrototypeManager.LoadFromXMLFile(self.theGlobalProperties.pathToGameObjects)
             logger.info("Initializing VehicleGeneratorInfoCache")
             # self.theVehiclesGeneratorInfoCache = VehiclesGeneratorInfoCache()
             # self.theVehiclesGeneratorInfoCache.EnsureInitialized()
@@ -86,12 +103,16 @@ class Server(object):
             logger.info("Loading Object Names (for level)")  # Section LEVEL -> OBJECTNAMES or object_names.xm
             DefaultLevel = Level()
             DefaultLevel.New(512)  # ToDo: 512 is temp, replace
-            self.ObjContainer = ObjContainer()
-            self.ObjContainer.LoadObjectNamesFromXML(DefaultLevel)
-            self.LoadPrototypeNamesFromXML(DefaultLevel.prototypeFullNames)
+            with theLoadProfiler.section(PHASE, "ObjectNames"):
+                self.ObjContainer = ObjContainer()
+                self.ObjContainer.LoadObjectNamesFromXML(DefaultLevel)
+                theLoadProfiler.add_counts(names=len(self.ObjContainer.objectsFullNames))
+            with theLoadProfiler.section(PHASE, "PrototypeNames"):
+                self.LoadPrototypeNamesFromXML(DefaultLevel.prototypeFullNames)
+                theLoadProfiler.add_counts(names=len(self.thePrototypeManager.prototypeFullNames))
 
     def LoadGlobalPropertiesFromXML(self, fileName):
-        xmlFile = xml_to_objfy(fileName)
+        xmlFile = xml_to_etree(fileName)
         if xmlFile.tag == "Properties":
             self.theGlobalProperties = GlobalProperties()
             self.theGlobalProperties.LoadFromXML(fileName, xmlFile)
@@ -99,9 +120,9 @@ class Server(object):
             raise NameError("GlobalProperties file should contain root Properties tag")
 
     def LoadPrototypeNamesFromXML(self, fileName):
-        xml_file = xml_to_objfy(fileName)
+        xml_file = xml_to_etree(fileName)
         check_mono_xml_node(xml_file, "Item", ignore_comments=True)
-        prot_name_items = child_from_xml_node(xml_file, "Item")
+        prot_name_items = children_from_xml_node(xml_file, "Item")
         for prot_name_item in prot_name_items:
             prot_name = read_from_xml_node(prot_name_item, "id")
             prot_name_full = read_from_xml_node(prot_name_item, "value")
@@ -121,10 +142,59 @@ class Server(object):
         self.thePrototypeManager.save_to_xml(self.theGlobalProperties.pathToGameObjects)
 
 
+def load_server(use_snapshot: bool = USE_SERVER_SNAPSHOT):
+    '''Loads Server from snapshot when game files are unchanged, otherwise from xml and refreshes snapshot'''
+    # lazily loaded prototypes keep references to xml nodes and can't be stored in snapshot
+    use_snapshot = use_snapshot and not LAZY_PROTOTYPES
+    if use_snapshot:
+        with theLoadProfiler.section(PHASE, "Server snapshot"):
+            snapshot = load_server_snapshot()
+        if snapshot is not None:
+            logger.info("Loading Server from snapshot")
+            server, theWndStation.strings = snapshot
+            theWndStation.created = True
+            return server
+    server = Server()
+    with theLoadProfiler.section(PHASE, "InitOnce"):
+        server.InitOnce(theKernel)
+    with theLoadProfiler.section(PHASE, "Load"):
+        server.Load()
+    theModelMetadataStore.save()
+    if use_snapshot:
+        theWndStation.EnsureCreated()
+        with theLoadProfiler.section(PHASE, "Save Server snapshot"):
+            save_server_snapshot(server, theWndStation.strings)
+    return server
+
+
+def save_load_profile(directory: str = log_path):
+    '''Logs the most expensive phases, files and prototype classes, saves the whole profile as json
+    and as Chrome trace'''
+    theLoadProfiler.log_report()
+    file_name = f"load_profile_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+    theLoadProfiler.save_json(os.path.join(directory, f"{file_name}.json"))
+    theLoadProfiler.save_chrome_trace(os.path.join(directory, f"{file_name}.trace.json"))
+    logger.info(f"Load profile saved to {directory} as {file_name}")
+
+
+def save_helper_counters(directory: str = log_path):
+    '''Logs xml helpers, attributes and callers ranked by calls and saves them as json'''
+    theHelperCounters.log_report()
+    file_name = f"xml_helpers_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    theHelperCounters.save_json(os.path.join(directory, file_name))
+    logger.info(f"Xml helper counters saved to {directory} as {file_name}")
+
+
+if PROFILE_SERVER_LOAD:
+    theLoadProfiler.start(trace_memory=PROFILE_SERVER_LOAD_MEMORY)
 start = timer()
 theKernel = Kernel()
-theServer = Server()
-theServer.InitOnce(theKernel)
-theServer.Load()
+with theLoadProfiler.section(PHASE, "Server"):
+    theServer = load_server()
 end = timer()
 logger.info(f"Loading Server Total time: {end - start}")
+if theLoadProfiler.enabled:
+    theLoadProfiler.stop()
+    save_load_profile()
+if COUNT_XML_HELPERS:
+    save_helper_counters()
@@ -0,0 +1,112 @@
+import os
+import pickle
+from pathlib import Path
+
+from utilities.log import logger
+from utilities.game_path import WORKING_DIRECTORY
+from utilities.parse import loaded_source_files
+from utilities.file_ops import get_file_hash
+from utilities.symbol_table import theSymbolTable
+from utilities.constants import SERVER_SNAPSHOT_FORMAT_VERSION
+
+module_path = Path(os.path.abspath(__file__))
+tool_root_path = module_path.parent.parent
+snapshot_cache_path = os.path.join(tool_root_path, 'cache')
+snapshot_file_path = os.path.join(snapshot_cache_path, 'server_snapshot.pickle')
+
+# packages which define classes stored in snapshot, changes to them should invalidate it
+SNAPSHOT_CODE_PACKAGES = ["gameobjects", "level", "server", "utilities"]
+
+
+def build_source_manifest(source_files):
+    '''Returns manifest of {path: (size, mtime, hash)} for all given source files'''
+    manifest = {}
+    for full_path in sorted(source_files):
+        file_stat = os.stat(full_path)
+        manifest[full_path] = (file_stat.st_size, file_stat.st_mtime_ns, get_file_hash(full_path))
+    return manifest
+
+
+def is_source_manifest_valid(manifest: dict):
+    '''Checks that every source file is unchanged, hash is only compared when size or mtime differs'''
+    for full_path, (size, mtime, file_hash) in manifest.items():
+        try:
+            file_stat = os.stat(full_path)
+        except OSError:
+            logger.info(f"Snapshot source file is missing: '{full_path}'")
+            return False
+        if file_stat.st_size != size:
+            logger.info(f"Snapshot source file changed: '{full_path}'")
+            return False
+        if file_stat.st_mtime_ns != mtime and get_file_hash(full_path) != file_hash:
+            logger.info(f"Snapshot source file changed: '{full_path}'")
+            return False
+    return True
+
+
+def get_code_fingerprint():
+    '''Sizes and mtimes of tool modules, snapshot of pickled objects is only valid for the same code'''
+    fingerprint = []
+    for package in SNAPSHOT_CODE_PACKAGES:
+        for module_file in sorted(Path(tool_root_path, package).glob("*.py")):
+            file_stat = module_file.stat()
+            fingerprint.append((module_file.name, file_stat.st_size, file_stat.st_mtime_ns))
+    return fingerprint
+
+
+def save_server_snapshot(server, strings: dict, path: str = snapshot_file_path):
+    '''Serializes fully loaded Server with strings of WndStation and symbols, written atomically'''
+    temp_path = f"{path}.tmp"
+    try:
+        header = {"version": SERVER_SNAPSHOT_FORMAT_VERSION,
+                  "working_directory": WORKING_DIRECTORY,
+                  "code": get_code_fingerprint(),
+                  "manifest": build_source_manifest(loaded_source_files)}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump({"server": server, "strings": strings, "symbols": theSymbolTable.names}, f,
+                        pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    # state which can't be pickled raises TypeError or AttributeError, that's a bug and isn't caught here
+    except (OSError, pickle.PicklingError, RecursionError) as error:
+        logger.warning(f"Can't save Server snapshot to '{path}': {error}")
+        return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    logger.info(f"Server snapshot saved to '{path}' for {len(header['manifest'])} source files")
+    return True
+
+
+def load_server_snapshot(path: str = snapshot_file_path):
+    '''Returns (server, strings) from snapshot if it's still valid for game files and code, otherwise None'''
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header.get("version") != SERVER_SNAPSHOT_FORMAT_VERSION:
+                logger.info("Server snapshot has outdated format version")
+                return None
+            if header.get("working_directory") != WORKING_DIRECTORY:
+                logger.info("Server snapshot was created for another game directory")
+                return None
+            if header.get("code") != get_code_fingerprint():
+                logger.info("Server snapshot was created by another version of the tool")
+                return None
+            if not is_source_manifest_valid(header["manifest"]):
+                return None
+            snapshot = pickle.load(f)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError) as error:
+        logger.warning(f"Can't read Server snapshot from '{path}': {error}")
+        return None
+    loaded_source_files.update(header["manifest"].keys())
+    # ids stored by managers are only valid with the same symbols
+    theSymbolTable.restore(snapshot["symbols"])
+    return snapshot["server"], snapshot["strings"]
+
+
+def invalidate_server_snapshot(path: str = snapshot_file_path):
+    if os.path.exists(path):
+        os.remove(path)
@@ -1,6 +1,8 @@
 from utilities.engine_config import theEngineConfig
 from utilities.log import logger
-from utilities.parse import xml_to_objfy, read_from_xml_node, child_from_xml_node, check_mono_xml_node
+from utilities.load_profiler import theLoadProfiler, PHASE
+from utilities.parse import xml_to_etree, read_from_xml_node, children_from_xml_node, check_mono_xml_node
+from utilities.symbol_table import theSymbolTable
 
 
 class WndStation(object):
@@ -9,9 +11,11 @@ class WndStation(object):
         self.strings = {}
         self.allWindows = {}
         self.allWindowsById = {}
+        self.created = False
 
     def GetStringByStringId(self, str_id, localizationIndex: str = ''):
         '''Get localizied string by id, where id is the service name'''
+        self.EnsureCreated()
         if len(localizationIndex) > 0:
             if localizationIndex in ["0", "1"]:
                 localizationIndex = f"_localizedform_{localizationIndex}"
@@ -29,8 +33,17 @@ class WndStation(object):
         # self.theGfxServer.SetSchema(schemaName)
         self.CreateDefaultStrings()
         self.LoadStrings(stringsName)
+        self.created = True
         return 1
 
+    def EnsureCreated(self):
+        '''Loads default string tables on first request, unless they were restored from Server snapshot'''
+        if not self.created:
+            with theLoadProfiler.section(PHASE, "WndStation strings"):
+                self.Create(theEngineConfig.ui_edit_strings)
+                self.LoadStrings(theEngineConfig.affixes_strings)
+                theLoadProfiler.add_counts(strings=len(self.strings))
+
     def CreateDefaultStrings(self):
         self.strings["ok"] = "Ok"
         self.strings["cancel"] = "Cancel"
@@ -39,13 +52,13 @@ class WndStation(object):
         self.strings["error"] = "Error"
 
     def LoadStrings(self, stringsName: str):
-        xmlFile = xml_to_objfy(stringsName)
+        xmlFile = xml_to_etree(stringsName)
         if xmlFile.tag == "resource":
             check_mono_xml_node(xmlFile, "string")
-            for xml_node in child_from_xml_node(xmlFile, "string"):
+            for xml_node in children_from_xml_node(xmlFile, "string"):
                 id_attr = read_from_xml_node(xml_node, "id")
                 value_attr = read_from_xml_node(xml_node, "value")
-                self.strings[id_attr] = value_attr
+                self.strings[theSymbolTable.intern_name(id_attr)] = value_attr
 
 
 # class GfxServer(object):
@@ -60,5 +73,3 @@ class WndStation(object):
 
 
 theWndStation = WndStation()
-theWndStation.Create(theEngineConfig.ui_edit_strings)
-theWndStation.LoadStrings(theEngineConfig.affixes_strings)
@@ -13,6 +13,35 @@ LOCALIZED_FORMS_QUANTITY = 2
 
 STATUS_SUCCESS = 1
 
+# loaded Server is cached on disk and reused while game files and tool code stay unchanged
+USE_SERVER_SNAPSHOT = True
+SERVER_SNAPSHOT_FORMAT_VERSION = 4
+
+# model files used by prototypes are scanned on a thread pool while gameobjects are being loaded
+PRESCAN_MODELS = True
+# streamed prototypes are built that many prototypes behind the parser, models they need are prescanned meanwhile
+PRESCAN_LOOKAHEAD = 64
+
+# gameobjects prototypes are only built when accessed, snapshot of Server isn't used in this mode
+LAZY_PROTOTYPES = False
+
+# gameobjects files are streamed with iterparse, prototypes are built as soon as their node is parsed
+STREAM_PROTOTYPES = True
+
+# xml files are parsed into plain lxml.etree trees, "objectify" backend is kept to compare loaders against it
+XML_BACKEND = "etree"
+
+# phases of Server load, parsed files and loaded prototype classes are profiled, profile is saved to log folder
+PROFILE_SERVER_LOAD = False
+# memory allocated by profiled sections is measured with tracemalloc, which makes load a few times slower
+PROFILE_SERVER_LOAD_MEMORY = True
+
+# calls of xml helpers are counted by tag, attribute and outcome, report is saved to log folder after load.
+# Helpers are only wrapped when set on import, so disabled counting costs nothing
+COUNT_XML_HELPERS = False
+# one of every that many counted calls also records stack it was called from
+XML_HELPERS_STACK_SAMPLE_RATE = 1000
+
 DEFAULT_TURNING_SPEED = 180.0
 
 # CONFIG = parse_config(CONFIG_PATH)
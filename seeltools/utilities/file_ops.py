@@ -1,27 +1,162 @@
+import os
+import hashlib
 from lxml import etree, objectify
 
+MACHINA_DOCTYPE = '<?xml version="1.0" encoding="windows-1251" standalone="yes" ?>'
+
+# libxml2 stops indenting pretty printed xml deeper than 30 levels
+MAX_PRETTY_INDENT = 30
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+ATTRIBUTE_ESCAPES = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;", ord('"'): "&quot;",
+                     ord("\n"): "&#10;", ord("\r"): "&#13;", ord("\t"): "&#9;"}
+
 
 def save_to_file(objectify_tree: objectify.ObjectifiedElement, path,
-                 machina_beautify: bool = True):
+                 machina_beautify: bool = True, skip_unchanged: bool = False):
     ''' Saves ObjectifiedElement tree to file at path, will format and
     beautify file in the style very similar to original Ex Machina
     dynamicscene.xml files by default. Can skip beautifier and save raw
-    lxml formated file.
+    lxml formated file. File is replaced only after it was completely written,
+    with skip_unchanged existing file is kept if it has the same content.
+    Returns True if file was written.
     '''
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            writer = HashingWriter(f)
+            write_tree(objectify_tree, writer, machina_beautify)
+        if skip_unchanged and os.path.exists(path) and get_file_hash(path) == writer.hexdigest():
+            os.remove(temp_path)
+            return False
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return True
+
+
+def write_tree(objectify_tree, writer, machina_beautify: bool = True):
+    if machina_beautify and can_stream_machina_xml(objectify_tree):
+        writer.write(MACHINA_DOCTYPE.encode("ascii") + b"\n")
+        stream_machina_xml(objectify_tree, writer)
+        return
+
     xml_string = etree.tostring(objectify_tree,
                                 pretty_print=True,
-                                doctype='<?xml version="1.0" encoding="windows-1251" standalone="yes" ?>')
-    with open(path, "wb") as writer:
-        if machina_beautify:
-            writer.write(machina_xml_beautify(xml_string))
+                                doctype=MACHINA_DOCTYPE)
+    if machina_beautify:
+        writer.write(machina_xml_beautify(xml_string))
+    else:
+        writer.write(xml_string)
+
+
+class HashingWriter(object):
+    '''Writes to file and calculates hash of everything written'''
+    def __init__(self, file):
+        self.file = file
+        self.sha1 = hashlib.sha1()
+
+    def write(self, data: bytes):
+        self.sha1.update(data)
+        return self.file.write(data)
+
+    def hexdigest(self):
+        return self.sha1.hexdigest()
+
+
+def get_file_hash(full_path: str):
+    sha1 = hashlib.sha1()
+    with open(full_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def can_stream_machina_xml(xml_tree, encoding: str = "ascii"):
+    ''' Streaming writer only supports trees of elements with attributes and comments, the way
+    lxml pretty prints everything else (text, namespaces, processing instructions) is left to lxml'''
+    if not isinstance(xml_tree, etree._Element) or xml_tree.tail is not None:
+        return False
+    for node in xml_tree.iter():
+        if node.tag is etree.Comment:
+            comment = node.text or ""
+            if "\n" in comment or "\r" in comment:
+                return False
+            try:
+                comment.encode(encoding)
+            except UnicodeEncodeError:
+                return False
+        elif not isinstance(node.tag, str) or "{" in node.tag or not node.tag.isascii():
+            return False
+        elif node.text is not None or (node is not xml_tree and node.tail is not None):
+            return False
+        elif node.nsmap or not all("{" not in name and name.isascii() for name in node.attrib.keys()):
+            return False
+    return True
+
+
+def stream_machina_xml(xml_tree, writer, encoding: str = "ascii", previous_line_indent: int = -1):
+    ''' Writes tree into writer line by line in Ex Machina layout, output is the same as
+    machina_xml_beautify of pretty printed tree. Tree should pass can_stream_machina_xml'''
+    for line_indent, line in _iter_pretty_lines(xml_tree, encoding):
+        if line_indent == previous_line_indent:
+            writer.write(b"\n")
+        writer.write(line_indent * b"\t")
+        writer.write(line)
+        writer.write(b"\n")
+        previous_line_indent = line_indent
+    return previous_line_indent
+
+
+def _iter_pretty_lines(xml_tree, encoding: str):
+    ''' Yields (indent, line) for every line lxml would pretty print for the tree,
+    with attributes already placed on separate lines '''
+    stack = []  # [(element, indent, children iterator)]
+    element = xml_tree
+    depth = 0
+    while True:
+        line_indent = min(depth, MAX_PRETTY_INDENT)
+        if element.tag is etree.Comment:
+            comment = f"<!--{element.text or ''}-->".encode(encoding)
+            yield line_indent, _split_tag_on_attributes(comment, line_indent)
         else:
-            writer.write(xml_string)
+            children = element.iterchildren()
+            first_child = next(children, None)
+            if first_child is None:
+                yield line_indent, _start_tag(element, line_indent, encoding) + b"/>"
+            else:
+                yield line_indent, _start_tag(element, line_indent, encoding) + b">"
+                stack.append((element, line_indent, children))
+                element = first_child
+                depth += 1
+                continue
+        element = None
+        while stack:
+            element = next(stack[-1][2], None)
+            if element is not None:
+                break
+            parent, parent_indent, _ = stack.pop()
+            depth -= 1
+            yield parent_indent, b"</" + parent.tag.encode("ascii") + b">"
+        if element is None:
+            return
+
+
+def _start_tag(element, line_indent: int, encoding: str):
+    attribute_separator = "\n" + "\t" * (line_indent + 1)
+    tag_parts = [f"<{element.tag}"]
+    for name, value in element.attrib.items():
+        tag_parts.append(f'{attribute_separator}{name}="{value.translate(ATTRIBUTE_ESCAPES)}"')
+    return "".join(tag_parts).encode(encoding, "xmlcharrefreplace")
 
 
 def machina_xml_beautify(xml_string: str):
     ''' Format and beautify xml string in the style very similar to
     original Ex Machina dynamicscene.xml files.'''
-    beautified_string = b""
+    beautified_lines = []
     previous_line_indent = -1
 
     # As first line of xml file is XML Declaration, we want to exclude it
@@ -48,27 +183,36 @@ def machina_xml_beautify(xml_string: str):
         # first for its tree level, as described above
         previous_line_indent = line_indent
 
-        beautified_string += line
-    return xml_string_first_line + b"\n" + beautified_string
+        beautified_lines.append(line)
+    return xml_string_first_line + b"\n" + b"".join(beautified_lines)
 
 
-def _split_tag_on_attributes(xml_line: str, line_indent: int):
-    white_space_index = xml_line.find(b" ")
-    quotmark_index = xml_line.find(b'"')
+def _split_tag_on_attributes(xml_line: bytes, line_indent: int):
+    ''' Moves every attribute of the tag to a separate line, spaces inside of
+    attribute values are kept '''
+    line_parts = []
+    attribute_separator = b"\n" + b"\t" * (line_indent + 1)
+    while True:
+        white_space_index = xml_line.find(b" ")
+        quotmark_index = xml_line.find(b'"')
 
-    # true when no tag attribute contained in string
-    if white_space_index == -1 or quotmark_index == -1:
-        return xml_line
+        # true when no tag attribute contained in string
+        if white_space_index == -1 or quotmark_index == -1:
+            line_parts.append(xml_line)
+            return b"".join(line_parts)
 
-    elif white_space_index < quotmark_index:
-        # next tag attribute found, now indent found attribute and
-        # recursively start work on a next line part
-        return (xml_line[:white_space_index] + b"\n" + b"\t" * (line_indent + 1)
-                + _split_tag_on_attributes(xml_line[white_space_index + 1:],
-                                           line_indent))
-    else:
-        # searching where attribute values ends and new attribute starts
-        second_quotmark_index = xml_line.find(b'"', quotmark_index + 1) + 1
-        return (xml_line[:second_quotmark_index]
-                + _split_tag_on_attributes(xml_line[second_quotmark_index:],
-                                           line_indent))
+        elif white_space_index < quotmark_index:
+            # next tag attribute found, now indent found attribute and
+            # continue work on a next line part
+            line_parts.append(xml_line[:white_space_index])
+            line_parts.append(attribute_separator)
+            xml_line = xml_line[white_space_index + 1:]
+        else:
+            # searching where attribute values ends and new attribute starts
+            second_quotmark_index = xml_line.find(b'"', quotmark_index + 1) + 1
+            if second_quotmark_index == 0:
+                # unpaired quotation mark, nothing left to split
+                line_parts.append(xml_line)
+                return b"".join(line_parts)
+            line_parts.append(xml_line[:second_quotmark_index])
+            xml_line = xml_line[second_quotmark_index:]
@@ -0,0 +1,150 @@
+import mmap
+from collections import namedtuple
+
+from utilities.constants import VehicleGamStruct
+
+# breakable group chunk: name, ..., variants count at 28, id at 32, then 12 bytes per variant
+BREAKABLE_NAME_LENGTH = 11
+BREAKABLE_VARIANTS_OFFSET = 28
+BREAKABLE_ID_OFFSET = 32
+BREAKABLE_CHUNK_BASE_SIZE = 36
+BREAKABLE_VARIANT_SIZE = 12
+BREAKABLES_END_MARK = b"IVR"
+LOGO_EXTENSION = b".dds"
+
+GamBreakable = namedtuple("GamBreakable", ["name", "id", "variants", "offset", "chunk"])
+
+
+class GamFile(object):
+    ''' Read-only view of .gam model file, file is memory mapped and parts of it are found
+    once on first request. Chunks returned are memoryviews into the mapped file, so they are only
+    valid until file is closed.
+    '''
+    def __init__(self, full_path: str):
+        self.path = full_path
+        self._file = open(full_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file can't be mapped
+            self._map = None
+        self.data = memoryview(self._map) if self._map is not None else memoryview(b"")
+        self._views = []
+        self._group_health_header = None
+        self._breakables = None
+        self._logos = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self.data.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def find(self, marker: bytes, start: int = 0, end: int = None):
+        if self._map is None:
+            return -1
+        return self._map.find(marker, start, len(self._map) if end is None else end)
+
+    def view(self, start: int, end: int):
+        chunk = self.data[start:end]
+        self._views.append(chunk)
+        return chunk
+
+    @property
+    def group_health_header(self):
+        '''(offset, header) of the first known GroupHealth header, offset is -1 if model has none'''
+        if self._group_health_header is None:
+            self._group_health_header = (-1, None)
+            for header in (VehicleGamStruct.GROUP_HEALTH_HEADER.value,
+                           VehicleGamStruct.GROUP_HEALTH_HEADER_URAL_CARGO.value):
+                header_offset = self.find(header)
+                if header_offset != -1:
+                    self._group_health_header = (header_offset, header)
+                    break
+        return self._group_health_header
+
+    @property
+    def breakables(self):
+        '''Breakable groups following GroupHealth header, groups can have any number of variants'''
+        if self._breakables is None:
+            self._breakables = []
+            header_offset, header = self.group_health_header
+            if header_offset != -1:
+                section_start = header_offset + len(header)
+                section_end = self.find(header, section_start)
+                if section_end == -1:
+                    section_end = len(self.data)
+                breakable_mark = VehicleGamStruct.BREAKABLE_BSTR.value
+                current_index = self.find(breakable_mark, section_start, section_end)
+                while current_index != -1 and current_index + BREAKABLE_ID_OFFSET < section_end:
+                    if self.data[current_index:current_index + 3] == BREAKABLES_END_MARK:
+                        break
+                    variants = self.data[current_index + BREAKABLE_VARIANTS_OFFSET]
+                    chunk_size = BREAKABLE_CHUNK_BASE_SIZE + BREAKABLE_VARIANT_SIZE * variants
+                    chunk_end = min(current_index + chunk_size, section_end)
+                    if self.find(breakable_mark, current_index, chunk_end) != -1:
+                        name = bytes(self.data[current_index:current_index + BREAKABLE_NAME_LENGTH])
+                        self._breakables.append(GamBreakable(name.decode('latin-1').replace('\x00', ''),
+                                                             self.data[current_index + BREAKABLE_ID_OFFSET],
+                                                             variants,
+                                                             current_index,
+                                                             self.view(current_index, chunk_end)))
+                    current_index += chunk_size
+        return self._breakables
+
+    @property
+    def group_health(self):
+        '''{group_name: {"id": id, "variants": variants}} or None if model has no GroupHealth header'''
+        if self.group_health_header[0] == -1:
+            return None
+        group_health = {"Main": {"id": None,
+                                 "variants": None}}
+        for breakable in self.breakables:
+            group_health[breakable.name] = {"id": breakable.id,
+                                            "variants": breakable.variants}
+        return group_health
+
+    @property
+    def logos(self):
+        ''' Names of .dds textures, each name starts after the last zero byte preceding extension.
+        Segment after the last extension is listed as well, as splitting file by extension gives it'''
+        if self._logos is None:
+            self._logos = []
+            previous_end = 0
+            extension_index = self.find(LOGO_EXTENSION)
+            while extension_index != -1:
+                name_start = self._map.rfind(b"\x00", previous_end, extension_index) + 1
+                if name_start == 0:
+                    name_start = previous_end
+                self._logos.append(bytes(self.data[name_start:extension_index]).decode('latin-1'))
+                previous_end = extension_index + len(LOGO_EXTENSION)
+                extension_index = self.find(LOGO_EXTENSION, previous_end)
+            name_start = self._map.rfind(b"\x00", previous_end) + 1
+            if name_start == 0:
+                name_start = previous_end
+            self._logos.append(bytes(self.data[name_start:]).decode('latin-1'))
+        return self._logos
+
+    def find_load_point(self, load_point_name: str):
+        ''' Offset of zero terminated load point name in model file or -1.
+        Layout of load point records is not known, so lookup is by name only'''
+        return self.find(load_point_name.encode('latin-1') + b"\x00")
+
+    def load_points(self, load_point_names):
+        '''{name: view starting at load point name} for all names found in model file'''
+        load_points = {}
+        for load_point_name in load_point_names:
+            offset = self.find_load_point(load_point_name)
+            if offset != -1:
+                load_points[load_point_name] = self.view(offset, len(self.data))
+        return load_points
@@ -1,5 +1,7 @@
+from lxml import etree
+
 from utilities.log import logger
-from utilities.parse import read_from_xml_node, parse_str_to_bool
+from utilities.parse import read_from_xml_node, parse_str_to_bool, get_child_map
 
 
 class GlobalProperties(object):
@@ -68,128 +70,133 @@ class GlobalProperties(object):
         self.zoneRespawnTimeOutIncreaseCoeff = 1.1
 
     def LoadFromXML(self, xmlFile, xmlNode):
-        namedBelongIds = read_from_xml_node(xmlNode["Belongs"], "Values")
+        child_nodes = get_child_map(xmlNode)
+        namedBelongIds = read_from_xml_node(child_nodes["Belongs"], "Values")
         self.namedBelongIds = [int(belong) for belong in namedBelongIds.split()]
         self.namedBelongIdsVector = self.namedBelongIds  # ??? are both needed?
 
-        izvratRepositoryMaxSize = read_from_xml_node(xmlNode["IzvratRepository"], "MaxSize")
+        izvratRepositoryMaxSize = read_from_xml_node(child_nodes["IzvratRepository"], "MaxSize")
         self.izvratRepositoryMaxSize_x = int(izvratRepositoryMaxSize.split()[0])
         self.izvratRepositoryMaxSize_y = int(izvratRepositoryMaxSize.split()[1])
 
-        groundRepositorySize = read_from_xml_node(xmlNode["GroundRepository"], "Size")
+        groundRepositorySize = read_from_xml_node(child_nodes["GroundRepository"], "Size")
         self.groundRepositorySize_x = int(groundRepositorySize.split()[0])
         self.groundRepositorySize_y = int(groundRepositorySize.split()[1])
 
-        self.gameTimeMult = float(read_from_xml_node(xmlNode["Mult"], "GameTimeMult"))
+        self.gameTimeMult = float(read_from_xml_node(child_nodes["Mult"], "GameTimeMult"))
         if self.gameTimeMult <= 0.000099999997:
             logger.warning("GameTimeMult is too low! Set to 0.0001 or higher")
-        self.vehicleAiFiringRangeMult = read_from_xml_node(xmlNode["Mult"], "VehicleAIFiringRangeMult")
+        self.vehicleAiFiringRangeMult = read_from_xml_node(child_nodes["Mult"], "VehicleAIFiringRangeMult")
 
-        self.maxBurstTime = int(read_from_xml_node(xmlNode["BurstParameters"], "MaxBurstTime"))
-        self.minBurstTime = int(read_from_xml_node(xmlNode["BurstParameters"], "MinBurstTime"))
-        self.timeBetweenBursts = int(read_from_xml_node(xmlNode["BurstParameters"], "TimeBetweenBursts"))
+        self.maxBurstTime = int(read_from_xml_node(child_nodes["BurstParameters"], "MaxBurstTime"))
+        self.minBurstTime = int(read_from_xml_node(child_nodes["BurstParameters"], "MinBurstTime"))
+        self.timeBetweenBursts = int(read_from_xml_node(child_nodes["BurstParameters"], "TimeBetweenBursts"))
 
         self.probabilityToGenerateDynamicQuestInTown = \
-            float(read_from_xml_node(xmlNode["DynamicQuest"], "ProbabilityToGenerateDynamicQuestInTown"))
+            float(read_from_xml_node(child_nodes["DynamicQuest"], "ProbabilityToGenerateDynamicQuestInTown"))
         if self.probabilityToGenerateDynamicQuestInTown < 0.0 or self.probabilityToGenerateDynamicQuestInTown > 1.0:
             logger.warning("ProbabilityToGenerateDynamicQuestInTown value is invalid! Set between 0.0 and 1.0")
 
-        self.pathToRelationship = read_from_xml_node(xmlNode["CommonPaths"], "Relationship")
-        self.pathToGameObjects = read_from_xml_node(xmlNode["CommonPaths"], "GameObjects")
-        self.pathToQuests = read_from_xml_node(xmlNode["CommonPaths"], "Quests")
-        self.pathToResourceTypes = read_from_xml_node(xmlNode["CommonPaths"], "ResourceTypes")
-        self.pathToAffixes = read_from_xml_node(xmlNode["CommonPaths"], "Affixes")
-        self.pathToVehiclePartTypes = read_from_xml_node(xmlNode["CommonPaths"], "VehiclePartTypes")
+        self.pathToRelationship = read_from_xml_node(child_nodes["CommonPaths"], "Relationship")
+        self.pathToGameObjects = read_from_xml_node(child_nodes["CommonPaths"], "GameObjects")
+        self.pathToQuests = read_from_xml_node(child_nodes["CommonPaths"], "Quests")
+        self.pathToResourceTypes = read_from_xml_node(child_nodes["CommonPaths"], "ResourceTypes")
+        self.pathToAffixes = read_from_xml_node(child_nodes["CommonPaths"], "Affixes")
+        self.pathToVehiclePartTypes = read_from_xml_node(child_nodes["CommonPaths"], "VehiclePartTypes")
 
-        self.distToTurnOnPhysics = float(read_from_xml_node(xmlNode["Physics"], "DistToTurnOnPhysics"))
-        self.distToTurnOffPhysics = float(read_from_xml_node(xmlNode["Physics"], "DistToTurnOffPhysics"))
-        self.physicStepTime = float(read_from_xml_node(xmlNode["Physics"], "PhysicStepTime"))
+        self.distToTurnOnPhysics = float(read_from_xml_node(child_nodes["Physics"], "DistToTurnOnPhysics"))
+        self.distToTurnOffPhysics = float(read_from_xml_node(child_nodes["Physics"], "DistToTurnOffPhysics"))
+        self.physicStepTime = float(read_from_xml_node(child_nodes["Physics"], "PhysicStepTime"))
         if self.distToTurnOffPhysics - 10.0 <= self.distToTurnOnPhysics:
             logger.error(f"Differenece between distToTurnOffPhysics {self.distToTurnOffPhysics} and "
                          f"distToTurnOnPhysics {self.distToTurnOnPhysics} is too low: ! "
                          "Set to be at least 10.0 appart")
 
-        self.barmenModelName = read_from_xml_node(xmlNode["Npc"], "BarmenModelName")
+        self.barmenModelName = read_from_xml_node(child_nodes["Npc"], "BarmenModelName")
 
         self.splintersAutoDisableLinearThreshold = \
-            float(read_from_xml_node(xmlNode["BreakableObjectSplinters"], "AutoDisableLinearThreshold"))
+            float(read_from_xml_node(child_nodes["BreakableObjectSplinters"], "AutoDisableLinearThreshold"))
         self.splintersAutoDisableAngularThreshold = \
-            float(read_from_xml_node(xmlNode["BreakableObjectSplinters"], "AutoDisableAngularThreshold"))
+            float(read_from_xml_node(child_nodes["BreakableObjectSplinters"], "AutoDisableAngularThreshold"))
         self.splintersAutoDisableNumSteps = \
-            int(read_from_xml_node(xmlNode["BreakableObjectSplinters"], "AutoDisableNumSteps"))
+            int(read_from_xml_node(child_nodes["BreakableObjectSplinters"], "AutoDisableNumSteps"))
 
         self.vehiclesDropChests = parse_str_to_bool(self.vehiclesDropChests,
-                                                    read_from_xml_node(xmlNode["Vehicles"], "VehiclesDropChests"))
-        maxSpeedWithNoFuel = float(read_from_xml_node(xmlNode["Vehicles"], "MaxSpeedWithNoFuel"))
+                                                    read_from_xml_node(child_nodes["Vehicles"], "VehiclesDropChests"))
+        maxSpeedWithNoFuel = float(read_from_xml_node(child_nodes["Vehicles"], "MaxSpeedWithNoFuel"))
         # ??? why? Is this working?
         self.maxSpeedWithNoFuel = maxSpeedWithNoFuel * 0.27777779  # 5/18 = 0.2(7) ???
 
-        self.infoAreaRadius = int(read_from_xml_node(xmlNode["SmartCursor"], "InfoAreaRadius"))
-        self.lockTimeout = float(read_from_xml_node(xmlNode["SmartCursor"], "LockTimeout"))
-        unlockRegion = read_from_xml_node(xmlNode["SmartCursor"], "UnlockRegion")
+        self.infoAreaRadius = int(read_from_xml_node(child_nodes["SmartCursor"], "InfoAreaRadius"))
+        self.lockTimeout = float(read_from_xml_node(child_nodes["SmartCursor"], "LockTimeout"))
+        unlockRegion = read_from_xml_node(child_nodes["SmartCursor"], "UnlockRegion")
         self.unlockRegion_x = float(unlockRegion.split()[0])
         self.unlockRegion_y = float(unlockRegion.split()[1])
         # ??? unused in actual game globalproperties.cfg
-        # self.infoObjUpdateTimeout = read_from_xml_node(xmlNode["SmartCursor"], "InfoObjUpdateTimeout")
+        # self.infoObjUpdateTimeout = read_from_xml_node(child_nodes["SmartCursor"], "InfoObjUpdateTimeout")
 
         self.blastWaveCameraShakeRadiusCoeff = \
-            float(read_from_xml_node(xmlNode["CameraController"], "BlastWaveCameraShakeRadiusCoeff"))
+            float(read_from_xml_node(child_nodes["CameraController"], "BlastWaveCameraShakeRadiusCoeff"))
         self.shakeDamageToDurationCoeff = \
-            float(read_from_xml_node(xmlNode["CameraController"], "ShakeDamageToDurationCoeff"))
-        self.maxShakeDamage = float(read_from_xml_node(xmlNode["CameraController"], "MaxShakeDamage"))
+            float(read_from_xml_node(child_nodes["CameraController"], "ShakeDamageToDurationCoeff"))
+        self.maxShakeDamage = float(read_from_xml_node(child_nodes["CameraController"], "MaxShakeDamage"))
         if self.maxShakeDamage <= 1.0:
             logger.warning("maxShakeDamage should be more than 1.0!")
 
-        self.distanceFromPlayerToMoveout = int(read_from_xml_node(xmlNode["Caravans"], "DistanceFromPlayerToMoveout"))
-
-        self.defaultLookBoxLength = float(read_from_xml_node(xmlNode["ObstacleAvoidance"], "DefaultLookBoxLength"))
-        self.defaultTargetBoxLength = float(read_from_xml_node(xmlNode["ObstacleAvoidance"], "DefaultTargetBoxLength"))
-        self.attractiveCoeff = float(read_from_xml_node(xmlNode["ObstacleAvoidance"], "AttractiveCoeff"))
-        self.repulsiveCoeff = float(read_from_xml_node(xmlNode["ObstacleAvoidance"], "RepulsiveCoeff"))
-        self.maxDistToAvoid = float(read_from_xml_node(xmlNode["ObstacleAvoidance"], "MaxDistToAvoid"))
-        self.predictionTime = float(read_from_xml_node(xmlNode["ObstacleAvoidance"], "PredictionTime"))
-
-        self.throwCoeff = float(read_from_xml_node(xmlNode["DeathProperties"], "ThrowCoeff"))
-        self.flowVpVelocity = float(read_from_xml_node(xmlNode["DeathProperties"], "FlowVpVelocity"))
-        self.flowWheelVelocity = float(read_from_xml_node(xmlNode["DeathProperties"], "FlowWheelVelocity"))
-        self.energyBlowDeltaTime = float(read_from_xml_node(xmlNode["DeathProperties"], "EnergyBlowDeltaTime"))
-        self.energyVpBlowProbability = int(read_from_xml_node(xmlNode["DeathProperties"], "EnergyVpBlowProbability"))
+        self.distanceFromPlayerToMoveout = \
+            int(read_from_xml_node(child_nodes["Caravans"], "DistanceFromPlayerToMoveout"))
+
+        self.defaultLookBoxLength = float(read_from_xml_node(child_nodes["ObstacleAvoidance"], "DefaultLookBoxLength"))
+        self.defaultTargetBoxLength = \
+            float(read_from_xml_node(child_nodes["ObstacleAvoidance"], "DefaultTargetBoxLength"))
+        self.attractiveCoeff = float(read_from_xml_node(child_nodes["ObstacleAvoidance"], "AttractiveCoeff"))
+        self.repulsiveCoeff = float(read_from_xml_node(child_nodes["ObstacleAvoidance"], "RepulsiveCoeff"))
+        self.maxDistToAvoid = float(read_from_xml_node(child_nodes["ObstacleAvoidance"], "MaxDistToAvoid"))
+        self.predictionTime = float(read_from_xml_node(child_nodes["ObstacleAvoidance"], "PredictionTime"))
+
+        self.throwCoeff = float(read_from_xml_node(child_nodes["DeathProperties"], "ThrowCoeff"))
+        self.flowVpVelocity = float(read_from_xml_node(child_nodes["DeathProperties"], "FlowVpVelocity"))
+        self.flowWheelVelocity = float(read_from_xml_node(child_nodes["DeathProperties"], "FlowWheelVelocity"))
+        self.energyBlowDeltaTime = float(read_from_xml_node(child_nodes["DeathProperties"], "EnergyBlowDeltaTime"))
+        self.energyVpBlowProbability = \
+            int(read_from_xml_node(child_nodes["DeathProperties"], "EnergyVpBlowProbability"))
         self.energyWheelBlowProbability = \
-            int(read_from_xml_node(xmlNode["DeathProperties"], "EnergyWheelBlowProbability"))
+            int(read_from_xml_node(child_nodes["DeathProperties"], "EnergyWheelBlowProbability"))
 
-        self.healthUnitPrice = float(read_from_xml_node(xmlNode["Repair"], "HealthUnitPrice"))
+        self.healthUnitPrice = float(read_from_xml_node(child_nodes["Repair"], "HealthUnitPrice"))
 
         self.defaultArticleRegenerationTime = \
-            float(read_from_xml_node(xmlNode["Articles"], "DefaultRegenerationTime"))
+            float(read_from_xml_node(child_nodes["Articles"], "DefaultRegenerationTime"))
         self.probabilityToDropArticlesFromDeadVehicles = \
-            float(read_from_xml_node(xmlNode["Articles"], "ProbabilityToDropArticlesFromDeadVehicles"))
+            float(read_from_xml_node(child_nodes["Articles"], "ProbabilityToDropArticlesFromDeadVehicles"))
         self.probabilityToDropGunsFromDeadVehicles = \
-            float(read_from_xml_node(xmlNode["Articles"], "ProbabilityToDropGunsFromDeadVehicles"))
+            float(read_from_xml_node(child_nodes["Articles"], "ProbabilityToDropGunsFromDeadVehicles"))
 
         self.zoneRespawnTimeOutIncreaseCoeff = \
-            float(read_from_xml_node(xmlNode["InfectionZones"], "ZoneRespawnTimeOutIncreaseCoeff"))
+            float(read_from_xml_node(child_nodes["InfectionZones"], "ZoneRespawnTimeOutIncreaseCoeff"))
         self.zoneDefaultFirstSpawnTime = \
-            float(read_from_xml_node(xmlNode["InfectionZones"], "ZoneDefaultFirstSpawnTime"))
+            float(read_from_xml_node(child_nodes["InfectionZones"], "ZoneDefaultFirstSpawnTime"))
 
-        self.colorFriend = read_from_xml_node(xmlNode["InterfaceStuff"], "ColorFriend")
-        self.colorEnemy = read_from_xml_node(xmlNode["InterfaceStuff"], "ColorEnemy")
-        self.colorTargetCaptured = read_from_xml_node(xmlNode["InterfaceStuff"], "ColorTargetCaptured")
-        self.targetInfoContourWidth = float(read_from_xml_node(xmlNode["InterfaceStuff"], "TargetInfoContourWidth"))
+        self.colorFriend = read_from_xml_node(child_nodes["InterfaceStuff"], "ColorFriend")
+        self.colorEnemy = read_from_xml_node(child_nodes["InterfaceStuff"], "ColorEnemy")
+        self.colorTargetCaptured = read_from_xml_node(child_nodes["InterfaceStuff"], "ColorTargetCaptured")
+        self.targetInfoContourWidth = \
+            float(read_from_xml_node(child_nodes["InterfaceStuff"], "TargetInfoContourWidth"))
         self.targetCapturedContourWidth = \
-            float(read_from_xml_node(xmlNode["InterfaceStuff"], "TargetCapturedContourWidth"))
+            float(read_from_xml_node(child_nodes["InterfaceStuff"], "TargetCapturedContourWidth"))
 
         self.playerPassMapUnpassableMu = \
-            float(read_from_xml_node(xmlNode["PlayerPassmap"], "PlayerPassMapUnpassableMu"))
+            float(read_from_xml_node(child_nodes["PlayerPassmap"], "PlayerPassMapUnpassableMu"))
         self.playerPassMapUnpassableErp = \
-            float(read_from_xml_node(xmlNode["PlayerPassmap"], "PlayerPassMapUnpassableErp"))
+            float(read_from_xml_node(child_nodes["PlayerPassmap"], "PlayerPassMapUnpassableErp"))
         self.playerPassMapUnpassableCfm = \
-            float(read_from_xml_node(xmlNode["PlayerPassmap"], "PlayerPassMapUnpassableCfm"))
+            float(read_from_xml_node(child_nodes["PlayerPassmap"], "PlayerPassMapUnpassableCfm"))
 
-        fullGroupingAngleDegree = float(read_from_xml_node(xmlNode["Weapon"], "MaxGroupingAngle"))
+        fullGroupingAngleDegree = float(read_from_xml_node(child_nodes["Weapon"], "MaxGroupingAngle"))
         self.maxGroupingAngle = fullGroupingAngleDegree * 0.017453292 * 0.5  # pi/180 = 0.017453292
-        self.timeOutForReAimGuns = float(read_from_xml_node(xmlNode["Weapon"], "TimeOutForReAimGuns"))
+        self.timeOutForReAimGuns = float(read_from_xml_node(child_nodes["Weapon"], "TimeOutForReAimGuns"))
 
-        for diffLevel in xmlNode["DifficultyLevels"].iterchildren():
+        for diffLevel in child_nodes["DifficultyLevels"].iterchildren(etree.Element):
             if diffLevel.tag == "Level":
                 coeffs = CoeffsForDifficultyLevel()
                 coeffs.LoadFromXML(xmlFile, diffLevel)
@@ -197,7 +204,7 @@ class GlobalProperties(object):
             else:
                 logger.warning(f"Unexpected tag {diffLevel.tag} in DifficultyLevels enumeration")
 
-        self.property2PriceCoeff = float(read_from_xml_node(xmlNode["Price"], "Property2PriceCoeff"))
+        self.property2PriceCoeff = float(read_from_xml_node(child_nodes["Price"], "Property2PriceCoeff"))
         if not self.difficultyLevelCoeffs:
             raise ValueError("No difficulty levels in GlobalProperties!")
 
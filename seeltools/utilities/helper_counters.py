@@ -0,0 +1,149 @@
+import sys
+import json
+from collections import Counter
+from functools import wraps
+from threading import Lock
+
+from utilities.log import logger
+from utilities.constants import XML_HELPERS_STACK_SAMPLE_RATE
+
+# outcomes of helper calls
+HIT = "hit"  # attribute or expected children were found, value is returned as is
+MISS = "miss"  # attribute or value is missing, default is returned
+CONVERSION = "conversion"  # value was found and converted
+INVALID = "invalid"  # value was found but couldn't be converted as is, warning branch
+UNEXPECTED = "unexpected"  # node has children with unexpected names
+EMPTY = "empty"  # node has no children at all
+
+VALID_BOOL_STRINGS = ("true", "1", "yes", "false", "0", "no")
+STACK_DEPTH = 8
+
+
+def get_frame_name(frame):
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__')}.{getattr(code, 'co_qualname', code.co_name)}:{frame.f_lineno}"
+
+
+def get_tag(xml_node):
+    return xml_node.tag if isinstance(xml_node.tag, str) else "comment"
+
+
+class HelperCounters(object):
+    ''' Counts of calls of xml helpers by helper, node tag, attribute name and outcome, with functions
+    calling them. Every sample_rate'th call also records stack it was called from.
+    Helpers are only counted when wrapped with counted(), which parse does on import if COUNT_XML_HELPERS is set.
+    Compiled schema loaders read attributes with read_from_xml_node then, so their fields are counted as well.
+    Values converted by parse_str_to_bool and parse_str_to_vector have no tag and attribute, only callers.
+    '''
+    def __init__(self, sample_rate: int = XML_HELPERS_STACK_SAMPLE_RATE):
+        self.sample_rate = max(1, sample_rate)
+        self.calls = Counter()  # {(helper, tag, attribute, outcome): calls}
+        self.callers = Counter()  # {(helper, caller): calls}
+        self.stacks = Counter()  # {(helper, stack): samples}
+        self.total_calls = 0
+        self._lock = Lock()
+
+    def record(self, helper: str, tag, attribute, outcome: str, frame):
+        with self._lock:
+            self.total_calls += 1
+            self.calls[(helper, tag, attribute, outcome)] += 1
+            self.callers[(helper, get_frame_name(frame).rsplit(":", 1)[0])] += 1
+            if self.total_calls % self.sample_rate == 0:
+                stack = []
+                while frame is not None and len(stack) < STACK_DEPTH:
+                    # wrappers of helpers called by other helpers are not a part of stack
+                    if frame.f_globals.get("__name__") != __name__:
+                        stack.append(get_frame_name(frame))
+                    frame = frame.f_back
+                self.stacks[(helper, tuple(stack))] += 1
+
+    def counted(self, helper: str, classify):
+        ''' Decorator counting calls of helper, classify gets result followed by arguments of the call
+        and returns (tag, attribute, outcome) '''
+        def decorator(function):
+            @wraps(function)
+            def counted_function(*args, **kwargs):
+                result = function(*args, **kwargs)
+                self.record(helper, *classify(result, *args, **kwargs), sys._getframe(1))
+                return result
+            return counted_function
+        return decorator
+
+    def get_helper_totals(self):
+        '''{helper: Counter({outcome: calls})}'''
+        totals = {}
+        for (helper, tag, attribute, outcome), calls in self.calls.items():
+            totals.setdefault(helper, Counter())[outcome] += calls
+        return totals
+
+    def get_top_attributes(self, limit: int = 20):
+        '''[((helper, tag, attribute), Counter({outcome: calls}))] with the most calls'''
+        attributes = {}
+        for (helper, tag, attribute, outcome), calls in self.calls.items():
+            attributes.setdefault((helper, tag, attribute), Counter())[outcome] += calls
+        return sorted(attributes.items(), key=lambda item: sum(item[1].values()), reverse=True)[:limit]
+
+    def to_dict(self, limit: int = 100):
+        return {"total_calls": self.total_calls,
+                "helpers": {helper: dict(outcomes) for helper, outcomes in self.get_helper_totals().items()},
+                "attributes": [{"helper": helper, "tag": tag, "attribute": attribute, "outcomes": dict(outcomes)}
+                               for (helper, tag, attribute), outcomes in self.get_top_attributes(limit)],
+                "callers": [{"helper": helper, "caller": caller, "calls": calls}
+                            for (helper, caller), calls in self.callers.most_common(limit)],
+                "stacks": [{"helper": helper, "stack": list(stack), "samples": samples}
+                           for (helper, stack), samples in self.stacks.most_common(limit)]}
+
+    def save_json(self, path: str, limit: int = 100):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(limit), f, indent=1)
+
+    def log_report(self, limit: int = 20):
+        '''Logs helpers, attributes and callers ranked by calls, they are candidates for compiled loaders'''
+        logger.info(f"Xml helpers were called {self.total_calls} times")
+        for helper, outcomes in sorted(self.get_helper_totals().items(), key=lambda item: -sum(item[1].values())):
+            logger.info(f"Helper {helper}: {sum(outcomes.values())} calls, {dict(outcomes)}")
+        for (helper, tag, attribute), outcomes in self.get_top_attributes(limit):
+            logger.info(f"Attribute {attribute} of {tag} by {helper}: {sum(outcomes.values())} calls, "
+                        f"{dict(outcomes)}")
+        for (helper, caller), calls in self.callers.most_common(limit):
+            logger.info(f"Caller {caller} of {helper}: {calls} calls")
+        for (helper, stack), samples in self.stacks.most_common(min(limit, 5)):
+            logger.info(f"Sampled {samples} times, {helper} called from: {' <- '.join(stack)}")
+
+
+def classify_read(result, xml_node, attrib_name, do_not_warn=False):
+    return get_tag(xml_node), attrib_name, HIT if result is not None else MISS
+
+
+def classify_check_and_set(result, property_default_value, xmlNode, name_to_check, convert_type=None,
+                           do_not_warn=True):
+    if xmlNode.attrib.get(name_to_check) is None:
+        return get_tag(xmlNode), name_to_check, MISS
+    return get_tag(xmlNode), name_to_check, CONVERSION if convert_type is not None else HIT
+
+
+def classify_bool(result, original_value, string, is_striped=False):
+    if string is None:
+        return None, None, MISS
+    return None, None, CONVERSION if string.lower() in VALID_BOOL_STRINGS else INVALID
+
+
+def classify_vector(result, string, size=3):
+    if string is None:
+        return None, None, MISS
+    return None, None, CONVERSION if len(string.split()) == size else INVALID
+
+
+def classify_mono(result, xml_node, expected_child_name, ignore_comments=False):
+    children = xml_node.getchildren()
+    if not children:
+        outcome = EMPTY
+    elif any(child.tag != expected_child_name and isinstance(child.tag, str) and child.tag != "comment"
+             for child in children):
+        outcome = UNEXPECTED
+    else:
+        outcome = HIT
+    return get_tag(xml_node), expected_child_name, outcome
+
+
+theHelperCounters = HelperCounters()
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from math import ceil, log10
+
 from utilities.value_classes import AnnotatedValue, SavingType
 
 
@@ -13,12 +16,30 @@ def vector_long_to_string(value):
     return f'{value["x"]} {value["y"]} {value["z"]} {value["w"]}'
 
 
+@lru_cache(maxsize=4096)
+def format_float_value(value: float):
+    '''Floats less than 1 are saved with as many decimal places as their order of magnitude needs'''
+    if value < 1:
+        precision = int(ceil(abs(log10(abs(value)))))
+        return f'{value:.{precision}f}'
+    return str(value)
+
+
+def format_common_value(value):
+    if type(value) is float:
+        # zero is kept out of cache, as 0.0 and -0.0 are the same key for it
+        if value == 0:
+            return f'{value:.1f}'
+        return format_float_value(value)
+    return str(value)
+
+
 def should_be_saved(annotatedValue: AnnotatedValue):
     if (
         annotatedValue.saving_type == SavingType.REQUIRED
         or annotatedValue.saving_type == SavingType.REQUIRED_SPECIFIC
         or (
-            annotatedValue.value != annotatedValue.default_value
+            annotatedValue.value != annotatedValue.base_value
             and (annotatedValue.value != '' and annotatedValue.value is not None)
         )
     ):
@@ -0,0 +1,177 @@
+import os
+import json
+import tracemalloc
+from threading import Lock, local, get_ident
+from time import perf_counter, thread_time
+
+from utilities.log import logger
+
+# categories of profiled sections
+PHASE = "phase"
+SOURCE_FILE = "file"
+PROTOTYPE_CLASS = "class"
+
+
+class SectionStats(object):
+    '''Totals of all runs of profiled section with the same category and name'''
+    __slots__ = ("calls", "wall_time", "cpu_time", "allocated", "counts")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.allocated = 0
+        self.counts = {}
+
+    def to_dict(self):
+        return {"calls": self.calls, "wall_time": self.wall_time, "cpu_time": self.cpu_time,
+                "allocated": self.allocated, "counts": self.counts}
+
+
+class ProfiledSection(object):
+    __slots__ = ("profiler", "category", "name", "keep_event", "counts", "start", "start_cpu", "start_memory")
+
+    def __init__(self, profiler, category: str, name: str, keep_event: bool):
+        self.profiler = profiler
+        self.category = category
+        self.name = name
+        self.keep_event = keep_event
+        self.counts = {}
+
+    def __enter__(self):
+        self.profiler._get_stack().append(self)
+        self.start_memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        self.start_cpu = thread_time()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall_time = perf_counter() - self.start
+        cpu_time = thread_time() - self.start_cpu
+        allocated = tracemalloc.get_traced_memory()[0] - self.start_memory if tracemalloc.is_tracing() else 0
+        self.profiler._get_stack().pop()
+        self.profiler._record(self, wall_time, cpu_time, allocated)
+        return False
+
+
+class NullSection(object):
+    '''Section returned by disabled profiler, does nothing'''
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_null_section = NullSection()
+
+
+class LoadProfiler(object):
+    ''' Records wall time, CPU time of the running thread and memory allocated by phases of Server load,
+    by parsing of source files and by loading of prototypes of every class. Memory is only measured
+    while tracemalloc is tracing. Sections are summed up by category and name, sections with kept events
+    are exported to Chrome trace format (chrome://tracing, ui.perfetto.dev).
+    '''
+    def __init__(self):
+        self.enabled = False
+        self.origin = 0.0
+        self.events = []  # [(category, name, thread id, start, wall time, cpu time, allocated, counts)]
+        self.stats = {}  # {category: {name: SectionStats}}
+        self._started_tracemalloc = False
+        self._lock = Lock()
+        self._local = local()
+
+    def start(self, trace_memory: bool = True):
+        '''Drops everything recorded before and starts recording'''
+        self.events = []
+        self.stats = {}
+        self.origin = perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def section(self, category: str, name: str, keep_event: bool = True):
+        '''Context manager profiling the code in it, sections can be nested'''
+        if not self.enabled:
+            return _null_section
+        return ProfiledSection(self, category, name, keep_event)
+
+    def add_counts(self, **counts):
+        '''Adds counts of processed items to the innermost open section of the current thread'''
+        if not self.enabled:
+            return
+        stack = self._get_stack()
+        if stack:
+            section_counts = stack[-1].counts
+            for count_name, amount in counts.items():
+                section_counts[count_name] = section_counts.get(count_name, 0) + amount
+
+    def _get_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, section: ProfiledSection, wall_time: float, cpu_time: float, allocated: int):
+        with self._lock:
+            stats = self.stats.setdefault(section.category, {}).get(section.name)
+            if stats is None:
+                stats = self.stats[section.category][section.name] = SectionStats()
+            stats.calls += 1
+            stats.wall_time += wall_time
+            stats.cpu_time += cpu_time
+            stats.allocated += allocated
+            for count_name, amount in section.counts.items():
+                stats.counts[count_name] = stats.counts.get(count_name, 0) + amount
+            if section.keep_event:
+                self.events.append((section.category, section.name, get_ident(), section.start - self.origin,
+                                    wall_time, cpu_time, allocated, section.counts))
+
+    def get_top(self, category: str, limit: int = 10):
+        '''[(name, SectionStats)] of category with the most wall time spent'''
+        stats = self.stats.get(category, {})
+        return sorted(stats.items(), key=lambda item: item[1].wall_time, reverse=True)[:limit]
+
+    def to_dict(self):
+        events = [{"category": category, "name": name, "thread": thread_id, "start": start, "wall_time": wall_time,
+                   "cpu_time": cpu_time, "allocated": allocated, "counts": counts}
+                  for category, name, thread_id, start, wall_time, cpu_time, allocated, counts in self.events]
+        totals = {category: {name: stats.to_dict() for name, stats in category_stats.items()}
+                  for category, category_stats in self.stats.items()}
+        return {"events": events, "totals": totals}
+
+    def to_chrome_trace(self):
+        '''Complete events of Trace Event Format, times are in microseconds'''
+        process_id = os.getpid()
+        trace_events = []
+        for category, name, thread_id, start, wall_time, cpu_time, allocated, counts in self.events:
+            args = {"cpu_time_ms": cpu_time * 1000, "allocated_bytes": allocated}
+            args.update(counts)
+            trace_events.append({"name": name, "cat": category, "ph": "X", "ts": start * 1e6, "dur": wall_time * 1e6,
+                                 "pid": process_id, "tid": thread_id, "args": args})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def save_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    def save_chrome_trace(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def log_report(self, limit: int = 10):
+        for category, title in ((PHASE, "Phase"), (SOURCE_FILE, "File"), (PROTOTYPE_CLASS, "Prototype class")):
+            for name, stats in self.get_top(category, limit):
+                counts = "".join(f", {count_name} {amount}" for count_name, amount in stats.counts.items())
+                logger.info(f"{title} {name}: {stats.wall_time:.3f}s wall, {stats.cpu_time:.3f}s cpu, "
+                            f"{stats.allocated / 1024 / 1024:.2f}MB allocated, {stats.calls} calls{counts}")
+
+
+theLoadProfiler = LoadProfiler()
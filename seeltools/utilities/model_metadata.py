@@ -0,0 +1,158 @@
+import os
+import pickle
+from copy import deepcopy
+from pathlib import Path
+from threading import Lock
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from utilities.log import logger
+from utilities.game_path import WORKING_DIRECTORY
+from utilities.parse import parse_model_group_health, track_source_file
+
+MODEL_METADATA_FORMAT_VERSION = 1
+
+module_path = Path(os.path.abspath(__file__))
+model_metadata_file_path = os.path.join(module_path.parent.parent, 'cache', 'model_metadata.pickle')
+
+
+class ModelMetadataStore(object):
+    ''' Metadata read from model files, memoized by resolved model path, size and mtime.
+    Store is kept between runs on disk, so unchanged models are never read again.
+    '''
+    def __init__(self, path: str = model_metadata_file_path):
+        self.path = path
+        self.models = {}  # {full_path: ((size, mtime), metadata)}
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+        self.loaded = False
+        self._scanning = {}  # {full_path: Future} for models being scanned right now
+        self._lock = Lock()
+
+    def get_full_path(self, relative_path: str):
+        return os.path.normpath(os.path.join(WORKING_DIRECTORY, relative_path))
+
+    def get_metadata(self, relative_path: str):
+        '''Cached metadata of model, model file is scanned if it's not known or was changed'''
+        if not self.loaded:
+            self.load()
+        full_path = self.get_full_path(relative_path)
+        file_stat = os.stat(full_path)
+        file_key = (file_stat.st_size, file_stat.st_mtime_ns)
+        track_source_file(full_path)
+        with self._lock:
+            cached = self.models.get(full_path)
+            if cached is not None and cached[0] == file_key:
+                self.hits += 1
+                return cached[1]
+            scanning = self._scanning.get(full_path)
+            if scanning is None:
+                self.misses += 1
+                scanning = self._scanning[full_path] = Future()
+                is_scanning_thread = True
+            else:
+                is_scanning_thread = False
+        # same model requested from several threads is scanned only once
+        if not is_scanning_thread:
+            return scanning.result()
+
+        try:
+            metadata = self.scan_model(full_path)
+        except Exception as error:
+            with self._lock:
+                del self._scanning[full_path]
+            scanning.set_exception(error)
+            raise
+        with self._lock:
+            self.models[full_path] = (file_key, metadata)
+            self.changed = True
+            del self._scanning[full_path]
+        scanning.set_result(metadata)
+        return metadata
+
+    def scan_model(self, full_path: str):
+        group_health = parse_model_group_health(full_path)
+        variants = None
+        if group_health is not None:
+            variants = {group_name: group["variants"] for group_name, group in group_health.items()}
+        return {"group_health": group_health,
+                "variants": variants}
+
+    def get_group_health(self, relative_path: str):
+        '''Copy of GroupHealth of model, safe to be modified by caller'''
+        return deepcopy(self.get_metadata(relative_path)["group_health"])
+
+    def load(self):
+        self.loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                stored = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError) as error:
+            logger.warning(f"Can't read model metadata from '{self.path}': {error}")
+            return
+        if stored.get("version") == MODEL_METADATA_FORMAT_VERSION:
+            with self._lock:
+                for full_path, cached in stored["models"].items():
+                    self.models.setdefault(full_path, cached)
+
+    def save(self):
+        '''Writes store to disk if new models were scanned'''
+        if not self.changed:
+            return
+        temp_path = f"{self.path}.tmp"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            stored = {"version": MODEL_METADATA_FORMAT_VERSION,
+                      "models": dict(self.models)}
+            self.changed = False
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(stored, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            logger.warning(f"Can't save model metadata to '{self.path}': {error}")
+
+
+class ModelPrescan(object):
+    ''' Scans model files into metadata store on a thread pool, so model files are read while
+    game objects xmls are still being parsed. Failed scans are logged and don't stop the prescan.
+    '''
+    def __init__(self, store: ModelMetadataStore, max_workers: int = None, progress_step: int = 100):
+        self.store = store
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or min(8, os.cpu_count() or 1))
+        self.progress_step = progress_step
+        self.scans = {}  # {relative_path: Future}
+        self.failures = {}  # {relative_path: error}
+        self.completed = 0
+        self._lock = Lock()
+
+    def submit(self, relative_path: str):
+        with self._lock:
+            if relative_path in self.scans:
+                return
+            self.scans[relative_path] = self.executor.submit(self._scan, relative_path)
+
+    def _scan(self, relative_path: str):
+        try:
+            self.store.get_metadata(relative_path)
+        except Exception as error:
+            logger.warning(f"Failed to prescan model '{relative_path}': {error}")
+            with self._lock:
+                self.failures[relative_path] = error
+        with self._lock:
+            self.completed += 1
+            completed = self.completed
+            total = len(self.scans)
+        if completed % self.progress_step == 0:
+            logger.info(f"Prescanned {completed}/{total} models")
+
+    def wait(self):
+        '''Waits for all scheduled scans, returns {relative_path: error} for failed ones'''
+        self.executor.shutdown(wait=True)
+        logger.info(f"Prescanned {self.completed} models, {len(self.failures)} failed")
+        return self.failures
+
+
+theModelMetadataStore = ModelMetadataStore()
@@ -1,93 +1,150 @@
 import os
+import mmap
+import threading
 from lxml import etree, objectify
 from html import unescape
 from urllib.parse import unquote
 
 from utilities.game_path import WORKING_DIRECTORY
 from utilities.log import logger
-from utilities.constants import VehicleGamStruct
+from utilities.gam_reader import GamFile
+from utilities.xml_cache import XmlTreeCache
+from utilities.constants import XML_BACKEND, COUNT_XML_HELPERS
+from utilities.load_profiler import theLoadProfiler, SOURCE_FILE
+from utilities.value_classes import record_xml_read
+from utilities import helper_counters
 
 ENCODING = 'windows-1251'
 
+# full paths of every game file read by the parse helpers, used to validate Server snapshots
+loaded_source_files = set()
+
+
+def track_source_file(full_path: str):
+    '''Remember game file as a source of the currently loaded state'''
+    loaded_source_files.add(os.path.normpath(full_path))
+
+
+# parsed trees are shared between all callers of xml_to_etree during the session
+theXmlTreeCache = XmlTreeCache()
+
 
 def parse_logos_gam(path: str):
-    logo_list = []
-    with open(path, 'rb') as f:
-        str_from_file = f.read()
-    logo_list_raw = str_from_file.split(b'.dds')
-    for byte_str in logo_list_raw:
-        logo_list.append(byte_str[byte_str.rindex(b'\x00') + 1:].decode('latin-1'))
-    return logo_list
+    track_source_file(path)
+    with GamFile(path) as gam_file:
+        return list(gam_file.logos)
 
 
 def parse_model_group_health(relative_path: str):
     logger.debug(f"Trying to parse ModelGroups from '{relative_path}'")
-    group_health = {}
-    with open(os.path.join(WORKING_DIRECTORY, relative_path), 'rb') as f:
-        str_from_file = f.read()
-    if VehicleGamStruct.GROUP_HEALTH_HEADER.value in str_from_file:
-        main_header = VehicleGamStruct.GROUP_HEALTH_HEADER.value
-    elif VehicleGamStruct.GROUP_HEALTH_HEADER_URAL_CARGO.value in str_from_file:
-        main_header = VehicleGamStruct.GROUP_HEALTH_HEADER_URAL_CARGO.value
-    else:
+    full_path = os.path.join(WORKING_DIRECTORY, relative_path)
+    track_source_file(full_path)
+    with GamFile(full_path) as gam_file:
+        group_health = gam_file.group_health
+    if group_health is None:
         logger.debug(f"Model file '{relative_path}' given doesn't contain known GroupHealth headers!")
-        return None
-    group_health["Main"] = {"id": None,
-                            "variants": None}
-    if VehicleGamStruct.BREAKABLE_BSTR.value in str_from_file:
-        main_breakable_raw = str_from_file.split(main_header)
-        breakables_raw = main_breakable_raw[1][main_breakable_raw[1].index(VehicleGamStruct.BREAKABLE_BSTR.value):]
-        current_index = 0
-        while True:
-            if breakables_raw[current_index:current_index + 3] == b"\x49\x56\x52":  # IVR
-                break
-            # finding amount of variants for groups which dictates chunk length
-            variants = breakables_raw[current_index + 28]
-            if variants == 2:
-                chunk_size = 60
-            elif variants == 3:
-                chunk_size = 72
-            else:
-                logger.error(f"Tried to parse HealthGroups for model containing group with {variants} variants!"
-                             "Only 2 and 3 are supported by toolkit!")
-
-            breakable_string = breakables_raw[current_index:current_index + chunk_size]
-
-            if VehicleGamStruct.BREAKABLE_BSTR.value in breakable_string:
-                # TODO: 1251
-                breakable_name = breakable_string[:11].decode('latin-1').replace('\x00', '')
-                breakable_id = int(breakable_string[11:][21:22].hex(), 16)
-                group_health[breakable_name] = {"id": breakable_id,
-                                                "variants": variants}
-            current_index += chunk_size
-
-        # for byte_str in breakables_list:
-        #     if VehicleGamStruct.BREAKABLE_BSTR.value in byte_str:
-        #         breakable_name = byte_str[:11].decode('latin-1').replace('\x00', '')
-        #         breakable_id = int(byte_str[11:][21:22].hex(), 16)
-        #         group_health[breakable_name] = breakable_id
-        return group_health
-    else:
+    elif len(group_health) == 1:
         logger.debug(f"Model file '{relative_path}' doesn't contain any breakable health zones.")
-        return group_health
+    return group_health
 
 
-def xml_to_objfy(path_to_file: str):
+def xml_to_etree(path_to_file: str, use_cache: bool = True, writable: bool = False):
+    ''' Root of parsed xml file, plain lxml.etree element unless objectify backend is selected.
+    Cached trees are shared by all loaders, writable should be set by callers which modify the tree '''
     full_path = os.path.join(WORKING_DIRECTORY, path_to_file)
-    with open(full_path, 'r', encoding=ENCODING) as f:
-        parser_recovery = objectify.makeparser(recover=True, encoding=ENCODING, collect_ids=False)
-        objectify.enable_recursive_str()
-        objfy = objectify.parse(f, parser_recovery)
-    objectify_tree = objfy.getroot()
+    track_source_file(full_path)
+    parse_function = _parse_objfy if xml_backend == "objectify" else _parse_etree
+    if theLoadProfiler.enabled:
+        parse_function = _profile_parse(parse_function, path_to_file)
+    if use_cache:
+        return theXmlTreeCache.get_tree(full_path, parse_function, writable)
+    return parse_function(full_path)
+
+
+def set_xml_backend(backend: str):
+    '''Switches parser used by xml_to_etree and iterparse_xml, trees parsed by previous backend are dropped'''
+    global xml_backend
+    if backend not in ("etree", "objectify"):
+        raise ValueError(f"Unknown xml backend: {backend}")
+    xml_backend = backend
+    theXmlTreeCache.clear()
+
+
+xml_backend = XML_BACKEND
+
+
+def _profile_parse(parse_function, path_to_file: str):
+    def parse_file(full_path: str):
+        with theLoadProfiler.section(SOURCE_FILE, path_to_file):
+            theLoadProfiler.add_counts(bytes=os.path.getsize(full_path))
+            return parse_function(full_path)
+    return parse_file
+
+
+# lxml parsers can be reused for any number of files, but not by two threads at once
+_thread_parsers = threading.local()
+
+
+def get_xml_parser(backend: str = None):
+    '''Recover parser of the current thread for backend, created on first use and reused afterwards'''
+    backend = backend or xml_backend
+    parsers = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    parser = parsers.get(backend)
+    if parser is None:
+        if backend == "objectify":
+            parser = objectify.makeparser(recover=True, encoding=ENCODING, collect_ids=False)
+        else:
+            parser = etree.XMLParser(recover=True, encoding=ENCODING, remove_blank_text=True, collect_ids=False)
+        parsers[backend] = parser
+    return parser
+
+
+def _parse_file(full_path: str, parse_function, parser):
+    ''' Raw bytes of file are given to parser, so libxml2 decodes them from ENCODING once.
+    File is mapped to memory instead of being read when possible.
+    '''
+    with open(full_path, 'rb') as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files and files on some virtual filesystems can't be mapped
+            return parse_function(f.read(), parser, base_url=full_path)
+        with buffer:
+            return parse_function(buffer, parser, base_url=full_path)
+
+
+def _parse_etree(full_path: str):
+    return _parse_file(full_path, etree.fromstring, get_xml_parser("etree"))
+
+
+def _parse_objfy(full_path: str):
+    objectify.enable_recursive_str()
+    objectify_tree = _parse_file(full_path, objectify.fromstring, get_xml_parser("objectify"))
 
     # for obj in objectify_tree.iterchildren():
     #     tag_object_tree(obj, objectify_tree.tag)
     return objectify_tree
 
 
+def iterparse_xml(path_to_file: str, events=("start", "end", "comment"), tag=None):
+    ''' Streams parse events of xml file without building the whole tree first, elements are the same
+    as xml_to_etree would give. Only nodes with given tags produce events if tag is given.
+    Caller should clear consumed elements to keep memory low.
+    '''
+    full_path = os.path.join(WORKING_DIRECTORY, path_to_file)
+    track_source_file(full_path)
+    context = etree.iterparse(full_path, events=events, recover=True, encoding=ENCODING,
+                              remove_blank_text=True, collect_ids=False, tag=tag)
+    if xml_backend == "objectify":
+        context.set_element_class_lookup(objectify.ObjectifyElementClassLookup())
+    return context
+
+
 def parse_config(xml_file):
     config = {}
-    tree = xml_to_objfy(xml_file)
+    tree = xml_to_etree(xml_file)
     if tree.tag == 'config':
         config_entries = tree.attrib
         for entry_name in config_entries:
@@ -102,10 +159,11 @@ def parse_config(xml_file):
         raise NameError("Config should contain config tag with config entries as attributes!")
 
 
-def read_from_xml_node(xml_node: objectify.ObjectifiedElement, attrib_name: str, do_not_warn: bool = False):
+def read_from_xml_node(xml_node: etree._Element, attrib_name: str, do_not_warn: bool = False):
     attribs = xml_node.attrib
     if attribs:
         prot = attribs.get(attrib_name)
+        record_xml_read(prot is not None)
         if prot is not None:
             return prot
         else:
@@ -115,13 +173,19 @@ def read_from_xml_node(xml_node: objectify.ObjectifiedElement, attrib_name: str,
             return None
 
     else:
+        record_xml_read(False)
         logger.warning(f"Node {xml_node.tag} of {xml_node.base} is empty!")
-        if xml_node.tag == "comment":
+        if is_comment(xml_node):
             log_comment(xml_node, xml_node.getparent())
         return None
 
 
-def is_xml_node_contains(xml_node: objectify.ObjectifiedElement, attrib_name: str):
+def is_comment(xml_node: etree._Element):
+    '''Objectify backend gives comments "comment" tag, plain etree uses Comment factory as their tag'''
+    return xml_node.tag is etree.Comment or xml_node.tag == "comment"
+
+
+def is_xml_node_contains(xml_node: etree._Element, attrib_name: str):
     attribs = xml_node.attrib
     if attribs:
         return attribs.get(attrib_name) is not None
@@ -129,25 +193,42 @@ def is_xml_node_contains(xml_node: objectify.ObjectifiedElement, attrib_name: st
         logger.warning(f"Asking for attributes of node without attributes: {xml_node.base}")
 
 
-def child_from_xml_node(xml_node: objectify.ObjectifiedElement, child_name: str, do_not_warn: bool = False):
-    '''Get child from ObjectifiedElement by name'''
-    try:
-        return xml_node[child_name]
-    except AttributeError:
-        if not do_not_warn:
-            logger.warning(f"There is no child with name {child_name} for xml node {xml_node.tag} in {xml_node.base}")
-        return None
+def child_from_xml_node(xml_node: etree._Element, child_name: str, do_not_warn: bool = False):
+    '''Get first child of xml node by name'''
+    child = next(xml_node.iterchildren(child_name), None)
+    record_xml_read(child is not None)
+    if child is None and not do_not_warn:
+        logger.warning(f"There is no child with name {child_name} for xml node {xml_node.tag} in {xml_node.base}")
+    return child
+
+
+def children_from_xml_node(xml_node: etree._Element, child_name: str, do_not_warn: bool = False):
+    '''Get list of all children of xml node with the name, in document order'''
+    children = list(xml_node.iterchildren(child_name))
+    record_xml_read(bool(children))
+    if not children and not do_not_warn:
+        logger.warning(f"There is no child with name {child_name} for xml node {xml_node.tag} in {xml_node.base}")
+    return children
 
 
-def check_mono_xml_node(xml_node: objectify.ObjectifiedElement, expected_child_name: str,
+def get_child_map(xml_node: etree._Element):
+    ''' First child of xml node for every tag, {tag: child}. Map is built in one pass over children,
+    for loaders looking up many different children of the same node'''
+    children_by_tag = {}
+    for child in xml_node.iterchildren(etree.Element):
+        children_by_tag.setdefault(child.tag, child)
+    return children_by_tag
+
+
+def check_mono_xml_node(xml_node: etree._Element, expected_child_name: str,
                         ignore_comments: bool = False):
     children = xml_node.getchildren()
     if len(children) > 0:
         for child in children:
             if child.tag != expected_child_name:
-                if child.tag == "comment" and ignore_comments:
+                if is_comment(child) and ignore_comments:
                     return
-                elif child.tag == "comment":
+                elif is_comment(child):
                     comment = unescape(str(etree.tostring(child))).strip("b'<!-- ").strip(" -->'")
                     path = unquote(xml_node.base).replace(f'file:/{WORKING_DIRECTORY}', '')
                     logger.debug(f"Comment '{comment}' "
@@ -161,7 +242,7 @@ def check_mono_xml_node(xml_node: objectify.ObjectifiedElement, expected_child_n
                      f"nodes with a name '{expected_child_name}' in '{xml_node.base}'")
 
 
-def log_comment(comment_node: objectify.ObjectifiedElement, parent_node: objectify.ObjectifiedElement):
+def log_comment(comment_node: etree._Element, parent_node: etree._Element):
     comment = unescape(str(etree.tostring(comment_node))).strip("b'<!-- ").strip(" -->'")
     path = unquote(parent_node.base).replace(f'file:/{WORKING_DIRECTORY}', '')
     logger.debug(f"Comment '{comment}' "
@@ -244,3 +325,17 @@ def safe_check_and_set(property_default_value, xmlNode, name_to_check, convert_t
             return int(value_from_xml)
     else:
         return property_default_value
+
+
+if COUNT_XML_HELPERS:
+    # helpers are replaced before loaders import them, so nothing is wrapped when counting is disabled
+    read_from_xml_node = helper_counters.theHelperCounters.counted(
+        "read_from_xml_node", helper_counters.classify_read)(read_from_xml_node)
+    safe_check_and_set = helper_counters.theHelperCounters.counted(
+        "safe_check_and_set", helper_counters.classify_check_and_set)(safe_check_and_set)
+    parse_str_to_bool = helper_counters.theHelperCounters.counted(
+        "parse_str_to_bool", helper_counters.classify_bool)(parse_str_to_bool)
+    parse_str_to_vector = helper_counters.theHelperCounters.counted(
+        "parse_str_to_vector", helper_counters.classify_vector)(parse_str_to_vector)
+    check_mono_xml_node = helper_counters.theHelperCounters.counted(
+        "check_mono_xml_node", helper_counters.classify_mono)(check_mono_xml_node)
@@ -0,0 +1,72 @@
+from threading import Lock
+
+
+class SymbolTable(object):
+    ''' Interned names of prototypes, classes, resources, models and strings. Every name gets dense integer id
+    on first intern, the same name always gets the same id and the same str object. Managers map symbol ids
+    to their own ids with SymbolIndex, so name once interned is resolved by list indexing everywhere.
+    '''
+    def __init__(self):
+        self.ids = {}  # {name: symbol id}
+        self.names = []  # names indexed by symbol id
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name: str):
+        '''Symbol id of name, new id is assigned if name wasn't seen before'''
+        symbol_id = self.ids.get(name)
+        if symbol_id is None:
+            with self._lock:
+                symbol_id = self.ids.get(name)
+                if symbol_id is None:
+                    symbol_id = len(self.names)
+                    self.names.append(name)
+                    self.ids[name] = symbol_id
+        return symbol_id
+
+    def intern_name(self, name: str):
+        '''The single str object kept for name, None is returned as is'''
+        if name is None:
+            return None
+        return self.names[self.intern(name)]
+
+    def get_id(self, name: str):
+        '''Symbol id of name or -1 if name was never interned'''
+        return self.ids.get(name, -1)
+
+    def get_name(self, symbol_id: int):
+        return self.names[symbol_id]
+
+    def restore(self, names):
+        '''Replaces table with names stored before, ids stay the same as they were'''
+        with self._lock:
+            self.names = list(names)
+            self.ids = {name: symbol_id for symbol_id, name in enumerate(self.names)}
+
+
+class SymbolIndex(object):
+    '''Values indexed by symbol id of their names, ex: prototype ids by symbols of prototype names'''
+    def __init__(self, missing=-1):
+        self.values = []
+        self.missing = missing
+
+    def __len__(self):
+        return sum(1 for value in self.values if value != self.missing)
+
+    def set(self, symbol_id: int, value):
+        if symbol_id >= len(self.values):
+            self.values.extend([self.missing] * (symbol_id + 1 - len(self.values)))
+        self.values[symbol_id] = value
+
+    def get(self, symbol_id: int):
+        if 0 <= symbol_id < len(self.values):
+            return self.values[symbol_id]
+        return self.missing
+
+    def get_by_name(self, name: str):
+        return self.get(theSymbolTable.get_id(name))
+
+
+theSymbolTable = SymbolTable()
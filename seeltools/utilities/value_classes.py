@@ -1,5 +1,7 @@
 from enum import Enum
 from copy import deepcopy
+from threading import local
+from contextlib import contextmanager
 
 
 class DisplayType(Enum):
@@ -31,7 +33,133 @@ class SavingType(Enum):
     REQUIRED_SPECIFIC = 5  # save REQUIRED, even if equel to default_value. Saving behaviour implemented in Class itself
 
 
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum, frozenset)
+
+
+class Marker(object):
+    '''Special state of AnnotatedValue slot, named by the module global it's stored in'''
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+    def __reduce__(self):
+        # keeps marker the same object after pickling and copying
+        return self.name
+
+
+SHARED_DEFAULT = Marker("SHARED_DEFAULT")  # default is the shared default from FieldMeta
+INHERITED = Marker("INHERITED")  # value is not overridden and is read from parent value
+
+_load_records = local()
+
+
+def is_immutable(value):
+    if isinstance(value, tuple):
+        return all(is_immutable(item) for item in value)
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
+class InheritanceChain(object):
+    ''' Shared by value and all values inheriting from it, directly or through other values.
+    Epoch is bumped whenever any of them is changed, invalidating values resolved by the others'''
+    __slots__ = ("epoch",)
+
+    def __init__(self):
+        self.epoch = 0
+
+
+class LoadRecord(object):
+    ''' Fields assigned while one prototype is loaded. Assignment is counted as reset of field to the value
+    loader uses when xml has none if the last xml read made before it found nothing. Otherwise it's counted
+    as read from xml, values derived from other fields without reads in between included'''
+    __slots__ = ("last_read_found", "read_fields", "reset_fields")
+
+    def __init__(self):
+        self.last_read_found = None  # None if nothing was read since the previous assignment
+        self.read_fields = set()
+        self.reset_fields = set()
+
+    def xml_read(self, found: bool):
+        self.last_read_found = found
+
+    def assigned(self, annotated_value):
+        if self.last_read_found is False:
+            self.reset_fields.add(annotated_value)
+        else:
+            self.read_fields.add(annotated_value)
+        self.last_read_found = None
+
+    def is_reset(self, annotated_value):
+        '''Field was reset by loader and never assigned from xml'''
+        return annotated_value in self.reset_fields and annotated_value not in self.read_fields
+
+
+@contextmanager
+def recording_loaded_fields():
+    '''Records fields assigned in this thread into LoadRecord, nested loads get records of their own'''
+    previous_record = getattr(_load_records, "current", None)
+    load_record = _load_records.current = LoadRecord()
+    try:
+        yield load_record
+    finally:
+        _load_records.current = previous_record
+
+
+def get_load_record():
+    return getattr(_load_records, "current", None)
+
+
+def record_xml_read(found: bool):
+    '''Called by xml helpers, tells if attribute or child they looked for was found'''
+    load_record = getattr(_load_records, "current", None)
+    if load_record is not None:
+        load_record.xml_read(found)
+
+
+class FieldMeta(object):
+    ''' Description of AnnotatedValue field shared by all values created with the same arguments,
+    so every prototype of a class refers to one FieldMeta per field. Default is only kept here if immutable.
+    '''
+    __slots__ = ("name", "group_type", "saving_type", "display_type", "read_only", "default_value")
+
+    def __init__(self, name, group_type, saving_type, display_type, read_only, default_value):
+        self.name = name
+        self.group_type = group_type
+        self.saving_type = saving_type
+        self.display_type = display_type
+        self.read_only = read_only
+        self.default_value = default_value
+
+    def __reduce__(self):
+        return (get_field_meta, (self.name, self.group_type, self.saving_type, self.display_type,
+                                 self.read_only, self.default_value))
+
+
+field_metas = {}
+
+
+def get_field_meta(name, group_type, saving_type, display_type, read_only, default_value=None):
+    # type of default is a part of the key, as 1 == 1.0 == True
+    key = (name, group_type, saving_type, display_type, read_only, type(default_value), default_value)
+    field_meta = field_metas.get(key)
+    if field_meta is None:
+        field_meta = field_metas.setdefault(key, FieldMeta(name, group_type, saving_type, display_type,
+                                                           read_only, default_value))
+    return field_meta
+
+
 class AnnotatedValue(object):
+    ''' Value of prototype field with its dirty state, everything else describing the field is in shared
+    FieldMeta. Immutable defaults are shared too, mutable ones are copied for every value.
+    Value can inherit from the same field of parent prototype, then it keeps no value of its own
+    until it's overridden, and value resolved through the chain of parents is cached
+    until something in the chain is changed.
+    '''
+    __slots__ = ("_value", "meta", "_default_value", "previous_value", "is_dirty",
+                 "_parent", "_chain", "_resolved_epoch", "_resolved_value")
+
     def __init__(self,
                  value,  # any Type,
                  name: str,  # service name to map with display name and description
@@ -42,25 +170,152 @@ class AnnotatedValue(object):
                  display_type: int = None,  # types with fancy display widget(for ex: enums to choose dropdown)
                  read_only: bool = False,
                  is_dirty: bool = False):
-        self.value = value
-        self.name = name
-        self.group_type = group_type
+        self._value = value
 
         if group_type == GroupType.INTERNAL and saving_type is None:
-            self.saving_type = SavingType.IGNORE
+            saving_type = SavingType.IGNORE
         elif saving_type is None:
-            self.saving_type = SavingType.COMMON
-        else:
-            self.saving_type = saving_type
+            saving_type = SavingType.COMMON
 
         # we want to create new AnnotatedValues only in Init of classes and after that manipulate them directly
         # in that case default_value always should be same as value
         if default_value is None:
-            self.default_value = deepcopy(value)
+            default_value = value
+        if is_immutable(default_value):
+            self.meta = get_field_meta(name, group_type, saving_type, display_type, read_only, default_value)
+            self._default_value = SHARED_DEFAULT
         else:
-            self.default_value = default_value
+            self.meta = get_field_meta(name, group_type, saving_type, display_type, read_only)
+            self._default_value = deepcopy(default_value) if default_value is value else default_value
 
         self.previous_value = previous_value
-        self.display_type = display_type
-        self.read_only = read_only
         self.is_dirty = is_dirty
+        self._parent = None
+        self._chain = None  # InheritanceChain, only values with parent or heirs have it
+        self._resolved_epoch = -1  # epoch of chain at which value was resolved through parents
+        self._resolved_value = None
+
+    @property
+    def name(self):
+        return self.meta.name
+
+    @property
+    def group_type(self):
+        return self.meta.group_type
+
+    @property
+    def saving_type(self):
+        return self.meta.saving_type
+
+    @property
+    def display_type(self):
+        return self.meta.display_type
+
+    @property
+    def read_only(self):
+        return self.meta.read_only
+
+    @property
+    def default_value(self):
+        if self._default_value is SHARED_DEFAULT:
+            return self.meta.default_value
+        return self._default_value
+
+    @default_value.setter
+    def default_value(self, new_default_value):
+        self._default_value = new_default_value
+
+    @property
+    def value(self):
+        value = self._value
+        if value is INHERITED:
+            return self._resolve()
+        return value
+
+    @value.setter
+    def value(self, new_value):
+        current_value = self.value
+        # same object assigned again is treated as change, as it might've been modified in place
+        if new_value is current_value or new_value != current_value:
+            if not self.is_dirty:
+                self.previous_value = current_value
+                self.is_dirty = True
+            self._invalidate_heirs()
+        self._value = new_value
+        load_record = getattr(_load_records, "current", None)
+        if load_record is not None:
+            load_record.assigned(self)
+
+    def _resolve(self):
+        epoch = self._chain.epoch
+        if self._resolved_epoch == epoch:
+            return self._resolved_value
+        parent = self._parent
+        while parent._value is INHERITED:
+            parent = parent._parent
+        self._resolved_epoch = epoch
+        self._resolved_value = parent._value
+        return parent._value
+
+    def _invalidate_heirs(self):
+        if self._chain is not None:
+            self._chain.epoch += 1
+
+    @property
+    def inherited_from(self):
+        '''Value of parent prototype this value inherits from, None if it doesn't inherit'''
+        return self._parent
+
+    @property
+    def is_inherited(self):
+        '''Value is not overridden and comes from parent'''
+        return self._value is INHERITED
+
+    @property
+    def base_value(self):
+        '''Value this one is compared to on saving: value of parent if inherits, default otherwise'''
+        if self._parent is not None:
+            return self._parent.value
+        return self.default_value
+
+    @property
+    def is_base_dirty(self):
+        '''Some value in the chain of parents was changed, so was the base value'''
+        parent = self._parent
+        while parent is not None:
+            if parent.is_dirty:
+                return True
+            parent = parent._parent
+        return False
+
+    def inherit_from(self, parent_value):
+        ''' Links value to the same field of parent prototype, own value is dropped.
+        Parents are linked before their heirs, as prototypes are loaded'''
+        chain = parent_value._chain
+        if chain is None:
+            chain = parent_value._chain = InheritanceChain()
+        self._parent = parent_value
+        self._chain = chain
+        self._resolved_epoch = -1
+        self.inherit()
+
+    def inherit(self):
+        '''Drops overridden value, so value comes from parent again'''
+        if self._parent is None or self._value is INHERITED:
+            return
+        if self.base_value != self._value and not self.is_dirty:
+            self.previous_value = self._value
+            self.is_dirty = True
+        self._value = INHERITED
+        self._invalidate_heirs()
+
+    def mark_dirty(self):
+        '''For changes made in place to mutable values'''
+        if not self.is_dirty:
+            self.previous_value = deepcopy(self.value)
+            self.is_dirty = True
+        self._invalidate_heirs()
+
+    def mark_clean(self):
+        self.is_dirty = False
+        self.previous_value = None
@@ -0,0 +1,91 @@
+import os
+import copy
+import hashlib
+from threading import Lock
+from collections import OrderedDict
+
+DEFAULT_MAX_CACHED_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_CACHED_TREES = 512
+
+
+class XmlTreeCache(object):
+    ''' Thread-safe LRU cache of parsed xml trees keyed by file path, mtime and size.
+    Content hash can be added to the key for files which can change without changing mtime.
+    Cached trees are shared between read-only callers, callers which are going to modify the tree should ask
+    for a writable copy, so the cached tree stays as parsed. Size of file on disk is used as a weight
+    of the cached tree.
+    '''
+    def __init__(self, max_bytes: int = DEFAULT_MAX_CACHED_BYTES, max_trees: int = DEFAULT_MAX_CACHED_TREES,
+                 use_content_hash: bool = False):
+        self.max_bytes = max_bytes
+        self.max_trees = max_trees
+        self.use_content_hash = use_content_hash
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._trees = OrderedDict()  # {path: (file_key, tree, weight)}
+        self._lock = Lock()
+
+    def _get_file_key(self, path: str):
+        file_stat = os.stat(path)
+        if self.use_content_hash:
+            with open(path, 'rb') as f:
+                content_hash = hashlib.sha1(f.read()).hexdigest()
+            return (file_stat.st_mtime_ns, file_stat.st_size, content_hash), file_stat.st_size
+        return (file_stat.st_mtime_ns, file_stat.st_size), file_stat.st_size
+
+    def get_tree(self, full_path: str, parse_function, writable: bool = False):
+        ''' Returns cached tree for file or parses it with parse_function(full_path) and caches result.
+        Writable tree is a deep copy owned by the caller '''
+        tree = self._get_shared_tree(full_path, parse_function)
+        return copy.deepcopy(tree) if writable else tree
+
+    def _get_shared_tree(self, full_path: str, parse_function):
+        path = os.path.normpath(full_path)
+        file_key, weight = self._get_file_key(path)
+        with self._lock:
+            cached = self._trees.get(path)
+            if cached is not None and cached[0] == file_key:
+                self._trees.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        tree = parse_function(full_path)
+
+        with self._lock:
+            self._remove(path)
+            if weight <= self.max_bytes:
+                self._trees[path] = (file_key, tree, weight)
+                self.cached_bytes += weight
+                self._evict()
+        return tree
+
+    def _remove(self, path: str):
+        cached = self._trees.pop(path, None)
+        if cached is not None:
+            self.cached_bytes -= cached[2]
+
+    def _evict(self):
+        while self._trees and (self.cached_bytes > self.max_bytes or len(self._trees) > self.max_trees):
+            _, cached = self._trees.popitem(last=False)
+            self.cached_bytes -= cached[2]
+            self.evictions += 1
+
+    def invalidate(self, full_path: str):
+        with self._lock:
+            self._remove(os.path.normpath(full_path))
+
+    def clear(self):
+        with self._lock:
+            self._trees.clear()
+            self.cached_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"trees": len(self._trees),
+                    "bytes": self.cached_bytes,
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions}